@@ -87,6 +87,15 @@ def create_app(config_name=None):
             response.headers['Cache-Control'] = 'no-cache'
             return response
         
+        # Push-Outbox-Worker pro Prozess beim ersten Request starten: gunicorn --preload
+        # forkt nach create_app, Threads aus dem Master überleben den Fork nicht.
+        # So laufen liegengebliebene Retries/SENDING-Zeilen nach Deploy/Restart sofort weiter.
+        @app.before_request
+        def start_push_outbox_worker():
+            if app.config.get('PUSH_OUTBOX_INPROCESS_WORKER'):
+                from backend.services.push_outbox import PushOutboxService
+                PushOutboxService.start_worker_thread(app)
+
         # Add UTF-8 header to HTML responses only
         @app.after_request
         def after_request(response):
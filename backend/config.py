@@ -60,6 +60,10 @@ class Config:
     
     # Redis (optional - für Flask-Limiter storage)
     REDIS_URL = os.environ.get('REDIS_URL')
+
+    # Öffentliche Hitlist/Landing-Index: frisch bis FRESH, danach stale-while-revalidate bis MAX_STALE
+    PUBLIC_HITLIST_FRESH_SECONDS = int(os.environ.get('PUBLIC_HITLIST_FRESH_SECONDS', '300'))
+    PUBLIC_HITLIST_MAX_STALE_SECONDS = int(os.environ.get('PUBLIC_HITLIST_MAX_STALE_SECONDS', '86400'))
     
     # CSP settings
     SECURITY_CSP = os.environ.get('SECURITY_CSP', 
@@ -113,6 +117,18 @@ class Config:
     # Lokal: generiere mit `python scripts/generate_vapid_keys.py`
     VAPID_PRIVATE_KEY = os.environ.get('VAPID_PRIVATE_KEY')
     VAPID_PUBLIC_KEY = os.environ.get('VAPID_PUBLIC_KEY')
+    # Push-Outbox: Handler reihen nur ein, ein Worker versendet.
+    # In-Process-Thread im Web-Prozess; aus, wenn ein eigener Service
+    # (SERVICE_TYPE=push-worker) die Outbox abarbeitet.
+    PUSH_OUTBOX_INPROCESS_WORKER = os.environ.get('PUSH_OUTBOX_INPROCESS_WORKER', 'true').lower() in ('1', 'true', 'yes')
+    PUSH_OUTBOX_BATCH_SIZE = int(os.environ.get('PUSH_OUTBOX_BATCH_SIZE', '100'))
+    PUSH_OUTBOX_MAX_ATTEMPTS = int(os.environ.get('PUSH_OUTBOX_MAX_ATTEMPTS', '5'))
+    PUSH_OUTBOX_POLL_SECONDS = int(os.environ.get('PUSH_OUTBOX_POLL_SECONDS', '15'))
+    # Push-Metriken (Latenz/Statuscodes pro Push-Service) höchstens so oft in
+    # push_delivery_stats schreiben; Endpoints nach so vielen endgültigen
+    # Fehlschlägen in Folge deaktivieren.
+    PUSH_METRICS_FLUSH_SECONDS = int(os.environ.get('PUSH_METRICS_FLUSH_SECONDS', '60'))
+    PUSH_MAX_CONSECUTIVE_FAILURES = int(os.environ.get('PUSH_MAX_CONSECUTIVE_FAILURES', '3'))
 
     # Google Shared Drive (Drive-Capability, Phase 03)
     # Service-Account-Key als Base64-encoded JSON; nie ins Repo, nur als Secret.
@@ -123,6 +139,10 @@ class Config:
     DRIVE_FEATURE_ENABLED = os.environ.get('DRIVE_FEATURE_ENABLED', 'false').lower() in ('1', 'true', 'yes')
     # Archiv-Ordner im Shared Drive (Drive-File-ID des /Archiv/-Folders).
     DRIVE_ARCHIVE_FOLDER_ID = os.environ.get('DRIVE_ARCHIVE_FOLDER_ID', '').strip() or None
+    # Lokaler Ordner-Baum (drive_folders): Eintraege aelter als TTL neu aus Drive laden
+    DRIVE_FOLDER_TREE_TTL_SECONDS = int(os.environ.get('DRIVE_FOLDER_TREE_TTL_SECONDS', '3600'))
+    # Ordner-Listings pro Worker im Speicher; Schreibaktionen invalidieren gezielt, 0 = aus
+    DRIVE_FOLDER_LISTING_TTL_SECONDS = int(os.environ.get('DRIVE_FOLDER_LISTING_TTL_SECONDS', '120'))
     
     # Warnung wenn Keys nicht gesetzt sind
     if not VAPID_PRIVATE_KEY or not VAPID_PUBLIC_KEY:
@@ -167,6 +187,8 @@ class TestingConfig(Config):
     }
     WTF_CSRF_ENABLED = False
     RATELIMIT_ENABLED = False
+    # Tests stellen die Outbox explizit zu (PushOutboxService.drain)
+    PUSH_OUTBOX_INPROCESS_WORKER = False
 
 config = {
     'development': DevelopmentConfig,
@@ -1,4 +1,4 @@
 # Models package for Gourmen webapp
 
 # Import all models to ensure they are registered with SQLAlchemy
-from . import member, member_sensitive, member_mfa, mfa_backup_code, event, participation, document, audit_event, rating, push_subscription, merch_article, merch_variant, merch_order, merch_order_item, auth_token
\ No newline at end of file
+from . import member, member_sensitive, member_mfa, mfa_backup_code, event, participation, document, audit_event, rating, push_subscription, merch_article, merch_variant, merch_order, merch_order_item, auth_token, ggl_season_standing, drive_folder, drive_sync_state, document_upload, document_search_entry, push_outbox, push_delivery_stat
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""DocumentSearchEntry model – lokaler Suchindex ueber die Dateien im Shared Drive."""
+
+from datetime import datetime
+
+from sqlalchemy import DDL, event
+
+from backend.extensions import db
+
+
+class DocumentSearchEntry(db.Model):
+    """Eine Drive-Datei im Suchindex: Name, Ordner-Pfad, extrahierter Text.
+
+    DriveStorageService pflegt die Zeilen bei Upload, Rename/Move/Delete,
+    Auto-Sync und Re-Sync. Volltext laeuft ueber FTS5 (SQLite, Tabelle
+    `document_search_fts` + Trigger) bzw. einen GIN-Index auf
+    `to_tsvector('simple', ...)` (Postgres).
+    """
+
+    __tablename__ = "document_search_entries"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    drive_file_id = db.Column(db.String(100), unique=True, nullable=False, index=True)
+    name = db.Column(db.String(255), nullable=False, default="")
+    mime_type = db.Column(db.String(255), nullable=True)
+    web_view_link = db.Column(db.String(500), nullable=True)
+    parent_id = db.Column(db.String(100), nullable=True, index=True)
+    # Anzeige-Pfad ("Archiv / 2023 / Belege") fuer die Volltextsuche
+    folder_path = db.Column(db.Text, nullable=False, default="")
+    # Ordner-IDs ab Drive-Wurzel als "/archiv/2023/belege/" (Scope-Filter per LIKE)
+    folder_ids = db.Column(db.Text, nullable=False, default="")
+    # Extrahierter Text (nur bei Uploads mit lesbarem Inhalt), gekappt
+    body_text = db.Column(db.Text, nullable=False, default="")
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<DocumentSearchEntry {self.drive_file_id}: {self.name}>"
+
+
+# Volltext-Strukturen, die `db.create_all()` nicht kennt (Migration legt sie ebenso an)
+SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS document_search_fts USING fts5("
+    "name, folder_path, body_text, content='document_search_entries', "
+    "content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS document_search_entries_ai "
+    "AFTER INSERT ON document_search_entries BEGIN "
+    "INSERT INTO document_search_fts(rowid, name, folder_path, body_text) "
+    "VALUES (new.id, new.name, new.folder_path, new.body_text); END",
+    "CREATE TRIGGER IF NOT EXISTS document_search_entries_ad "
+    "AFTER DELETE ON document_search_entries BEGIN "
+    "INSERT INTO document_search_fts(document_search_fts, rowid, name, folder_path, body_text) "
+    "VALUES ('delete', old.id, old.name, old.folder_path, old.body_text); END",
+    "CREATE TRIGGER IF NOT EXISTS document_search_entries_au "
+    "AFTER UPDATE ON document_search_entries BEGIN "
+    "INSERT INTO document_search_fts(document_search_fts, rowid, name, folder_path, body_text) "
+    "VALUES ('delete', old.id, old.name, old.folder_path, old.body_text); "
+    "INSERT INTO document_search_fts(rowid, name, folder_path, body_text) "
+    "VALUES (new.id, new.name, new.folder_path, new.body_text); END",
+)
+POSTGRES_TSVECTOR = (
+    "to_tsvector('simple', name || ' ' || folder_path || ' ' || body_text)"
+)
+POSTGRES_FTS_DDL = (
+    "CREATE INDEX IF NOT EXISTS ix_document_search_entries_tsv "
+    f"ON document_search_entries USING gin ({POSTGRES_TSVECTOR})",
+)
+
+_table = DocumentSearchEntry.__table__
+for _statement in SQLITE_FTS_DDL:
+    event.listen(_table, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    _table,
+    "after_drop",
+    DDL("DROP TABLE IF EXISTS document_search_fts").execute_if(dialect="sqlite"),
+)
+for _statement in POSTGRES_FTS_DDL:
+    event.listen(_table, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
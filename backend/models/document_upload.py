@@ -0,0 +1,42 @@
+"""DocumentUpload model – laufender Chunk-Upload in eine Drive-Resumable-Session."""
+
+from datetime import datetime
+
+from backend.extensions import db
+
+
+class DocumentUpload(db.Model):
+    """Zustand eines Chunk-Uploads (`/docs/upload/session`).
+
+    Validierung, Zielordner und Filename werden beim Start festgelegt; die
+    Chunks gehen direkt an die Drive-Session (`session_uri`). Nach dem letzten
+    Chunk entsteht das Document und die Zeile wird geloescht. Drive verwirft
+    unvollendete Sessions nach einer Woche, aeltere Zeilen werden aufgeraeumt.
+    """
+
+    __tablename__ = "document_uploads"
+
+    id = db.Column(db.Integer, primary_key=True)
+    token = db.Column(db.String(64), unique=True, nullable=False, index=True)
+
+    uploader_id = db.Column(
+        db.Integer, db.ForeignKey("members.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    event_id = db.Column(
+        db.Integer, db.ForeignKey("events.id", ondelete="SET NULL"), nullable=True
+    )
+
+    session_uri = db.Column(db.Text, nullable=False)
+    drive_folder_id = db.Column(db.String(100), nullable=False)
+    drive_filename = db.Column(db.String(255), nullable=False)
+    mime_type = db.Column(db.String(255), nullable=False)
+    size_bytes = db.Column(db.BigInteger, nullable=False)
+    received_bytes = db.Column(db.BigInteger, nullable=False, default=0)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+
+    def __repr__(self):
+        return f"<DocumentUpload {self.token}: {self.received_bytes}/{self.size_bytes}>"
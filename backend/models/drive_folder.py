@@ -0,0 +1,29 @@
+"""DriveFolder model – lokaler Spiegel des Ordner-Baums im Shared Drive."""
+
+from datetime import datetime
+
+from backend.extensions import db
+
+
+class DriveFolder(db.Model):
+    """Ein Drive-Ordner mit Name und Parent (nur Ordner, keine Dateien).
+
+    Drive bleibt Source of Truth. DriveStorageService schreibt die Zeilen
+    bei Listing, Ordner-Validierung und Admin-Re-Sync; Eintraege aelter als
+    DRIVE_FOLDER_TREE_TTL_SECONDS werden beim naechsten Zugriff aus Drive
+    nachgeladen. Breadcrumbs und Archiv-Pruefungen laufen damit lokal.
+    """
+
+    __tablename__ = "drive_folders"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    drive_folder_id = db.Column(db.String(100), unique=True, nullable=False, index=True)
+    name = db.Column(db.String(255), nullable=False)
+    # None = direkt unter der Shared-Drive-Wurzel bzw. ohne Parent
+    parent_id = db.Column(db.String(100), nullable=True, index=True)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<DriveFolder {self.drive_folder_id}: {self.name}>"
@@ -0,0 +1,31 @@
+"""DriveSyncState model – Stand des inkrementellen Drive-Syncs (Changes API)."""
+
+from datetime import datetime
+
+from backend.extensions import db
+
+
+class DriveSyncState(db.Model):
+    """Eine Zeile pro Shared Drive mit dem naechsten Changes-`pageToken`.
+
+    `start_page_token` wird vom Admin-Re-Sync (voll) gesetzt und von jedem
+    inkrementellen Lauf auf `newStartPageToken` weitergeschoben. Fehlt der
+    Token oder lehnt Drive ihn ab, faellt der Sync auf den Voll-Re-Sync zurueck.
+    """
+
+    __tablename__ = "drive_sync_state"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    drive_id = db.Column(db.String(100), unique=True, nullable=False, index=True)
+    start_page_token = db.Column(db.String(255), nullable=True)
+
+    last_incremental_sync_at = db.Column(db.DateTime, nullable=True)
+    last_full_resync_at = db.Column(db.DateTime, nullable=True)
+
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+
+    def __repr__(self):
+        return f"<DriveSyncState {self.drive_id}: {self.start_page_token}>"
@@ -0,0 +1,34 @@
+from datetime import datetime
+from backend.extensions import db
+
+class GGLSeasonStanding(db.Model):
+    """Materialisierte GGL-Saisontabelle: eine Zeile pro Mitglied und Saison.
+
+    Wird von GGLService.refresh_season_standings geschrieben (nach jeder
+    Punkte-/BillBro-Änderung einer Saison). Mitglieder ohne Schätzung in
+    der Saison haben keine Zeile (= 0 Punkte).
+    """
+    __tablename__ = 'ggl_season_standings'
+
+    id = db.Column(db.Integer, primary_key=True)
+    member_id = db.Column(db.Integer, db.ForeignKey('members.id', ondelete='CASCADE'),
+                          nullable=False, index=True)
+    season = db.Column(db.Integer, nullable=False, index=True)
+
+    # Punkte können bei geteilten Rängen halbzahlig sein (Fractional Ranking)
+    total_points = db.Column(db.Float, nullable=False, default=0)
+    avg_points = db.Column(db.Float, nullable=False, default=0)
+    avg_diff_rappen = db.Column(db.Float, nullable=False, default=0)
+    events_ranked = db.Column(db.Integer, nullable=False, default=0)
+    guesses_count = db.Column(db.Integer, nullable=False, default=0)  # Schätzungen inkl. ohne Punkte
+    rank = db.Column(db.Integer)  # Rang zum Zeitpunkt des Refresh
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('member_id', 'season', name='uq_ggl_standing_member_season'),
+        db.Index('ix_ggl_season_standings_season_rank', 'season', 'rank'),
+    )
+
+    def __repr__(self):
+        return f'<GGLSeasonStanding {self.member_id} in {self.season}: {self.total_points}>'
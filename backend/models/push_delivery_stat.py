@@ -0,0 +1,30 @@
+"""PushDeliveryStat model – aggregierte Push-Zustellmetriken pro Push-Service-Origin."""
+
+from backend.extensions import db
+
+
+class PushDeliveryStat(db.Model):
+    """Zusammenfassung aller Pushes an einen Push-Service in einem Zeitfenster.
+
+    `PushMetrics` sammelt pro Prozess im Speicher (Zähler, Latenz-Histogramm,
+    Statuscodes) und schreibt periodisch eine Zeile pro Origin. Perzentile
+    entstehen beim Auslesen aus den zusammengeführten Histogrammen.
+    """
+
+    __tablename__ = 'push_delivery_stats'
+
+    id = db.Column(db.Integer, primary_key=True)
+    origin = db.Column(db.String(255), nullable=False, index=True)
+    period_start = db.Column(db.DateTime, nullable=False)
+    period_end = db.Column(db.DateTime, nullable=False, index=True)
+
+    send_count = db.Column(db.Integer, nullable=False, default=0)
+    error_count = db.Column(db.Integer, nullable=False, default=0)
+    latency_sum_ms = db.Column(db.Float, nullable=False, default=0.0)
+    # Anzahl Sends pro Latenz-Bucket (Grenzen: push_metrics.LATENCY_BUCKETS_MS + Überlauf)
+    latency_buckets = db.Column(db.JSON, nullable=False)
+    # {"201": 12, "410": 1, "none": 2} – "none" = Netzwerkfehler ohne Antwort
+    status_counts = db.Column(db.JSON, nullable=False)
+
+    def __repr__(self):
+        return f'<PushDeliveryStat {self.origin} {self.period_end}: {self.send_count}/{self.error_count}>'
@@ -0,0 +1,54 @@
+"""PushOutboxMessage model – dauerhafte Warteschlange für Web-Push-Nachrichten."""
+
+from datetime import datetime
+from enum import Enum
+
+from backend.extensions import db
+
+
+class PushOutboxStatus(Enum):
+    PENDING = 'PENDING'    # wartet auf (erneuten) Versand ab `next_attempt_at`
+    SENDING = 'SENDING'    # von einem Worker beansprucht
+    SENT = 'SENT'          # vom Push-Service angenommen
+    EXPIRED = 'EXPIRED'    # Subscription weg (404/410 oder inaktiv) – deaktiviert
+    FAILED = 'FAILED'      # endgültig fehlgeschlagen (Client-Fehler oder Retries aufgebraucht)
+
+
+class PushOutboxMessage(db.Model):
+    """Ein Push an genau eine Subscription.
+
+    Request-Handler und Cron reihen nur ein (`PushOutboxService.enqueue`); der
+    Delivery-Worker holt fällige Zeilen batchweise, versendet parallel und
+    schreibt das Ergebnis zurück. Transiente Fehler (Netzwerk, 429, 5xx)
+    werden mit Backoff erneut versucht.
+    """
+
+    __tablename__ = 'push_outbox'
+    __table_args__ = (
+        db.Index('ix_push_outbox_status_next_attempt_at', 'status', 'next_attempt_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    subscription_id = db.Column(
+        db.Integer, db.ForeignKey('push_subscriptions.id', ondelete='CASCADE'),
+        nullable=False, index=True
+    )
+
+    # Payload-Typ (`data.type`, z.B. "event_participation_reminder") für Auswertungen
+    kind = db.Column(db.String(50), nullable=True)
+    payload = db.Column(db.JSON, nullable=False)
+
+    status = db.Column(db.Enum(PushOutboxStatus), default=PushOutboxStatus.PENDING, nullable=False)
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    next_attempt_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    locked_at = db.Column(db.DateTime, nullable=True)
+    last_status_code = db.Column(db.Integer, nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    sent_at = db.Column(db.DateTime, nullable=True)
+
+    subscription = db.relationship('PushSubscription')
+
+    def __repr__(self):
+        return f'<PushOutboxMessage {self.id}: {self.status.value} ({self.attempts})>'
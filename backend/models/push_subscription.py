@@ -4,6 +4,7 @@ Speichert Push-Subscriptions der Mitglieder für echte Push-Benachrichtigungen
 """
 
 from datetime import datetime
+from sqlalchemy import update
 from backend.extensions import db
 
 class PushSubscription(db.Model):
@@ -24,6 +25,9 @@ class PushSubscription(db.Model):
     
     # Subscription status
     is_active = db.Column(db.Boolean, default=True, nullable=False)
+    # Endgültige Fehlversuche in Folge; ab PUSH_MAX_CONSECUTIVE_FAILURES deaktiviert
+    consecutive_failures = db.Column(db.Integer, default=0, nullable=False)
+    last_failure_at = db.Column(db.DateTime)
     
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
@@ -51,3 +55,56 @@ class PushSubscription(db.Model):
         """Mark subscription as used (update last_used_at)"""
         self.last_used_at = datetime.utcnow()
         db.session.commit()
+    
+    @classmethod
+    def mark_many_used(cls, subscription_ids, used_at=None):
+        """`last_used_at` setzen und Fehlerserie zurücksetzen, in einem UPDATE (ohne Commit)"""
+        ids = list(subscription_ids)
+        if ids:
+            db.session.execute(
+                update(cls)
+                .where(cls.id.in_(ids))
+                .values(last_used_at=used_at or datetime.utcnow(), consecutive_failures=0)
+                .execution_options(synchronize_session=False)
+            )
+    
+    @classmethod
+    def deactivate_many(cls, subscription_ids):
+        """Viele Subscriptions in einem UPDATE deaktivieren, z.B. nach 404/410 (ohne Commit)"""
+        ids = list(subscription_ids)
+        if ids:
+            db.session.execute(
+                update(cls)
+                .where(cls.id.in_(ids))
+                .values(is_active=False, updated_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+    
+    @classmethod
+    def record_failures(cls, subscription_ids, max_consecutive_failures):
+        """
+        Fehlerserie für viele Subscriptions hochzählen und Endpoints ab
+        `max_consecutive_failures` Fehlern in Folge deaktivieren – zwei UPDATEs (ohne Commit).
+        Gibt die Anzahl dabei deaktivierter Subscriptions zurück.
+        """
+        ids = list(subscription_ids)
+        if not ids:
+            return 0
+        now = datetime.utcnow()
+        db.session.execute(
+            update(cls)
+            .where(cls.id.in_(ids))
+            .values(consecutive_failures=cls.consecutive_failures + 1, last_failure_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        result = db.session.execute(
+            update(cls)
+            .where(
+                cls.id.in_(ids),
+                cls.is_active == True,
+                cls.consecutive_failures >= max_consecutive_failures
+            )
+            .values(is_active=False, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0
@@ -528,6 +528,11 @@ def edit_member(member_id):
         member.is_active = form.is_active.data
         
         db.session.commit()
+        # Beitrittsdatum bestimmt die Bereinigungs-Kandidaten, Aktiv-Status die GGL-Ränge aller
+        from backend.services.retro_cleanup import RetroCleanupService
+        from backend.services.dashboard_snapshot import DashboardSnapshotService
+        RetroCleanupService.invalidate_member(member.id)
+        DashboardSnapshotService.invalidate_all()
         
         SecurityService.log_audit_event(
             AuditAction.ADMIN_EDIT_MEMBER, 'member', member.id
@@ -682,6 +687,10 @@ def create_event():
         db.session.add(organizer_participation)
         
         db.session.commit()
+        from backend.services.retro_cleanup import RetroCleanupService
+        from backend.services.dashboard_snapshot import DashboardSnapshotService
+        RetroCleanupService.invalidate_all()
+        DashboardSnapshotService.invalidate_all()
         
         SecurityService.log_audit_event(
             AuditAction.ADMIN_CREATE_EVENT, 'event', event.id
@@ -1116,6 +1125,8 @@ def update_order_status(order_id):
                     order.delivered_at = datetime.utcnow()
                 
                 db.session.commit()
+                from backend.services.dashboard_snapshot import DashboardSnapshotService
+                DashboardSnapshotService.invalidate_member(order.member_id)
                 
                 flash(f'Bestellstatus von {old_status} zu {new_status} geändert', 'success')
             else:
@@ -1153,6 +1164,8 @@ def update_order_status_alt(order_id):
                 order.delivered_at = datetime.utcnow()
             
             db.session.commit()
+            from backend.services.dashboard_snapshot import DashboardSnapshotService
+            DashboardSnapshotService.invalidate_member(order.member_id)
             
             flash(f'Bestellstatus von {old_status} zu {new_status} geändert', 'success')
         else:
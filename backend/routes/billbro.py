@@ -9,6 +9,8 @@ from backend.models.event import Event
 from backend.models.participation import Participation, Esstyp
 from backend.services.money import MoneyService
 from backend.services.ggl_rules import GGLService
+from backend.services.retro_cleanup import RetroCleanupService
+from backend.services.dashboard_snapshot import DashboardSnapshotService
 from backend.services.security import SecurityService, AuditAction
 from backend.services.notifier import NotifierService
 
@@ -166,7 +168,10 @@ def compute(event_id):
             guess_rappen - event.rechnungsbetrag_rappen
         )
     
+    GGLService.refresh_season_standings(event.season)
     db.session.commit()
+    RetroCleanupService.invalidate_member(participation.member_id)
+    DashboardSnapshotService.invalidate_all()
     
     # Log audit event
     SecurityService.log_audit_event(
@@ -238,6 +243,7 @@ def enter_bill(event_id):
     
     # Use GGLService to calculate proper rankings and points
     GGLService.calculate_event_points(event_id)
+    DashboardSnapshotService.invalidate_all()
     
     # Log audit event
     SecurityService.log_audit_event(
@@ -370,7 +376,9 @@ def set_total(event_id):
     # Calculate individual shares based on weights
     calculate_weighted_shares(event, gesamtbetrag_rappen)
     
+    GGLService.refresh_season_standings(event.season)
     db.session.commit()
+    DashboardSnapshotService.invalidate_all()
     
     # Log audit event
     SecurityService.log_audit_event(
@@ -410,7 +418,9 @@ def undo_final(event_id):
     for participation in event.participations:
         participation.calculated_share_rappen = None
 
+    GGLService.refresh_season_standings(event.season)
     db.session.commit()
+    DashboardSnapshotService.invalidate_all()
 
     SecurityService.log_audit_event(
         AuditAction.BILLBRO_SET_TOTAL, 'event', event.id,
@@ -492,7 +502,9 @@ def reset_bill(event_id):
         participation.rank = None
         participation.calculated_share_rappen = None
 
+    GGLService.refresh_season_standings(event.season)
     db.session.commit()
+    DashboardSnapshotService.invalidate_all()
 
     SecurityService.log_audit_event(
         AuditAction.BILLBRO_ENTER_BILL, 'event', event.id,
@@ -615,7 +627,10 @@ def update_guess(event_id):
     participation.rank = None
     participation.responded_at = None
     
+    GGLService.refresh_season_standings(event.season)
     db.session.commit()
+    RetroCleanupService.invalidate_member(participation.member_id)
+    DashboardSnapshotService.invalidate_all()
     
     flash('Schätzung zurückgesetzt - neue Schätzung möglich', 'success')
     return redirect(url_for('events.detail', event_id=event_id, tab='billbro', _anchor='billbro-new-guess'))
@@ -673,7 +688,10 @@ def record_guess(event_id, member_id):
             guess_rappen - event.rechnungsbetrag_rappen
         )
     
+    GGLService.refresh_season_standings(event.season)
     db.session.commit()
+    RetroCleanupService.invalidate_member(participation.member_id)
+    DashboardSnapshotService.invalidate_all()
     
     # Log audit event
     SecurityService.log_audit_event(
@@ -763,7 +781,10 @@ def mark_absent(event_id, member_id):
     participation.calculated_share_rappen = None
     participation.responded_at = None
     
+    GGLService.refresh_season_standings(event.season)
     db.session.commit()
+    RetroCleanupService.invalidate_member(participation.member_id)
+    DashboardSnapshotService.invalidate_all()
     
     # Log audit event
     SecurityService.log_audit_event(
@@ -808,7 +829,10 @@ def mark_present(event_id, member_id):
     # Mark as present
     participation.teilnahme = True
     
+    GGLService.refresh_season_standings(event.season)
     db.session.commit()
+    RetroCleanupService.invalidate_member(participation.member_id)
+    DashboardSnapshotService.invalidate_all()
     
     # Log audit event
     SecurityService.log_audit_event(
@@ -4,6 +4,7 @@ Einfache HTTP-Endpunkte für automatische Aufgaben
 """
 
 from flask import Blueprint, request, jsonify, current_app
+from flask_login import current_user
 from backend.services.cron_service import CronService
 from backend.extensions import csrf
 import logging
@@ -129,6 +130,31 @@ def cron_rating_reminders():
         logger.error(f"Error in cron rating reminders: {e}")
         return jsonify({'error': str(e)}), 500
 
+@bp.route('/cron/push-metrics', methods=['GET'])
+@csrf.exempt
+def cron_push_metrics():
+    """
+    Push-Zustellmetriken als JSON: p50/p95-Latenz und Fehlerquote pro Push-Service
+    Zugriff mit Cron-Token oder als eingeloggter Admin; Zeitfenster über ?hours= (Default 24)
+    """
+    try:
+        is_admin = current_user.is_authenticated and current_user.is_admin()
+        if not is_admin and not _is_authorized_cron_request():
+            logger.warning(f"Unauthorized push metrics request from {request.remote_addr}")
+            return jsonify({'error': 'Unauthorized'}), 401
+
+        hours = request.args.get('hours', 24, type=int)
+        result = CronService.get_push_metrics(hours=max(1, min(hours, 24 * 30)))
+
+        if result['success']:
+            return jsonify(result)
+        else:
+            return jsonify(result), 500
+
+    except Exception as e:
+        logger.error(f"Error getting push metrics: {e}")
+        return jsonify({'error': str(e)}), 500
+
 @bp.route('/cron/test', methods=['POST'])
 @csrf.exempt
 def cron_test():
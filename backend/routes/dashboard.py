@@ -1,12 +1,7 @@
 from flask import Blueprint, render_template
 from flask_login import login_required, current_user
-from backend.models.event import Event
-from backend.models.participation import Participation
-from backend.models.merch_order import MerchOrder, OrderStatus
-from backend.services.ggl_rules import GGLService
-from backend.services.retro_cleanup import RetroCleanupService
+from backend.services.dashboard_snapshot import DashboardSnapshotService
 from backend.routes.events import hamburg2026_is_visible
-from datetime import datetime, timedelta
 
 bp = Blueprint('dashboard', __name__)
 
@@ -14,89 +9,13 @@ bp = Blueprint('dashboard', __name__)
 @login_required
 def index():
     """Dashboard main page"""
-    # Get next upcoming event
-    # An event is "upcoming" until the day AFTER the event date
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    next_event = Event.query.filter(
-        Event.datum >= today,
-        Event.published == True
-    ).order_by(Event.datum.asc()).first()
-    
-    # Get current season GGL stats for user
-    current_season = GGLService.get_current_season()
-    ggl_stats = GGLService.get_member_season_stats(current_user.id, current_season)
-    season_ranking = GGLService.get_season_ranking(current_season)
-    rank_total = len(season_ranking)
-
-    if ggl_stats:
-        user_rank = None
-        for i, member_stats in enumerate(season_ranking):
-            if member_stats['member_id'] == current_user.id:
-                user_rank = i + 1
-                break
-
-        ggl_stats['rank'] = user_rank
-        ggl_stats['points'] = ggl_stats['total_points']
-        ggl_stats['rank_total'] = rank_total
-    else:
-        ggl_stats = {
-            'season': current_season,
-            'total_points': 0,
-            'participation_count': 0,
-            'total_events_in_season': 0,
-            'rank': None,
-            'points': 0,
-            'rank_total': rank_total,
-        }
-    
-    # Get latest event with bill for current user
-    latest_bill_event = Event.query.join(Participation).filter(
-        Participation.member_id == current_user.id,
-        Participation.calculated_share_rappen.isnot(None),
-        Participation.calculated_share_rappen > 0
-    ).order_by(Event.datum.desc()).first()
-    
-    # Get participation details for the latest bill event
-    latest_bill_participation = None
-    if latest_bill_event:
-        latest_bill_participation = Participation.query.filter_by(
-            member_id=current_user.id,
-            event_id=latest_bill_event.id
-        ).first()
-
-    rsvp_prompt_event = RetroCleanupService.get_upcoming_rsvp_prompt_event(current_user.id)
-    today_billbro_event = RetroCleanupService.get_today_billbro_prompt_event(current_user.id)
-    restaurant_due_event = Event.query.filter(
-        Event.organisator_id == current_user.id,
-        Event.published == True,
-        Event.datum >= today,
-        Event.datum <= (today + timedelta(days=30)),
-        ((Event.restaurant.is_(None)) | (Event.restaurant == ''))
-    ).order_by(Event.datum.asc()).first()
-
-    merch_orders = (
-        MerchOrder.query.filter_by(member_id=current_user.id)
-        .order_by(MerchOrder.created_at.desc())
-        .all()
-    )
-    merch_last_order = merch_orders[0] if merch_orders else None
-    merch_open_count = sum(
-        1 for o in merch_orders if o.status in (OrderStatus.BESTELLT, OrderStatus.WIRD_GELIEFERT)
-    )
+    # GGL-Rang, Prompts, letzte Rechnung und Merch kommen aus dem Snapshot pro Mitglied
+    # (invalidiert bei Teilnahme-, BillBro-, Bewertungs- und Merch-Änderungen).
+    snapshot = DashboardSnapshotService.get_snapshot(current_user.id)
+    context = DashboardSnapshotService.hydrate(snapshot)
 
     return render_template(
         'dashboard/index.html',
-        next_event=next_event,
-        ggl_stats=ggl_stats,
-        current_season=current_season,
-        latest_bill_event=latest_bill_event,
-        latest_bill_participation=latest_bill_participation,
-        rsvp_prompt_event=rsvp_prompt_event,
-        today_billbro_event=today_billbro_event,
-        restaurant_due_event=restaurant_due_event,
-        merch_last_order=merch_last_order,
-        merch_open_count=merch_open_count,
         hamburg2026_visible=hamburg2026_is_visible(),
+        **context,
     )
-
- 
\ No newline at end of file
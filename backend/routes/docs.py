@@ -11,9 +11,13 @@ Pfade:
 from __future__ import annotations
 
 import io
+import re
+import unicodedata
+from urllib.parse import quote
 
 from flask import (
     Blueprint,
+    Response,
     abort,
     current_app,
     flash,
@@ -21,8 +25,8 @@ from flask import (
     redirect,
     render_template,
     request,
+    stream_with_context,
     url_for,
-    send_file,
 )
 from flask_login import current_user, login_required
 from flask_wtf.csrf import validate_csrf
@@ -31,6 +35,7 @@ from wtforms.validators import ValidationError
 from backend.extensions import db
 from backend.models.audit_event import AuditEvent
 from backend.models.document import Document
+from backend.models.document_upload import DocumentUpload
 from backend.models.event import Event
 from backend.services.drive_storage import (
     ALLOWED_MIME_TYPES,
@@ -38,8 +43,10 @@ from backend.services.drive_storage import (
     DriveNotConfiguredError,
     DriveQuotaExceededError,
     DriveStorageService,
+    DriveUploadOffsetError,
     DriveValidationError,
     MAX_FILE_SIZE_BYTES,
+    UPLOAD_CHUNK_BYTES,
 )
 
 bp = Blueprint("docs", __name__)
@@ -83,16 +90,18 @@ def index():
     q = (request.args.get("q") or "").strip()
     root_id = DriveStorageService.get_root_id()
 
-    search_hits = []
+    search_page = None
     if len(q) >= 2:
         try:
-            search_hits = DriveStorageService.search_files(q)
+            search_page = DriveStorageService.search_files(
+                q, page=request.args.get("page", 1, type=int)
+            )
         except DriveError as exc:
             current_app.logger.warning("Drive-Suche fehlgeschlagen: %s", exc)
             flash("Suche konnte gerade nicht ausgeführt werden.", "warning")
 
     top_level = []
-    if not search_hits and not q:
+    if not q:
         try:
             listing = DriveStorageService.list_folder(root_id)
             top_level = listing.subfolders
@@ -105,7 +114,8 @@ def index():
         root_folder_id=root_id,
         top_level_folders=top_level,
         search_query=q,
-        search_hits=search_hits,
+        search_hits=search_page.hits if search_page else [],
+        search_page=search_page,
         archive_folder_id=(current_app.config.get("DRIVE_ARCHIVE_FOLDER_ID") or "").strip(),
         max_file_size_mb=MAX_FILE_SIZE_BYTES // (1024 * 1024),
         allowed_mime_types=sorted(ALLOWED_MIME_TYPES),
@@ -118,10 +128,14 @@ def index():
 def folder_view(drive_folder_id: str):
     _require_feature()
     q = (request.args.get("q") or "").strip()
-    scope_hits = []
+    search_page = None
     if len(q) >= 2:
         try:
-            scope_hits = DriveStorageService.search_files(q, scope_folder_id=drive_folder_id)
+            search_page = DriveStorageService.search_files(
+                q,
+                scope_folder_id=drive_folder_id,
+                page=request.args.get("page", 1, type=int),
+            )
         except DriveError as exc:
             current_app.logger.warning("Drive-Suche Ordner fehlgeschlagen: %s", exc)
             flash("Suche konnte gerade nicht ausgeführt werden.", "warning")
@@ -155,7 +169,8 @@ def folder_view(drive_folder_id: str):
         listing=listing,
         breadcrumbs=crumbs,
         search_query=q,
-        search_hits=scope_hits,
+        search_hits=search_page.hits if search_page else [],
+        search_page=search_page,
         archive_folder_id=archive_cfg,
         folder_drive_link=folder_drive_link,
         max_file_size_mb=MAX_FILE_SIZE_BYTES // (1024 * 1024),
@@ -238,16 +253,25 @@ def api_root():
 @bp.route("/api/folder/<drive_folder_id>/children", methods=["GET"])
 @login_required
 def api_folder_children(drive_folder_id: str):
+    """ETag nur aus den Unterordnern (mehr enthaelt die Antwort nicht); 304 bei If-None-Match (Folder-Picker im PWA)."""
     _require_feature()
     try:
-        subs = DriveStorageService.list_subfolders_only(drive_folder_id)
+        listing = DriveStorageService.list_folder(drive_folder_id)
     except DriveError as exc:
         return jsonify({"error": str(exc)}), 400
-    return jsonify(
-        {
-            "folders": [{"id": f.id, "name": f.name} for f in subs],
-        }
-    )
+    etag = listing.subfolders_etag
+    inm = (request.headers.get("If-None-Match") or "").strip()
+    if inm and inm == etag:
+        resp = Response(status=304)
+    else:
+        resp = jsonify(
+            {
+                "folders": [{"id": f.id, "name": f.name} for f in listing.subfolders],
+            }
+        )
+    resp.headers["Cache-Control"] = "private, no-cache"
+    resp.headers["ETag"] = etag
+    return resp
 
 
 # ---------------------------------------------------------------------------
@@ -306,6 +330,98 @@ def upload():
     return redirect(url_for("docs.folder_view", drive_folder_id=folder_raw))
 
 
+@bp.route("/upload/session", methods=["POST"])
+@login_required
+def upload_session_start():
+    """Chunk-Upload starten: Validierung + Drive-Resumable-Session (JSON)."""
+    _require_feature()
+    _validate_csrf_or_403()
+
+    data = request.get_json(silent=True) or request.form
+    original_filename = (data.get("filename") or "").strip()
+    folder_raw = (data.get("drive_folder_id") or "").strip()
+    if not original_filename or not folder_raw:
+        return jsonify(error="Datei und Zielordner sind erforderlich."), 400
+    title = (data.get("title") or "").strip() or original_filename.rsplit(".", 1)[0]
+    event_raw = str(data.get("event_id") or "").strip()
+    try:
+        size_bytes = int(data.get("size") or 0)
+    except (TypeError, ValueError):
+        size_bytes = 0
+
+    try:
+        upload = DriveStorageService.start_chunked_upload(
+            filename_stem=title,
+            drive_folder_id=folder_raw,
+            uploader=current_user,
+            size_bytes=size_bytes,
+            mime_type=(data.get("mime_type") or "").strip() or None,
+            original_filename=original_filename,
+            event_id=int(event_raw) if event_raw.isdigit() else None,
+        )
+    except (DriveValidationError, DriveQuotaExceededError) as exc:
+        return jsonify(error=str(exc)), 400
+    except DriveError as exc:
+        current_app.logger.error("Drive-Upload-Session fehlgeschlagen: %s", exc, exc_info=True)
+        return jsonify(error="Drive-Upload fehlgeschlagen. Bitte später erneut versuchen."), 502
+
+    return jsonify(
+        token=upload.token,
+        chunk_bytes=UPLOAD_CHUNK_BYTES,
+        received=0,
+        size=upload.size_bytes,
+    ), 201
+
+
+@bp.route("/upload/session/<token>", methods=["GET", "PUT"])
+@login_required
+def upload_session_chunk(token: str):
+    """PUT: einen Chunk weiterreichen (`Content-Range: bytes a-b/total`).
+    GET: bestaetigten Stand bei Drive abfragen, um nach Abbruch weiterzumachen.
+    """
+    _require_feature()
+    upload = DocumentUpload.query.filter_by(
+        token=token, uploader_id=current_user.id
+    ).first_or_404()
+    folder_id = upload.drive_folder_id
+    filename = upload.drive_filename
+
+    try:
+        if request.method == "GET":
+            document = DriveStorageService.sync_chunked_upload(upload)
+        else:
+            _validate_csrf_or_403()
+            first_byte = _content_range_start(request.headers.get("Content-Range"))
+            if first_byte is None:
+                return jsonify(error="Content-Range fehlt oder ist ungültig."), 400
+            if (request.content_length or 0) > UPLOAD_CHUNK_BYTES:
+                return jsonify(error="Chunk ist zu gross."), 413
+            document = DriveStorageService.upload_chunk(
+                upload, first_byte, request.get_data(cache=False)
+            )
+    except DriveUploadOffsetError as exc:
+        return jsonify(received=exc.received_bytes), 409
+    except (DriveValidationError, DriveQuotaExceededError) as exc:
+        return jsonify(error=str(exc)), 400
+    except DriveError as exc:
+        current_app.logger.error("Drive-Chunk-Upload fehlgeschlagen: %s", exc, exc_info=True)
+        return jsonify(error=str(exc)), 502
+
+    if document is None:
+        return jsonify(done=False, received=upload.received_bytes)
+    flash(f"«{filename}» wurde hochgeladen.", "success")
+    return jsonify(
+        done=True,
+        document_id=document.id,
+        redirect=url_for("docs.folder_view", drive_folder_id=folder_id),
+    )
+
+
+def _content_range_start(header: str | None) -> int | None:
+    match = re.fullmatch(r"bytes (\d+)-(\d+)/(\d+)", (header or "").strip())
+    return int(match.group(1)) if match else None
+
+
 def _redirect_docs_fallback():
     return url_for("docs.index")
 
@@ -462,10 +578,11 @@ def hard_delete(doc_id: int):
 @bp.route("/file/<int:doc_id>/download")
 @login_required
 def download(doc_id: int):
+    """Streamt die Datei aus Drive (Speicher begrenzt auf einen Chunk, HTTP-Range)."""
     _require_feature()
     document = Document.query.get_or_404(doc_id)
     try:
-        payload, mime, fname = DriveStorageService.download_document(document)
+        dl = DriveStorageService.prepare_download(document)
     except DriveError as exc:
         current_app.logger.error(
             "Drive-Download fehlgeschlagen: %s", exc, exc_info=True
@@ -473,12 +590,64 @@ def download(doc_id: int):
         flash("Download fehlgeschlagen. Bitte später erneut versuchen.", "error")
         return redirect(url_for("docs.detail", doc_id=doc_id))
 
-    return send_file(
-        io.BytesIO(payload),
-        mimetype=mime,
-        as_attachment=True,
-        download_name=fname,
+    start, stop, status = 0, dl.size, 200
+    byte_range = request.range
+    if byte_range and dl.size is not None and _if_range_matches(dl.etag):
+        bounds = byte_range.range_for_length(dl.size)
+        if bounds is not None:
+            (start, stop), status = bounds, 206
+        elif byte_range.units == "bytes" and len(byte_range.ranges) == 1:
+            # Einzelner Byte-Bereich hinter dem Dateiende
+            resp = Response(status=416)
+            resp.headers["Content-Range"] = f"bytes */{dl.size}"
+            return resp
+        # Mehrere Bereiche oder andere Einheit: Range ignorieren, volle Datei (200)
+
+    chunks = DriveStorageService.iter_download_chunks(dl, start, stop)
+    resp = Response(
+        stream_with_context(_logged_stream(chunks, doc_id)),
+        status=status,
+        mimetype=dl.mime_type,
+        direct_passthrough=True,
     )
+    resp.headers["Accept-Ranges"] = "bytes"
+    if dl.size is not None:
+        resp.headers["Content-Length"] = str(stop - start)
+    if status == 206:
+        resp.headers["Content-Range"] = f"bytes {start}-{stop - 1}/{dl.size}"
+    if dl.etag:
+        resp.set_etag(dl.etag)
+    resp.headers.set("Content-Disposition", "attachment", **_attachment_filename(dl.name))
+    return resp
+
+
+def _if_range_matches(etag: str | None) -> bool:
+    """If-Range: Range nur anwenden, wenn die Datei seither unveraendert ist."""
+    if_range = request.if_range
+    if not if_range or (if_range.etag is None and if_range.date is None):
+        return True
+    return bool(etag) and if_range.etag == etag
+
+
+def _attachment_filename(fname: str) -> dict:
+    """Content-Disposition-Parameter inkl. UTF-8-Variante (wie send_file)."""
+    try:
+        fname.encode("ascii")
+        return {"filename": fname}
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize("NFKD", fname).encode("ascii", "ignore").decode("ascii")
+        return {"filename": simple, "filename*": f"UTF-8''{quote(fname, safe='')}"}
+
+
+def _logged_stream(chunks, doc_id: int):
+    try:
+        yield from chunks
+    except Exception as exc:
+        # Header sind schon gesendet: nur noch loggen, Verbindung bricht ab
+        current_app.logger.error(
+            "Drive-Download-Stream fuer document %s abgebrochen: %s", doc_id, exc, exc_info=True
+        )
+        raise
 
 
 # ---------------------------------------------------------------------------
@@ -493,8 +662,12 @@ def admin_resync():
     _require_admin()
     _validate_csrf_or_403()
 
+    full = request.form.get("mode") == "full"
     try:
-        report = DriveStorageService.admin_full_resync(actor=current_user)
+        if full:
+            report = DriveStorageService.admin_full_resync(actor=current_user)
+        else:
+            report = DriveStorageService.admin_incremental_sync(actor=current_user)
     except DriveError as exc:
         current_app.logger.error("Drive-Resync fehlgeschlagen: %s", exc, exc_info=True)
         flash("Drive-Re-Sync fehlgeschlagen. Bitte Logs prüfen.", "error")
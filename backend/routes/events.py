@@ -17,6 +17,8 @@ from backend.services.places import PlacesService
 from backend.services.notifier import NotifierService
 from backend.services.push_notifications import PushNotificationService
 from backend.services.retro_cleanup import RetroCleanupService
+from backend.services.dashboard_snapshot import DashboardSnapshotService
+from backend.services.ggl_rules import GGLService
 from backend.services.monatsessen_stats import get_monatsessen_statistics
 from backend.forms.rating import EventRatingForm
 
@@ -55,6 +57,14 @@ def _cleanup_rsvp_undo_available() -> bool:
     )
 
 
+def _invalidate_dashboards(member_id: int, standings_changed: bool) -> None:
+    """Nach dem Commit: GGL-Ränge geändert → alle Dashboard-Snapshots, sonst nur den des Mitglieds."""
+    if standings_changed:
+        DashboardSnapshotService.invalidate_all()
+    else:
+        DashboardSnapshotService.invalidate_member(member_id)
+
+
 # Push Notification API Routes
 @bp.route('/api/events/<int:event_id>/participation-stats', methods=['GET'])
 @login_required
@@ -403,6 +413,8 @@ def create_year_planning():
                 db.session.add(event)
             
             db.session.commit()
+            RetroCleanupService.invalidate_all()
+            DashboardSnapshotService.invalidate_all()
             
             flash(f'Jahresplanung {year} erfolgreich erstellt: {len(monthly_events)} Monatsessen geplant', 'success')
         else:
@@ -504,6 +516,8 @@ def cleanup_undo_rsvp():
         if participation:
             db.session.delete(participation)
         db.session.commit()
+        RetroCleanupService.invalidate_member(current_user.id)
+        DashboardSnapshotService.invalidate_member(current_user.id)
     else:
         if not participation:
             flash('Eintrag nicht gefunden — Rückgängig nicht möglich.', 'error')
@@ -513,7 +527,12 @@ def cleanup_undo_rsvp():
             participation.responded_at = datetime.fromisoformat(prev['responded_at'])
         else:
             participation.responded_at = None
+        standings_changed = participation.has_guess
+        if standings_changed:
+            GGLService.refresh_season_standings(participation.event.season)
         db.session.commit()
+        RetroCleanupService.invalidate_member(current_user.id)
+        _invalidate_dashboards(current_user.id, standings_changed)
 
     flash('Die letzte Zu-/Absage wurde rückgängig gemacht.', 'success')
     open_events = RetroCleanupService.list_open_cleanup_events(current_user.id)
@@ -562,7 +581,12 @@ def cleanup_rsvp(event_id):
     participation.teilnahme = (status == 'yes')
     participation.responded_at = datetime.utcnow()
 
+    standings_changed = participation.has_guess
+    if standings_changed:
+        GGLService.refresh_season_standings(event.season)
     db.session.commit()
+    RetroCleanupService.invalidate_member(current_user.id)
+    _invalidate_dashboards(current_user.id, standings_changed)
 
     session[CLEANUP_RSVP_UNDO_SESSION_KEY] = {
         'member_id': current_user.id,
@@ -590,6 +614,8 @@ def enable_event_ratings(event_id):
 
     event.allow_ratings = True
     db.session.commit()
+    RetroCleanupService.invalidate_all()
+    DashboardSnapshotService.invalidate_all()
     flash('Bewertungen für dieses Event wurden zugelassen.', 'success')
     return redirect(url_for('events.detail', event_id=event_id))
 
@@ -605,6 +631,8 @@ def disable_event_ratings(event_id):
 
     event.allow_ratings = False
     db.session.commit()
+    RetroCleanupService.invalidate_all()
+    DashboardSnapshotService.invalidate_all()
     flash('Bewertungen für dieses Event wurden deaktiviert.', 'success')
     return redirect(url_for('events.detail', event_id=event_id))
 
@@ -743,6 +771,7 @@ def edit(event_id):
 
             old_organizer_id = event.organisator_id
             new_organizer_id = form.organisator_id.data
+            old_season = event.season
             
             event.datum = form.datum.data
             event.event_typ = EventType(form.event_typ.data)
@@ -824,9 +853,16 @@ def edit(event_id):
                     )
                     db.session.add(new_organizer_participation)
 
+            # Saisonwechsel oder entfernte Organisator-Teilnahme ändern die GGL-Tabelle
+            if old_season != event.season or old_organizer_id != new_organizer_id:
+                for season_year in {old_season, event.season}:
+                    GGLService.refresh_season_standings(season_year)
+
             after_cal = CalendarFeedService.calendar_relevant_state(event)
             CalendarFeedService.bump_sequence_if_changed(event, before_cal, after_cal)
             db.session.commit()
+            RetroCleanupService.invalidate_all()
+            DashboardSnapshotService.invalidate_all()
             
             # Log organizer change if it happened
             if old_organizer_id != new_organizer_id:
@@ -884,6 +920,7 @@ def delete(event_id):
     
     # Delete all participations for this event
     participations = Participation.query.filter_by(event_id=event_id).all()
+    had_guesses = any(participation.has_guess for participation in participations)
     for participation in participations:
         db.session.delete(participation)
     
@@ -899,8 +936,15 @@ def delete(event_id):
     )
     
     # Delete the event
+    season_year = event.season
     db.session.delete(event)
+    if had_guesses:
+        # Gelöschte Schätzungen aus der Saisontabelle nehmen
+        db.session.flush()
+        GGLService.refresh_season_standings(season_year)
     db.session.commit()
+    RetroCleanupService.invalidate_all()
+    DashboardSnapshotService.invalidate_all()
     
     flash('Event erfolgreich gelöscht', 'success')
     return redirect(url_for('events.index'))
@@ -929,7 +973,12 @@ def rsvp(event_id):
     participation.teilnahme = not participation.teilnahme
     participation.responded_at = datetime.utcnow()
     
+    standings_changed = participation.has_guess
+    if standings_changed:
+        GGLService.refresh_season_standings(event.season)
     db.session.commit()
+    RetroCleanupService.invalidate_member(current_user.id)
+    _invalidate_dashboards(current_user.id, standings_changed)
     
     # Log audit event
     from backend.services.security import SecurityService, AuditAction
@@ -985,10 +1034,10 @@ def send_rsvp_reminder(event_id):
     )
     
     if result.get('success'):
-        sent_count = result.get('sent_count', 0)
+        queued_count = result.get('queued_count', 0)
         members_count = result.get('members_count', 0)
-        if sent_count > 0:
-            flash(f'Push-Benachrichtigung an {sent_count} Geräte von {members_count} Mitgliedern gesendet.', 'success')
+        if queued_count > 0:
+            flash(f'Push-Benachrichtigung an {queued_count} Geräte von {members_count} Mitgliedern wird gesendet.', 'success')
         else:
             flash(f'{members_count} Mitglied(er) haben noch nicht geantwortet, aber keine Push-Subscriptions.', 'info')
     else:
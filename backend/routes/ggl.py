@@ -1,16 +1,9 @@
 from flask import Blueprint, redirect, render_template, request, url_for
 from flask_login import login_required, current_user
 from backend.services.ggl_rules import GGLService
-from backend.models.member import Member
 
 bp = Blueprint('ggl', __name__)
 
-def _attach_member_to_ranking(ranking):
-    """Attach Member object to each ranking entry."""
-    for rank_entry in ranking:
-        member = Member.query.get(rank_entry['member_id'])
-        rank_entry['member'] = member
-
 
 @bp.route('/')
 @login_required
@@ -54,7 +47,7 @@ def index():
     table_selected_season = selected_season
     if tab in ('tabelle', 'performance'):
         season_ranking = GGLService.get_season_ranking(selected_season)
-        _attach_member_to_ranking(season_ranking)
+        GGLService.attach_members(season_ranking)
 
     performance_context = GGLService.get_member_performance_view_context(
         current_user.id, selected_season
@@ -11,6 +11,7 @@ from backend.models.member_sensitive import MemberSensitive
 from backend.models.auth_token import AuthToken, AuthTokenPurpose
 from backend.services.security import SecurityService, AuditAction, require_step_up
 from backend.services.mail import MailService
+from backend.services.dashboard_snapshot import DashboardSnapshotService
 
 bp = Blueprint('member', __name__, url_prefix='/member')
 
@@ -405,6 +406,7 @@ def merch_order():
             order.total_profit_rappen = total_profit
             
             db.session.commit()
+            DashboardSnapshotService.invalidate_member(current_user.id)
             flash('Bestellung erfolgreich aufgegeben!', 'success')
             return redirect(url_for('member.merch_orders'))
             
@@ -514,6 +516,7 @@ def merch_order_edit(order_id):
             order.total_profit_rappen = total_profit
             
             db.session.commit()
+            DashboardSnapshotService.invalidate_member(current_user.id)
             flash('Bestellung erfolgreich aktualisiert!', 'success')
             return redirect(url_for('member.merch', tab='orders', order_id=order.id))
             
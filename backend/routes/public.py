@@ -1,12 +1,11 @@
 from flask import Blueprint, render_template, jsonify, redirect, url_for, request
 from flask_login import current_user
 from backend.extensions import db
-from backend.models.member import Member
 from datetime import datetime
 
 from backend.services.monatsessen_stats import (
-    get_landing_extras,
     get_landing_restaurant_table,
+    get_public_hitlist_index,
 )
 
 bp = Blueprint('public', __name__)
@@ -26,7 +25,9 @@ def landing():
 
     try:
         now = datetime.utcnow()
-        landing_extra = get_landing_extras(now)
+        # Extras, Mitgliederzahl und Hitlist aus dem gecachten Index (stale-while-revalidate)
+        hitlist_index = get_public_hitlist_index(now)
+        landing_extra = hitlist_index['extras']
         teaser_rows, _, _, _, hitlist_baseline_total = get_landing_restaurant_table(
             now,
             page=1,
@@ -35,7 +36,7 @@ def landing():
         )
 
         # Public stats
-        member_count = Member.query.filter_by(is_active=True).count()
+        member_count = hitlist_index['member_count']
         
         # Hero „Restaurant-Count“ = gleiche Regeln wie Hitlist (ohne Textsuche).
         restaurant_count = hitlist_baseline_total
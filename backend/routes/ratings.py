@@ -6,6 +6,8 @@ from backend.models.rating import EventRating
 from backend.models.participation import Participation
 from backend.forms.rating import EventRatingForm
 from backend.routes.events import CLEANUP_RSVP_UNDO_SESSION_KEY
+from backend.services.retro_cleanup import RetroCleanupService
+from backend.services.dashboard_snapshot import DashboardSnapshotService
 
 bp = Blueprint('ratings', __name__)
 
@@ -59,6 +61,8 @@ def rate_event(event_id):
         )
         db.session.add(rating)
         db.session.commit()
+        RetroCleanupService.invalidate_member(current_user.id)
+        DashboardSnapshotService.invalidate_member(current_user.id)
         undo = session.get(CLEANUP_RSVP_UNDO_SESSION_KEY)
         if undo and undo.get('event_id') == event_id:
             session.pop(CLEANUP_RSVP_UNDO_SESSION_KEY, None)
@@ -186,6 +190,8 @@ def delete_rating(event_id):
     
     db.session.delete(rating)
     db.session.commit()
+    RetroCleanupService.invalidate_member(current_user.id)
+    DashboardSnapshotService.invalidate_member(current_user.id)
     
     flash('Deine Bewertung wurde gelöscht.', 'success')
     return redirect(url_for('events.detail', event_id=event_id, tab='ratings', _anchor='event-ratings-form'))
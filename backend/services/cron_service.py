@@ -5,8 +5,11 @@ Handles scheduled tasks wie 3-Wochen-Erinnerungen
 
 import logging
 from datetime import datetime, timedelta
+from flask import current_app
 from backend.extensions import db
 from backend.services.push_notifications import PushNotificationService
+from backend.services.push_metrics import PushMetrics
+from backend.services.push_outbox import PushOutboxService
 from backend.models.event import Event
 
 logger = logging.getLogger(__name__)
@@ -57,6 +60,34 @@ class CronService:
                 'error': str(e)
             }
     
+    @staticmethod
+    def get_push_metrics(hours: int = 24):
+        """
+        Push-Zustellmetriken der letzten `hours` Stunden pro Push-Service-Origin
+        plus Gesundheitszustand der Subscriptions (Fehlerserien)
+        """
+        try:
+            from backend.models.push_subscription import PushSubscription
+
+            active = PushSubscription.query.filter_by(is_active=True)
+            return {
+                'success': True,
+                'window_hours': hours,
+                'origins': PushMetrics.summary(hours),
+                'subscriptions': {
+                    'active': active.count(),
+                    'failing': active.filter(PushSubscription.consecutive_failures > 0).count(),
+                    'max_consecutive_failures': current_app.config.get('PUSH_MAX_CONSECUTIVE_FAILURES', 3),
+                },
+                'generated_at': datetime.utcnow().isoformat()
+            }
+        except Exception as e:
+            logger.error(f"Error getting push metrics: {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
     @staticmethod
     def get_cron_status():
         """
@@ -145,4 +176,25 @@ class CronService:
             return {
                 'success': False,
                 'error': str(e)
-            }
\ No newline at end of file
+            }
+    
+    @staticmethod
+    def run_push_outbox():
+        """
+        Stellt die eingereihten Pushes zu (Push-Outbox), bis nichts mehr fällig ist.
+        Läuft am Ende des Cron-Jobs, damit Reminder auch ohne Web-Worker rausgehen.
+        """
+        try:
+            logger.info("Starting push outbox delivery...")
+            delivery = PushOutboxService.drain()
+            # Cron-Prozess endet gleich – Metriken nicht bis zum nächsten Intervall liegen lassen
+            PushMetrics.flush()
+            logger.info(f"Push outbox delivery completed: {delivery}")
+            return {'success': True, 'delivery': delivery}
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error in push outbox delivery: {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
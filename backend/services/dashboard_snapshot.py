@@ -0,0 +1,282 @@
+"""Dashboard-Snapshot pro Mitglied: Kacheln einmal berechnen, bis zur nächsten Schreibänderung cachen."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time as time_module
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Optional
+
+from flask import current_app
+
+from backend.extensions import db
+from backend.models.event import Event
+from backend.models.merch_order import MerchOrder, OrderStatus
+from backend.models.participation import Participation
+from backend.services.ggl_rules import GGLService
+from backend.services.retro_cleanup import RetroCleanupService
+
+logger = logging.getLogger(__name__)
+
+
+class _LocalSnapshotBackend:
+    """In-Process-LRU mit TTL; Generation-Zähler für globale Invalidierung."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._generation = 0
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= time_module.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, key: str, payload: str, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time_module.monotonic() + ttl, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def generation(self) -> int:
+        return self._generation
+
+    def bump_generation(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+class _RedisSnapshotBackend:
+    """Redis-Backend (REDIS_URL): Snapshots gelten für alle Worker."""
+
+    GENERATION_KEY = 'dashboard:generation'
+
+    def __init__(self, client):
+        self.client = client
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(key)
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+    def set(self, key: str, payload: str, ttl: int) -> None:
+        self.client.set(key, payload, ex=ttl)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+
+    def generation(self) -> int:
+        return int(self.client.get(self.GENERATION_KEY) or 0)
+
+    def bump_generation(self) -> None:
+        # Alte Schlüssel laufen über die TTL aus
+        self.client.incr(self.GENERATION_KEY)
+
+
+class DashboardSnapshotService:
+    """Baut die Dashboard-Daten eines Mitglieds (GGL-Rang, Prompts, letzte Rechnung, Merch)
+    und cached sie als JSON-Snapshot mit IDs statt ORM-Objekten.
+
+    Invalidierung:
+    - ``invalidate_member``: RSVP, Bewertung, Merch-Bestellung eines Mitglieds
+    - ``invalidate_all``: GGL-/BillBro-Änderungen (Rangliste aller) und Event-Änderungen
+    Zusätzlich gehört der Kalendertag zum Schlüssel (Fenster „heute …“)."""
+
+    SNAPSHOT_TTL_SECONDS = 600
+    LOCAL_MAXSIZE = 256
+    _EXTENSION_KEY = 'dashboard_snapshot_backend'
+
+    @classmethod
+    def _backend(cls):
+        backend = current_app.extensions.get(cls._EXTENSION_KEY)
+        if backend is None:
+            backend = cls._create_backend()
+            current_app.extensions[cls._EXTENSION_KEY] = backend
+        return backend
+
+    @classmethod
+    def _create_backend(cls):
+        redis_url = current_app.config.get('REDIS_URL')
+        if redis_url:
+            try:
+                import redis
+
+                client = redis.Redis.from_url(redis_url, socket_timeout=1)
+                client.ping()
+                return _RedisSnapshotBackend(client)
+            except Exception as e:
+                logger.warning(f"Dashboard-Snapshot: Redis nicht erreichbar, nutze In-Process-Cache ({e})")
+        return _LocalSnapshotBackend(cls.LOCAL_MAXSIZE)
+
+    @classmethod
+    def _key(cls, backend, member_id: int) -> str:
+        today = datetime.now().date().isoformat()
+        return f"dashboard:{backend.generation()}:{today}:{member_id}"
+
+    @classmethod
+    def get_snapshot(cls, member_id: int) -> dict:
+        """Snapshot aus dem Cache oder neu berechnen (JSON-serialisierbar)."""
+        try:
+            backend = cls._backend()
+            key = cls._key(backend, member_id)
+            payload = backend.get(key)
+        except Exception as e:
+            logger.warning(f"Dashboard-Snapshot: Cache-Lesefehler ({e})")
+            return cls.build_snapshot(member_id)
+
+        if payload is not None:
+            return json.loads(payload)
+
+        snapshot = cls.build_snapshot(member_id)
+        try:
+            backend.set(key, json.dumps(snapshot), cls.SNAPSHOT_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Dashboard-Snapshot: Cache-Schreibfehler ({e})")
+        return snapshot
+
+    @classmethod
+    def invalidate_member(cls, member_id: int) -> None:
+        try:
+            backend = cls._backend()
+            backend.delete(cls._key(backend, member_id))
+        except Exception as e:
+            logger.warning(f"Dashboard-Snapshot: Invalidierung fehlgeschlagen ({e})")
+
+    @classmethod
+    def invalidate_all(cls) -> None:
+        try:
+            cls._backend().bump_generation()
+        except Exception as e:
+            logger.warning(f"Dashboard-Snapshot: Invalidierung fehlgeschlagen ({e})")
+
+    @staticmethod
+    def build_snapshot(member_id: int) -> dict:
+        """Alle Dashboard-Kacheln für ein Mitglied berechnen."""
+        # An event is "upcoming" until the day AFTER the event date
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        next_event = Event.query.filter(
+            Event.datum >= today,
+            Event.published == True  # noqa: E712
+        ).order_by(Event.datum.asc()).first()
+
+        current_season = GGLService.get_current_season()
+        ggl_stats = GGLService.get_member_season_stats(member_id, current_season)
+        season_ranking = GGLService.get_season_ranking(current_season)
+        rank_total = len(season_ranking)
+
+        if ggl_stats:
+            user_rank = None
+            for i, member_stats in enumerate(season_ranking):
+                if member_stats['member_id'] == member_id:
+                    user_rank = i + 1
+                    break
+
+            ggl_stats['rank'] = user_rank
+            ggl_stats['points'] = ggl_stats['total_points']
+            ggl_stats['rank_total'] = rank_total
+        else:
+            ggl_stats = {
+                'season': current_season,
+                'total_points': 0,
+                'participation_count': 0,
+                'total_events_in_season': 0,
+                'rank': None,
+                'points': 0,
+                'rank_total': rank_total,
+            }
+
+        # Letzte Rechnung: Event und Teilnahme in einer Query
+        latest_bill = (
+            db.session.query(Event.id, Participation.id)
+            .join(Participation, Participation.event_id == Event.id)
+            .filter(
+                Participation.member_id == member_id,
+                Participation.calculated_share_rappen.isnot(None),
+                Participation.calculated_share_rappen > 0
+            )
+            .order_by(Event.datum.desc())
+            .first()
+        )
+
+        rsvp_prompt_event = RetroCleanupService.get_upcoming_rsvp_prompt_event(member_id)
+        today_billbro_event = RetroCleanupService.get_today_billbro_prompt_event(member_id)
+        restaurant_due_event = Event.query.filter(
+            Event.organisator_id == member_id,
+            Event.published == True,  # noqa: E712
+            Event.datum >= today,
+            Event.datum <= (today + timedelta(days=30)),
+            ((Event.restaurant.is_(None)) | (Event.restaurant == ''))
+        ).order_by(Event.datum.asc()).first()
+
+        merch_orders = (
+            db.session.query(MerchOrder.id, MerchOrder.status)
+            .filter(MerchOrder.member_id == member_id)
+            .order_by(MerchOrder.created_at.desc())
+            .all()
+        )
+        merch_open_count = sum(
+            1 for _, status in merch_orders if status in (OrderStatus.BESTELLT, OrderStatus.WIRD_GELIEFERT)
+        )
+
+        return {
+            'current_season': current_season,
+            'ggl_stats': ggl_stats,
+            'next_event_id': next_event.id if next_event else None,
+            'latest_bill_event_id': latest_bill[0] if latest_bill else None,
+            'latest_bill_participation_id': latest_bill[1] if latest_bill else None,
+            'rsvp_prompt_event_id': rsvp_prompt_event.id if rsvp_prompt_event else None,
+            'today_billbro_event_id': today_billbro_event.id if today_billbro_event else None,
+            'restaurant_due_event_id': restaurant_due_event.id if restaurant_due_event else None,
+            'merch_last_order_id': merch_orders[0][0] if merch_orders else None,
+            'merch_open_count': merch_open_count,
+        }
+
+    @staticmethod
+    def hydrate(snapshot: dict) -> dict:
+        """Snapshot-IDs in ORM-Objekte für das Template auflösen (eine Query pro Tabelle)."""
+        event_keys = (
+            'next_event_id',
+            'latest_bill_event_id',
+            'rsvp_prompt_event_id',
+            'today_billbro_event_id',
+            'restaurant_due_event_id',
+        )
+        event_ids = {snapshot[key] for key in event_keys if snapshot.get(key)}
+        events = (
+            {ev.id: ev for ev in Event.query.filter(Event.id.in_(event_ids)).all()}
+            if event_ids else {}
+        )
+
+        participation_id = snapshot.get('latest_bill_participation_id')
+        order_id = snapshot.get('merch_last_order_id')
+
+        return {
+            'next_event': events.get(snapshot.get('next_event_id')),
+            'ggl_stats': snapshot['ggl_stats'],
+            'current_season': snapshot['current_season'],
+            'latest_bill_event': events.get(snapshot.get('latest_bill_event_id')),
+            'latest_bill_participation': (
+                db.session.get(Participation, participation_id) if participation_id else None
+            ),
+            'rsvp_prompt_event': events.get(snapshot.get('rsvp_prompt_event_id')),
+            'today_billbro_event': events.get(snapshot.get('today_billbro_event_id')),
+            'restaurant_due_event': events.get(snapshot.get('restaurant_due_event_id')),
+            'merch_last_order': db.session.get(MerchOrder, order_id) if order_id else None,
+            'merch_open_count': snapshot['merch_open_count'],
+        }
@@ -0,0 +1,302 @@
+"""DriveSearchIndex – lokale Volltextsuche ueber die Dateien im Shared Drive.
+
+Spiegel in `document_search_entries` (Name, Ordner-Pfad, extrahierter Text),
+gepflegt von DriveStorageService bei Upload, Lifecycle-Aktionen, Auto-Sync
+und Re-Sync. Gesucht wird mit FTS5 (SQLite) bzw. tsvector/GIN (Postgres);
+Scope-Filter, Ranking und Paging laufen in derselben Query.
+
+Die Methoden committen nicht – das uebernimmt der aufrufende Service.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import re
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterable
+
+from sqlalchemy import Float, Integer, delete, func, insert, literal_column, or_, text, update
+
+from backend.extensions import db
+from backend.models.document import Document
+from backend.models.document_search_entry import POSTGRES_TSVECTOR, DocumentSearchEntry
+
+if TYPE_CHECKING:
+    from backend.services.drive_storage import FolderNode
+
+logger = logging.getLogger(__name__)
+
+# Obergrenze fuer extrahierten Text pro Datei (Zeichen)
+MAX_INDEXED_TEXT_CHARS = 100_000
+
+TEXT_MIME_TYPES = frozenset({"text/plain", "text/markdown", "text/csv"})
+
+_QUERY_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+# ---------------------------------------------------------------------------
+# Text-Extraktion
+# ---------------------------------------------------------------------------
+
+
+def extract_text(payload: bytes, mime_type: str | None) -> str:
+    """Lesbarer Text aus Upload-Bytes (Plain-Text, PDF falls `pypdf` vorhanden)."""
+    if mime_type in TEXT_MIME_TYPES:
+        raw = bytes(payload).decode("utf-8", errors="replace")
+    elif mime_type == "application/pdf":
+        raw = _extract_pdf_text(bytes(payload))
+    else:
+        return ""
+    return " ".join(raw.split())[:MAX_INDEXED_TEXT_CHARS]
+
+
+def _extract_pdf_text(payload: bytes) -> str:
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        # Optional: ohne pypdf werden PDFs nur ueber Name und Pfad gefunden
+        return ""
+    parts: list[str] = []
+    total = 0
+    try:
+        for page in PdfReader(io.BytesIO(payload)).pages:
+            chunk = page.extract_text() or ""
+            parts.append(chunk)
+            total += len(chunk)
+            if total >= MAX_INDEXED_TEXT_CHARS:
+                break
+    except Exception as exc:  # noqa: BLE001 – defekte PDFs bleiben ohne Text
+        logger.info("PDF-Text nicht extrahierbar: %s", exc)
+    return " ".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Ordner-Pfade
+# ---------------------------------------------------------------------------
+
+
+def folder_columns(chain: list[FolderNode]) -> tuple[str, str]:
+    """(`folder_path`, `folder_ids`) aus einer Ordner-Kette (Ordner → Wurzel)."""
+    nodes = list(reversed(chain))
+    path = " / ".join(node.name for node in nodes)
+    ids = "/" + "".join(f"{node.id}/" for node in nodes)
+    return path, ids
+
+
+def chain_from_tree(
+    tree: dict[str, FolderNode], folder_id: str | None, root_id: str
+) -> list[FolderNode]:
+    """Ordner-Kette nur aus dem lokalen Baum (bricht bei unbekannten Knoten ab)."""
+    chain: list[FolderNode] = []
+    seen: set[str] = set()
+    fid = folder_id
+    while fid and fid != root_id and fid not in seen and len(chain) < 80:
+        seen.add(fid)
+        node = tree.get(fid)
+        if node is None:
+            break
+        chain.append(node)
+        fid = node.parent_id
+    return chain
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+
+class DriveSearchIndex:
+    """Schreib- und Suchzugriffe auf `document_search_entries`."""
+
+    @staticmethod
+    def upsert(
+        drive_file_id: str,
+        *,
+        parent_id: str | None,
+        chain: list[FolderNode],
+        name: str | None = None,
+        mime_type: str | None = None,
+        web_view_link: str | None = None,
+        body_text: str | None = None,
+    ) -> DocumentSearchEntry:
+        """Eintrag anlegen oder aktualisieren; `None`-Felder bleiben unveraendert."""
+        entry = DocumentSearchEntry.query.filter_by(
+            drive_file_id=drive_file_id
+        ).one_or_none()
+        if entry is None:
+            entry = DocumentSearchEntry(drive_file_id=drive_file_id, name="", body_text="")
+            db.session.add(entry)
+        entry.folder_path, entry.folder_ids = folder_columns(chain)
+        entry.parent_id = parent_id
+        if name is not None:
+            entry.name = name
+        if mime_type is not None:
+            entry.mime_type = mime_type
+        if web_view_link is not None:
+            entry.web_view_link = web_view_link
+        if body_text is not None:
+            entry.body_text = body_text
+        entry.updated_at = datetime.utcnow()
+        return entry
+
+    @staticmethod
+    def remove(drive_file_ids: Iterable[str]) -> None:
+        ids = [fid for fid in drive_file_ids if fid]
+        if ids:
+            db.session.execute(
+                delete(DocumentSearchEntry)
+                .where(DocumentSearchEntry.drive_file_id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+
+    @staticmethod
+    def upsert_page(items: list[dict]) -> None:
+        """Eine Re-Sync-Seite (id, name, mimeType, parents, webViewLink) abgleichen.
+
+        Ein SELECT, dann Bulk-INSERT/-UPDATE. Pfade setzt `refresh_paths`
+        nach dem Lauf, wenn der Ordner-Baum vollstaendig ist.
+        """
+        by_id = {it["id"]: it for it in items if it.get("parents")}
+        if not by_id:
+            return
+        now = datetime.utcnow()
+        existing = {
+            row.drive_file_id: row
+            for row in db.session.query(
+                DocumentSearchEntry.id,
+                DocumentSearchEntry.drive_file_id,
+                DocumentSearchEntry.name,
+                DocumentSearchEntry.mime_type,
+                DocumentSearchEntry.web_view_link,
+                DocumentSearchEntry.parent_id,
+            ).filter(DocumentSearchEntry.drive_file_id.in_(list(by_id)))
+        }
+        new_rows: list[dict] = []
+        changed_rows: list[dict] = []
+        for fid, item in by_id.items():
+            values = {
+                "name": item.get("name") or "",
+                "mime_type": item.get("mimeType"),
+                "web_view_link": item.get("webViewLink"),
+                "parent_id": item["parents"][0],
+            }
+            row = existing.get(fid)
+            if row is None:
+                new_rows.append(
+                    dict(
+                        values,
+                        drive_file_id=fid,
+                        folder_path="",
+                        folder_ids="",
+                        body_text="",
+                        updated_at=now,
+                    )
+                )
+            elif any(getattr(row, key) != value for key, value in values.items()):
+                changed_rows.append(dict(values, id=row.id, updated_at=now))
+        if new_rows:
+            db.session.execute(insert(DocumentSearchEntry), new_rows)
+        if changed_rows:
+            db.session.execute(update(DocumentSearchEntry), changed_rows)
+
+    @staticmethod
+    def prune_missing_documents() -> int:
+        """Eintraege ohne zugehoeriges Document entfernen (nach Re-Sync)."""
+        result = db.session.execute(
+            delete(DocumentSearchEntry)
+            .where(
+                ~DocumentSearchEntry.drive_file_id.in_(
+                    db.session.query(Document.drive_file_id).scalar_subquery()
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0
+
+    @staticmethod
+    def refresh_paths(tree: dict[str, FolderNode], root_id: str) -> int:
+        """`folder_path`/`folder_ids` aller Eintraege aus dem Ordner-Baum neu setzen."""
+        columns_by_parent: dict[str | None, tuple[str, str]] = {}
+        changed: list[dict] = []
+        for row_id, parent_id, path, ids in db.session.query(
+            DocumentSearchEntry.id,
+            DocumentSearchEntry.parent_id,
+            DocumentSearchEntry.folder_path,
+            DocumentSearchEntry.folder_ids,
+        ):
+            if parent_id not in columns_by_parent:
+                columns_by_parent[parent_id] = folder_columns(
+                    chain_from_tree(tree, parent_id, root_id)
+                )
+            new_path, new_ids = columns_by_parent[parent_id]
+            if (new_path, new_ids) != (path, ids):
+                changed.append({"id": row_id, "folder_path": new_path, "folder_ids": new_ids})
+        if changed:
+            db.session.execute(update(DocumentSearchEntry), changed)
+        return len(changed)
+
+    @classmethod
+    def search(
+        cls,
+        query: str,
+        *,
+        scope_folder_id: str | None = None,
+        page: int = 1,
+        per_page: int = 25,
+    ) -> tuple[list[DocumentSearchEntry], int]:
+        """Treffer einer Seite plus Gesamtzahl; alle Woerter muessen (als Praefix) vorkommen."""
+        tokens = [tok.lower() for tok in _QUERY_TOKEN.findall(query or "")]
+        if not tokens:
+            return [], 0
+
+        base = DocumentSearchEntry.query
+        if scope_folder_id:
+            base = base.filter(
+                DocumentSearchEntry.folder_ids.contains(f"/{scope_folder_id}/", autoescape=True)
+            )
+
+        dialect = db.session.get_bind().dialect.name
+        if dialect == "sqlite":
+            fts = (
+                text(
+                    "SELECT rowid, bm25(document_search_fts, 10.0, 3.0, 1.0) AS rank "
+                    "FROM document_search_fts WHERE document_search_fts MATCH :match"
+                )
+                .bindparams(match=" ".join(f'"{tok}"*' for tok in tokens))
+                .columns(rowid=Integer, rank=Float)
+                .subquery("fts")
+            )
+            matches = base.join(fts, fts.c.rowid == DocumentSearchEntry.id)
+            ordering = (fts.c.rank.asc(), DocumentSearchEntry.name)
+        elif dialect == "postgresql":
+            vector = literal_column(POSTGRES_TSVECTOR)
+            tsquery = func.to_tsquery("simple", " & ".join(f"{tok}:*" for tok in tokens))
+            matches = base.filter(vector.op("@@")(tsquery))
+            ordering = (func.ts_rank(vector, tsquery).desc(), DocumentSearchEntry.name)
+        else:
+            matches = base
+            for tok in tokens:
+                matches = matches.filter(
+                    or_(
+                        *(
+                            func.lower(column).contains(tok, autoescape=True)
+                            for column in (
+                                DocumentSearchEntry.name,
+                                DocumentSearchEntry.folder_path,
+                                DocumentSearchEntry.body_text,
+                            )
+                        )
+                    )
+                )
+            ordering = (DocumentSearchEntry.name,)
+
+        total = matches.order_by(None).count()
+        page = max(1, page)
+        rows = (
+            matches.order_by(*ordering)
+            .offset((page - 1) * per_page)
+            .limit(per_page)
+            .all()
+        )
+        return rows, total
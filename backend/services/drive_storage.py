@@ -15,15 +15,21 @@ from __future__ import annotations
 
 import base64
 import binascii
+import hashlib
 import io
 import json
 import logging
 import re
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import IO
-
-from flask import current_app
+import secrets
+import threading
+import time as time_module
+import weakref
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import IO, Iterator
+
+from flask import current_app, g, has_request_context
+from sqlalchemy import delete, insert, or_, update
 from tenacity import (
     retry,
     retry_if_exception,
@@ -34,7 +40,11 @@ from tenacity import (
 from backend.extensions import db
 from backend.models.audit_event import AuditAction
 from backend.models.document import Document
+from backend.models.document_upload import DocumentUpload
+from backend.models.drive_folder import DriveFolder
+from backend.models.drive_sync_state import DriveSyncState
 from backend.models.member import Member
+from backend.services.drive_search import DriveSearchIndex, extract_text
 from backend.services.security import SecurityService
 
 logger = logging.getLogger(__name__)
@@ -65,6 +75,14 @@ class DriveSanitizationError(DriveError):
     """SVG kann nicht sicher sanitiziert werden."""
 
 
+class DriveUploadOffsetError(DriveError):
+    """Chunk passt nicht zum Stand der Upload-Session (Client muss neu aufsetzen)."""
+
+    def __init__(self, received_bytes: int):
+        super().__init__(f"Upload erwartet Byte {received_bytes}.")
+        self.received_bytes = received_bytes
+
+
 # ---------------------------------------------------------------------------
 # Konstanten (Capability Sektion 11)
 # ---------------------------------------------------------------------------
@@ -101,6 +119,26 @@ GOOGLE_FOLDER_MIME = "application/vnd.google-apps.folder"
 
 DRIVE_SCOPES = ("https://www.googleapis.com/auth/drive",)
 
+# Ordner pro `'a' in parents or ...`-Query beim Zaehlen der Subfolder-Inhalte
+# (haelt die Query deutlich unter dem Drive-Limit fuer die q-Laenge).
+COUNT_PARENTS_PER_QUERY = 40
+
+# Download-Streaming: Bytes pro Drive-Range-Request (= Speicherbedarf pro Download)
+DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+
+# Chunk-Upload: Drive verlangt Vielfache von 256 KiB (ausser dem letzten Chunk)
+UPLOAD_CHUNK_GRANULARITY = 256 * 1024
+UPLOAD_CHUNK_BYTES = 16 * UPLOAD_CHUNK_GRANULARITY  # 4 MiB
+UPLOAD_SESSION_MAX_AGE = timedelta(days=7)  # Drive verwirft Sessions nach einer Woche
+DRIVE_UPLOAD_URL = "https://www.googleapis.com/upload/drive/v3/files"
+
+# Treffer pro Seite in der lokalen Dokumentensuche
+SEARCH_PAGE_SIZE = 25
+
+# Ordner-Listings pro Prozess (app.extensions); TTL via DRIVE_FOLDER_LISTING_TTL_SECONDS
+_LISTING_CACHE_KEY = "drive_folder_listings"
+LISTING_CACHE_MAX_ENTRIES = 256
+
 
 # ---------------------------------------------------------------------------
 # Result-Datentypen
@@ -124,6 +162,16 @@ class FolderMeta:
     direct_child_count: int
 
 
+@dataclass(frozen=True)
+class FolderNode:
+    """Knoten im lokalen Ordner-Baum (Spiegel von `drive_folders`)."""
+
+    id: str
+    name: str
+    parent_id: str | None
+    updated_at: datetime
+
+
 @dataclass
 class FileRow:
     """Ein nicht-Ordner-Eintrag aus Drive mit optionaler DB-Verknuepfung."""
@@ -149,6 +197,23 @@ class FolderListing:
     folder_id: str
     subfolders: list[FolderMeta]
     files: list[FileRow]
+    etag: str = ""
+
+    @property
+    def subfolders_etag(self) -> str:
+        """ETag nur ueber (id, name) der Unterordner (Folder-Picker ohne Dateien)."""
+        return _content_etag([(f.id, f.name) for f in self.subfolders])
+
+
+@dataclass
+class DriveDownload:
+    """Metadaten fuer einen gestreamten Download (Bytes via `iter_download_chunks`)."""
+
+    drive_file_id: str
+    name: str
+    mime_type: str
+    size: int | None
+    etag: str | None = None
 
 
 @dataclass
@@ -164,6 +229,20 @@ class SearchHit:
     icon_name: str = "file"
 
 
+@dataclass
+class SearchPage:
+    """Eine Seite Suchtreffer aus dem lokalen Index."""
+
+    hits: list[SearchHit]
+    total: int
+    page: int
+    per_page: int
+
+    @property
+    def pages(self) -> int:
+        return max(1, -(-self.total // self.per_page))
+
+
 @dataclass
 class SyncResult:
     """Ergebnis eines per-Document-Auto-Syncs (Capability Sektion 9.2)."""
@@ -182,6 +261,7 @@ class ResyncReport:
     orphans_removed: int = 0
     parent_updates: int = 0
     files_seen: int = 0
+    mode: str = "full"
     started_at: datetime = field(default_factory=datetime.utcnow)
     finished_at: datetime | None = None
     notes: list[str] = field(default_factory=list)
@@ -348,6 +428,45 @@ def _parse_drive_time(raw: str | None) -> datetime | None:
     return dt
 
 
+def _content_etag(content) -> str:
+    """Starker ETag aus dem JSON-serialisierten Inhalt."""
+    payload = json.dumps(content, separators=(",", ":"))
+    return '"' + hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def _folder_listing_etag(subfolders: list[FolderMeta], files: list[FileRow]) -> str:
+    """Inhalts-Hash eines Listings (ohne zeitabhaengiges `relative_label`)."""
+    return _content_etag(
+        [
+            [(f.id, f.name, f.direct_child_count) for f in subfolders],
+            [
+                (
+                    r.drive_file_id,
+                    r.name,
+                    r.modified_time.isoformat() if r.modified_time else None,
+                    r.size_bytes,
+                    r.document_id,
+                    r.uploader_display,
+                    r.document_under_archive,
+                )
+                for r in files
+            ],
+        ]
+    )
+
+
+def _fresh_listing_copy(listing: FolderListing) -> FolderListing:
+    """Kopie fuer den Aufrufer; `relative_label` ("vor 5 Min.") neu berechnen."""
+    return replace(
+        listing,
+        subfolders=[replace(f) for f in listing.subfolders],
+        files=[
+            replace(r, relative_label=relative_modified_label(r.modified_time))
+            for r in listing.files
+        ],
+    )
+
+
 def _escape_drive_query_literal(value: str) -> str:
     return value.replace("\\", "\\\\").replace("'", "\\'")
 
@@ -377,6 +496,108 @@ _drive_retry = retry(
 )
 
 
+# ---------------------------------------------------------------------------
+# Drive-Client (prozessweit)
+# ---------------------------------------------------------------------------
+
+_CLIENT_POOL_KEY = "drive_client_pool"
+
+
+class DriveClientPool:
+    """Drive-Clients pro Prozess: Credentials einmal laden, Clients pro Thread.
+
+    `googleapiclient`-Resources (httplib2) sind nicht thread-sicher, deshalb
+    baut jeder Thread genau einen Client und behaelt ihn (inkl. Keep-Alive).
+    Die Credentials teilen sich alle Threads; abgelaufene Tokens werden unter
+    Lock erneuert, bevor ein Client sie benutzt. `close()` schliesst alle
+    Clients, der naechste Zugriff baut neu auf (z. B. nach Key-Rotation).
+    Offene Clients werden nur schwach referenziert: endet ein Thread (z. B.
+    ein kurzlebiger Refresh-Thread), faellt sein Client mit dem Thread-Local weg.
+    """
+
+    def __init__(self, credentials_factory):
+        self._credentials_factory = credentials_factory
+        self._credentials = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._generation = 0
+        self._open: weakref.WeakSet = weakref.WeakSet()
+
+    def credentials(self):
+        with self._lock:
+            if self._credentials is None:
+                self._credentials = self._credentials_factory()
+            creds = self._credentials
+            if not getattr(creds, "valid", True):
+                try:
+                    from google.auth.transport.requests import Request
+                except ImportError as exc:
+                    raise DriveError("google-auth bzw. requests ist nicht installiert.") from exc
+                creds.refresh(Request())
+            return creds
+
+    def drive(self):
+        """Drive-v3-Resource des aktuellen Threads."""
+        return self._thread_client("drive", self._build_resource)
+
+    def session(self):
+        """`AuthorizedSession` des aktuellen Threads (Resumable-Uploads)."""
+        return self._thread_client("session", self._build_session)
+
+    def close(self) -> None:
+        with self._lock:
+            clients, self._open = list(self._open), weakref.WeakSet()
+            self._credentials = None
+            self._generation += 1
+        for client in clients:
+            self._close_client(client)
+
+    def _thread_client(self, kind: str, factory):
+        with self._lock:
+            generation = self._generation
+        slot = getattr(self._local, kind, None)
+        if slot is not None and slot[0] == generation:
+            client = slot[1]
+            self.credentials()  # Token ggf. vor dem Request erneuern
+            return client
+        client = factory(self.credentials())
+        with self._lock:
+            current = generation == self._generation
+            if current:
+                self._open.add(client)
+        if not current:
+            # close() lief waehrend des Aufbaus: Client verwerfen, neu aufbauen
+            self._close_client(client)
+            return self._thread_client(kind, factory)
+        setattr(self._local, kind, (generation, client))
+        return client
+
+    @staticmethod
+    def _close_client(client) -> None:
+        try:
+            client.close()
+        except Exception as exc:  # noqa: BLE001 – Aufraeumen ist best effort
+            logger.debug("Drive-Client schliessen fehlgeschlagen: %s", exc)
+
+    @staticmethod
+    def _build_resource(credentials):
+        try:
+            from googleapiclient.discovery import build
+        except ImportError as exc:
+            raise DriveError(
+                "google-api-python-client ist nicht installiert."
+            ) from exc
+        return build("drive", "v3", credentials=credentials, cache_discovery=False)
+
+    @staticmethod
+    def _build_session(credentials):
+        try:
+            from google.auth.transport.requests import AuthorizedSession
+        except ImportError as exc:
+            raise DriveError("google-auth bzw. requests ist nicht installiert.") from exc
+        return AuthorizedSession(credentials)
+
+
 class DriveStorageService:
     """Service-Layer fuer Google Shared Drive Operations."""
 
@@ -441,17 +662,26 @@ class DriveStorageService:
             info, scopes=list(DRIVE_SCOPES)
         )
 
+    @classmethod
+    def _client_pool(cls) -> DriveClientPool:
+        pool = current_app.extensions.get(_CLIENT_POOL_KEY)
+        if pool is None:
+            pool = current_app.extensions.setdefault(
+                _CLIENT_POOL_KEY, DriveClientPool(cls._load_credentials)
+            )
+        return pool
+
     @classmethod
     def _build_drive(cls):
-        try:
-            from googleapiclient.discovery import build
-        except ImportError as exc:
-            raise DriveError(
-                "google-api-python-client ist nicht installiert."
-            ) from exc
+        """Drive-Client aus dem Prozess-Pool (einmal pro Thread gebaut)."""
+        return cls._client_pool().drive()
 
-        creds = cls._load_credentials()
-        return build("drive", "v3", credentials=creds, cache_discovery=False)
+    @classmethod
+    def close_drive_clients(cls) -> None:
+        """Pool schliessen; naechster Zugriff laedt Credentials und Clients neu."""
+        pool = current_app.extensions.pop(_CLIENT_POOL_KEY, None)
+        if pool is not None:
+            pool.close()
 
     # -- Validierung --------------------------------------------------------
 
@@ -512,36 +742,65 @@ class DriveStorageService:
                 break
         return out
 
-    @classmethod
+    @staticmethod
     @_drive_retry
-    def _count_direct_children(cls, drive, folder_id: str, drive_id: str) -> int:
-        q_parent = _escape_drive_query_literal(folder_id)
-        count = 0
+    def _count_children_chunk(drive, folder_ids: list[str], drive_id: str) -> dict[str, int]:
+        counts = {fid: 0 for fid in folder_ids}
+        q_parents = " or ".join(
+            f"'{_escape_drive_query_literal(fid)}' in parents" for fid in folder_ids
+        )
         page_token: str | None = None
         while True:
             response = (
                 drive.files()
                 .list(
-                    q=f"'{q_parent}' in parents and trashed = false",
+                    q=f"({q_parents}) and trashed = false",
                     corpora="drive",
                     driveId=drive_id,
                     includeItemsFromAllDrives=True,
                     supportsAllDrives=True,
-                    fields="nextPageToken, files(id)",
+                    fields="nextPageToken, files(id, parents)",
                     pageSize=1000,
                     pageToken=page_token,
                 )
                 .execute()
             )
-            count += len(response.get("files", []))
+            for item in response.get("files", []):
+                for parent in item.get("parents") or []:
+                    if parent in counts:
+                        counts[parent] += 1
             page_token = response.get("nextPageToken")
             if not page_token:
                 break
-        return count
+        return counts
+
+    @classmethod
+    def _count_children_bulk(
+        cls, drive, folder_ids: list[str], drive_id: str
+    ) -> dict[str, int]:
+        """Direkte Children mehrerer Ordner zaehlen.
+
+        Ein `files().list` mit `'a' in parents or 'b' in parents ...` pro
+        Block von COUNT_PARENTS_PER_QUERY Ordnern, gruppiert nach Parent.
+        """
+        counts: dict[str, int] = {}
+        step = COUNT_PARENTS_PER_QUERY
+        for start in range(0, len(folder_ids), step):
+            chunk = folder_ids[start:start + step]
+            counts.update(cls._count_children_chunk(drive, chunk, drive_id))
+        return counts
 
     @classmethod
     def list_folder(cls, drive_folder_id: str) -> FolderListing:
-        """Listet direkte Children eines Drive-Ordners."""
+        """Listet direkte Children eines Drive-Ordners (aus dem Listing-Cache, falls frisch)."""
+        listing = cls._cached_folder_listing(drive_folder_id)
+        if listing is None:
+            listing = cls._build_folder_listing(drive_folder_id)
+            cls._store_folder_listing(listing)
+        return _fresh_listing_copy(listing)
+
+    @classmethod
+    def _build_folder_listing(cls, drive_folder_id: str) -> FolderListing:
         drive = cls._build_drive()
         drive_id = cls._get_drive_id()
         raw = cls._list_children_paged(drive, drive_folder_id, drive_id)
@@ -553,17 +812,28 @@ class DriveStorageService:
             for doc in Document.query.filter(Document.drive_file_id.in_(ids)).all():
                 docs_by_drive_id[doc.drive_file_id] = doc
 
+        folder_items = [it for it in raw if it.get("mimeType") == GOOGLE_FOLDER_MIME]
+        cls._remember_folders(folder_items)
+        folder_ids = [it["id"] for it in folder_items]
+        child_counts = (
+            cls._count_children_bulk(drive, folder_ids, drive_id) if folder_ids else {}
+        )
+
         subfolders: list[FolderMeta] = []
         files: list[FileRow] = []
         archive_id = cls._archive_folder_id_config()
+        under_archive_by_parent: dict[str, bool] = {}
 
         for item in raw:
             mt = item.get("mimeType")
             if mt == GOOGLE_FOLDER_MIME:
                 cid = item["id"]
-                cnt = cls._count_direct_children(drive, cid, drive_id)
                 subfolders.append(
-                    FolderMeta(id=cid, name=item.get("name") or "Ordner", direct_child_count=cnt)
+                    FolderMeta(
+                        id=cid,
+                        name=item.get("name") or "Ordner",
+                        direct_child_count=child_counts.get(cid, 0),
+                    )
                 )
             else:
                 doc = docs_by_drive_id.get(item["id"])
@@ -579,7 +849,12 @@ class DriveStorageService:
                         u_disp = "Mitglied"
                     else:
                         u_disp = "extern via Drive"
-                under_arch = bool(doc and cls.document_is_under_archive(doc))
+                under_arch = False
+                if doc:
+                    pid = doc.drive_parent_id
+                    if pid not in under_archive_by_parent:
+                        under_archive_by_parent[pid] = cls.document_is_under_archive(doc)
+                    under_arch = under_archive_by_parent[pid]
                 files.append(
                     FileRow(
                         drive_file_id=item["id"],
@@ -609,112 +884,141 @@ class DriveStorageService:
         files.sort(key=lambda fr: (fr.name or "").lower())
 
         return FolderListing(
-            folder_id=drive_folder_id, subfolders=subfolders, files=files
+            folder_id=drive_folder_id,
+            subfolders=subfolders,
+            files=files,
+            etag=_folder_listing_etag(subfolders, files),
         )
 
     @classmethod
-    @_drive_retry
     def get_folder_breadcrumb(cls, drive_folder_id: str) -> list[FolderRef]:
         """Pfad vom Shared-Drive-Root bis zum Ordner (ohne synthetisches Root-Label)."""
-        drive = cls._build_drive()
-        root_id = cls._get_drive_id()
-        chain: list[FolderRef] = []
-        fid: str | None = drive_folder_id
-        safety = 0
-        while fid and fid != root_id and safety < 80:
-            safety += 1
-            meta = (
-                drive.files()
-                .get(
-                    fileId=fid,
-                    fields="id, name, parents",
-                    supportsAllDrives=True,
-                )
-                .execute()
-            )
-            chain.append(
-                FolderRef(id=meta["id"], name=meta.get("name") or "Ordner")
-            )
-            parents = meta.get("parents") or []
-            fid = parents[0] if parents else None
-        chain.reverse()
-        return chain
+        chain = cls._folder_chain(drive_folder_id)
+        return [FolderRef(id=node.id, name=node.name) for node in reversed(chain)]
 
     @classmethod
     def search_files(
-        cls, query: str, scope_folder_id: str | None = None
-    ) -> list[SearchHit]:
-        """Drive-Volltextsuche; optional auf Unterbaeume gefiltert."""
+        cls,
+        query: str,
+        scope_folder_id: str | None = None,
+        page: int = 1,
+        per_page: int = SEARCH_PAGE_SIZE,
+    ) -> SearchPage:
+        """Suche im lokalen Index (Name, Ordner-Pfad, Text); optional auf Unterbaum begrenzt."""
+        page = max(1, page)
         q = (query or "").strip()
         if len(q) < 2:
-            return []
+            return SearchPage(hits=[], total=0, page=page, per_page=per_page)
 
-        drive = cls._build_drive()
-        drive_id = cls._get_drive_id()
-        escaped = _escape_drive_query_literal(q)
-        q_str = (
-            f"fullText contains '{escaped}' and trashed = false "
-            f"and mimeType != '{GOOGLE_FOLDER_MIME}'"
+        root_id = cls._get_drive_id()
+        scope = scope_folder_id if scope_folder_id != root_id else None
+        entries, total = DriveSearchIndex.search(
+            q, scope_folder_id=scope, page=page, per_page=per_page
         )
-
-        hits_raw: list[dict] = []
-        page_token: str | None = None
-        while True:
-            response = (
-                drive.files()
-                .list(
-                    q=q_str,
-                    corpora="drive",
-                    driveId=drive_id,
-                    includeItemsFromAllDrives=True,
-                    supportsAllDrives=True,
-                    fields=(
-                        "nextPageToken, files(id, name, mimeType, parents, webViewLink)"
-                    ),
-                    pageSize=50,
-                    pageToken=page_token,
-                )
-                .execute()
+        tree = cls._folder_tree()
+        hits = [
+            SearchHit(
+                drive_file_id=entry.drive_file_id,
+                name=entry.name or "Unbenannt",
+                mime_type=entry.mime_type,
+                parent_id=entry.parent_id,
+                breadcrumb=[
+                    FolderRef(id=fid, name=tree[fid].name if fid in tree else "Ordner")
+                    for fid in entry.folder_ids.strip("/").split("/")
+                    if fid
+                ],
+                web_view_link=entry.web_view_link,
+                icon_name=mime_to_lucide_icon(entry.mime_type, entry.name or ""),
             )
-            hits_raw.extend(response.get("files", []))
-            page_token = response.get("nextPageToken")
-            if not page_token or len(hits_raw) >= 50:
-                break
+            for entry in entries
+        ]
+        return SearchPage(hits=hits, total=total, page=page, per_page=per_page)
 
-        results: list[SearchHit] = []
-        for item in hits_raw[:50]:
-            parents = item.get("parents") or []
-            parent_id = parents[0] if parents else None
-            crumbs = cls.get_folder_breadcrumb(parent_id) if parent_id else []
-            if scope_folder_id:
-                if parent_id != scope_folder_id and not cls._path_contains_folder(
-                    crumbs, scope_folder_id
-                ):
-                    continue
-            results.append(
-                SearchHit(
-                    drive_file_id=item["id"],
-                    name=item.get("name") or "Unbenannt",
-                    mime_type=item.get("mimeType"),
-                    parent_id=parent_id,
-                    breadcrumb=crumbs,
-                    web_view_link=item.get("webViewLink"),
-                    icon_name=mime_to_lucide_icon(
-                        item.get("mimeType"), item.get("name") or ""
-                    ),
-                )
-            )
-        return results
+    # -- Listing-Cache (pro Prozess) ----------------------------------------
 
     @staticmethod
-    def _path_contains_folder(crumbs: list[FolderRef], folder_id: str) -> bool:
-        return any(seg.id == folder_id for seg in crumbs)
+    def _listing_cache() -> dict:
+        return current_app.extensions.setdefault(
+            _LISTING_CACHE_KEY, {"entries": {}, "lock": threading.Lock()}
+        )
+
+    @classmethod
+    def _cached_folder_listing(cls, drive_folder_id: str) -> FolderListing | None:
+        state = cls._listing_cache()
+        with state["lock"]:
+            entry = state["entries"].get(drive_folder_id)
+        if entry is None:
+            return None
+        expires_at, listing = entry
+        if expires_at <= time_module.monotonic():
+            return None
+        return listing
+
+    @classmethod
+    def _store_folder_listing(cls, listing: FolderListing) -> None:
+        ttl = current_app.config.get("DRIVE_FOLDER_LISTING_TTL_SECONDS", 120)
+        if ttl <= 0:
+            return
+        now = time_module.monotonic()
+        state = cls._listing_cache()
+        with state["lock"]:
+            entries = state["entries"]
+            entries.pop(listing.folder_id, None)
+            entries[listing.folder_id] = (now + ttl, listing)
+            if len(entries) > LISTING_CACHE_MAX_ENTRIES:
+                for fid in [k for k, (exp, _) in entries.items() if exp <= now]:
+                    del entries[fid]
+            while len(entries) > LISTING_CACHE_MAX_ENTRIES:
+                del entries[next(iter(entries))]
+
+    @classmethod
+    def invalidate_folder_listings(cls, *folder_ids: str | None) -> None:
+        """Gecachte Listings der Ordner und ihrer Parents verwerfen.
+
+        Der Parent zeigt den Ordner als Kachel mit Child-Count. Ohne Argumente
+        wird der ganze Cache geleert (Re-Sync). Andere Worker sehen die
+        Aenderung spaetestens nach Ablauf der TTL.
+        """
+        state = current_app.extensions.get(_LISTING_CACHE_KEY)
+        if state is None or not state["entries"]:
+            return
+        if not folder_ids:
+            with state["lock"]:
+                state["entries"].clear()
+            return
+        affected = {fid for fid in folder_ids if fid}
+        if not affected:
+            return
+        affected.update(
+            parent_id
+            for (parent_id,) in db.session.query(DriveFolder.parent_id).filter(
+                DriveFolder.drive_folder_id.in_(list(affected))
+            )
+            if parent_id
+        )
+        with state["lock"]:
+            for fid in affected:
+                state["entries"].pop(fid, None)
+
+    # -- Suchindex (document_search_entries) ---------------------------------
+
+    @classmethod
+    def _index_file(cls, drive_file_id: str, parent_id: str | None, **fields) -> None:
+        """Suchindex nachfuehren; Fehler brechen die eigentliche Aktion nicht ab."""
+        try:
+            chain = cls._folder_chain(parent_id) if parent_id else []
+            DriveSearchIndex.upsert(
+                drive_file_id, parent_id=parent_id, chain=chain, **fields
+            )
+            db.session.commit()
+        except Exception as exc:  # noqa: BLE001 – Index holt der naechste Re-Sync nach
+            db.session.rollback()
+            logger.warning("Suchindex fuer %s nicht aktualisiert: %s", drive_file_id, exc)
 
     @classmethod
-    def list_subfolders_only(cls, drive_folder_id: str) -> list[FolderRef]:
-        """Nur direkte Unterordner (Folder-Picker / API)."""
-        listing = cls.list_folder(drive_folder_id)
-        return [FolderRef(id=f.id, name=f.name) for f in listing.subfolders]
+    def _refresh_search_paths(cls) -> None:
+        DriveSearchIndex.refresh_paths(cls._load_folder_tree(), cls._get_drive_id())
+        db.session.commit()
 
     # -- Ordner-Validierung -------------------------------------------------
 
@@ -727,7 +1031,7 @@ class DriveStorageService:
             drive.files()
             .get(
                 fileId=drive_folder_id,
-                fields="id, mimeType, parents, trashed",
+                fields="id, name, mimeType, parents, trashed",
                 supportsAllDrives=True,
             )
             .execute()
@@ -736,6 +1040,8 @@ class DriveStorageService:
             raise DriveValidationError("Zielordner ist nicht verfuegbar.")
         if meta.get("mimeType") != GOOGLE_FOLDER_MIME:
             raise DriveValidationError("Ziel ist kein Ordner.")
+        if drive_folder_id != drive_id:
+            cls._remember_folders([meta])
         parents = meta.get("parents") or []
         if drive_id not in parents and drive_folder_id != drive_id:
             # Ordner kann verschachtelt sein: Parent-Kette muss unter dem Drive landen
@@ -744,20 +1050,10 @@ class DriveStorageService:
 
     @classmethod
     def _folder_reachable_from_root(cls, drive, folder_id: str, root_id: str) -> bool:
-        fid: str | None = folder_id
-        seen: set[str] = set()
-        while fid and fid not in seen:
-            seen.add(fid)
-            if fid == root_id:
-                return True
-            meta = (
-                drive.files()
-                .get(fileId=fid, fields="parents", supportsAllDrives=True)
-                .execute()
-            )
-            pars = meta.get("parents") or []
-            fid = pars[0] if pars else None
-        return False
+        if folder_id == root_id:
+            return True
+        chain = cls._folder_chain(folder_id, drive)
+        return bool(chain) and chain[-1].parent_id == root_id
 
     @classmethod
     def document_is_under_archive(cls, document: Document) -> bool:
@@ -765,28 +1061,143 @@ class DriveStorageService:
         aid = cls._archive_folder_id_config()
         if not aid:
             return False
-        drive = cls._build_drive()
-        return cls._folder_has_ancestor(drive, document.drive_parent_id, aid)
+        return cls._folder_has_ancestor(None, document.drive_parent_id, aid)
 
     @classmethod
     def _folder_has_ancestor(cls, drive, folder_id: str, ancestor_id: str) -> bool:
-        fid: str | None = folder_id
+        chain = cls._folder_chain(folder_id, drive)
+        return ancestor_id == folder_id or any(
+            node.parent_id == ancestor_id for node in chain
+        )
+
+    # -- Ordner-Baum (lokaler Spiegel, drive_folders) -------------------------
+
+    @staticmethod
+    def _folder_tree_ttl() -> timedelta:
+        return timedelta(
+            seconds=current_app.config.get("DRIVE_FOLDER_TREE_TTL_SECONDS", 3600)
+        )
+
+    @staticmethod
+    def _load_folder_tree() -> dict[str, FolderNode]:
+        return {
+            row.drive_folder_id: FolderNode(
+                id=row.drive_folder_id,
+                name=row.name,
+                parent_id=row.parent_id,
+                updated_at=row.updated_at,
+            )
+            for row in DriveFolder.query.all()
+        }
+
+    @classmethod
+    def _folder_tree(cls) -> dict[str, FolderNode]:
+        """Ordner-Baum, pro Request einmal aus der DB geladen (flask.g)."""
+        if not has_request_context():
+            return cls._load_folder_tree()
+        tree = g.get("_drive_folder_tree")
+        if tree is None:
+            tree = g._drive_folder_tree = cls._load_folder_tree()
+        return tree
+
+    @classmethod
+    def _remember_folders(cls, items: list[dict]) -> dict[str, FolderNode]:
+        """Ordner aus Drive-Antworten (id, name, parents) in `drive_folders` schreiben.
+
+        Schreibt nur geaenderte oder abgelaufene Zeilen und flusht nur: Lesepfade
+        (Listing, Breadcrumb, Suche) committen nicht, das bleibt den schreibenden
+        Aufrufern und dem Resync (Commit pro Seite) ueberlassen. Gibt die
+        aktuellen Knoten aller uebergebenen Ordner zurueck.
+        """
+        by_id = {it["id"]: it for it in items}
+        if not by_id:
+            return {}
+
+        now = datetime.utcnow()
+        stale_before = now - cls._folder_tree_ttl()
+        existing = {
+            row.drive_folder_id: row
+            for row in DriveFolder.query.filter(
+                DriveFolder.drive_folder_id.in_(list(by_id))
+            ).all()
+        }
+        nodes: dict[str, FolderNode] = {}
+        dirty = False
+        for fid, item in by_id.items():
+            parents = item.get("parents") or []
+            parent_id = parents[0] if parents else None
+            name = item.get("name") or "Ordner"
+            row = existing.get(fid)
+            if row is None:
+                row = DriveFolder(
+                    drive_folder_id=fid, name=name, parent_id=parent_id, updated_at=now
+                )
+                db.session.add(row)
+                dirty = True
+            elif (
+                row.name != name
+                or row.parent_id != parent_id
+                or row.updated_at < stale_before
+            ):
+                row.name = name
+                row.parent_id = parent_id
+                row.updated_at = now
+                dirty = True
+            nodes[fid] = FolderNode(
+                id=fid, name=name, parent_id=parent_id, updated_at=row.updated_at
+            )
+        if dirty:
+            db.session.flush()
+
+        if has_request_context() and g.get("_drive_folder_tree") is not None:
+            g._drive_folder_tree.update(nodes)
+        return nodes
+
+    @classmethod
+    def _forget_folders_except(cls, seen_folder_ids: set[str]) -> int:
+        """Ordner, die in Drive nicht mehr existieren, aus dem Baum entfernen."""
+        removed = DriveFolder.query.filter(
+            ~DriveFolder.drive_folder_id.in_(seen_folder_ids)
+        ).delete(synchronize_session=False)
+        db.session.commit()
+        if has_request_context():
+            g.pop("_drive_folder_tree", None)
+        return removed
+
+    @staticmethod
+    @_drive_retry
+    def _drive_folder_meta(drive, folder_id: str) -> dict:
+        return (
+            drive.files()
+            .get(fileId=folder_id, fields="id, name, parents", supportsAllDrives=True)
+            .execute()
+        )
+
+    @classmethod
+    def _folder_chain(cls, folder_id: str, drive=None) -> list[FolderNode]:
+        """Ordner-Kette vom Ordner aufwaerts bis direkt unter die Drive-Wurzel.
+
+        Antwortet aus `drive_folders`; fehlende oder abgelaufene Knoten werden
+        einzeln aus Drive nachgeladen (Drive-Client erst bei Bedarf).
+        """
         root_id = cls._get_drive_id()
+        tree = cls._folder_tree()
+        stale_before = datetime.utcnow() - cls._folder_tree_ttl()
+        chain: list[FolderNode] = []
         seen: set[str] = set()
-        while fid and fid not in seen:
+        fid: str | None = folder_id
+        while fid and fid != root_id and fid not in seen and len(chain) < 80:
             seen.add(fid)
-            if fid == ancestor_id:
-                return True
-            if fid == root_id:
-                break
-            meta = (
-                drive.files()
-                .get(fileId=fid, fields="parents", supportsAllDrives=True)
-                .execute()
-            )
-            pars = meta.get("parents") or []
-            fid = pars[0] if pars else None
-        return False
+            node = tree.get(fid)
+            if node is None or node.updated_at < stale_before:
+                if drive is None:
+                    drive = cls._build_drive()
+                fetched = cls._remember_folders([cls._drive_folder_meta(drive, fid)])
+                tree.update(fetched)
+                node = fetched[fid]
+            chain.append(node)
+            fid = node.parent_id
+        return chain
 
     # -- CRUD ---------------------------------------------------------------
 
@@ -865,6 +1276,15 @@ class DriveStorageService:
             db.session.rollback()
             cls._safe_delete_drive_file(drive, drive_response["id"])
             raise
+        cls.invalidate_folder_listings(parent_id)
+        cls._index_file(
+            document.drive_file_id,
+            parent_id,
+            name=drive_response.get("name") or sanitized_filename,
+            mime_type=effective_mime,
+            web_view_link=drive_response.get("webViewLink"),
+            body_text=extract_text(payload, effective_mime),
+        )
 
         SecurityService.log_audit_event(
             AuditAction.DOCUMENT_UPLOADED,
@@ -893,6 +1313,222 @@ class DriveStorageService:
             .execute()
         )
 
+    # -- Chunk-Upload (Drive-Resumable-Session) -----------------------------
+
+    @classmethod
+    def _authorized_http(cls):
+        return cls._client_pool().session()
+
+    @classmethod
+    def _upload_request(cls, method: str, url: str, **kwargs):
+        http = cls._authorized_http()
+        try:
+            return getattr(http, method)(url, **kwargs)
+        except DriveError:
+            raise
+        except Exception as exc:  # Transportfehler (Timeout, Verbindungsabbruch)
+            raise DriveError(f"Drive-Upload nicht erreichbar: {exc}") from exc
+
+    @classmethod
+    def start_chunked_upload(
+        cls,
+        filename_stem: str,
+        drive_folder_id: str,
+        uploader: Member,
+        size_bytes: int,
+        mime_type: str | None,
+        original_filename: str | None = None,
+        event_id: int | None = None,
+    ) -> DocumentUpload:
+        """Validiert wie `upload_document` und oeffnet eine Drive-Resumable-Session.
+
+        SVGs muessen vor dem Upload als Ganzes sanitiziert werden und laufen
+        deshalb weiter ueber `upload_document`.
+        """
+        effective_mime = mime_type or "application/octet-stream"
+        cls.validate_upload(size_bytes, effective_mime, filename_stem)
+        if effective_mime == "image/svg+xml":
+            raise DriveValidationError(
+                "SVG-Dateien werden ohne Chunks hochgeladen (Sanitization)."
+            )
+        cls.assert_is_folder_in_drive(drive_folder_id)
+
+        drive = cls._build_drive()
+        extension = (
+            (original_filename or "").rsplit(".", 1)[-1]
+            if original_filename and "." in original_filename
+            else None
+        )
+        sanitized_filename = cls._resolve_filename_collision(
+            drive, drive_folder_id, sanitize_drive_filename(filename_stem, extension)
+        )
+
+        response = cls._upload_request(
+            "post",
+            DRIVE_UPLOAD_URL,
+            params={
+                "uploadType": "resumable",
+                "supportsAllDrives": "true",
+                "fields": "id, parents, webViewLink",
+            },
+            json={
+                "name": sanitized_filename,
+                "parents": [drive_folder_id],
+                "mimeType": effective_mime,
+            },
+            headers={
+                "X-Upload-Content-Type": effective_mime,
+                "X-Upload-Content-Length": str(size_bytes),
+            },
+            timeout=30,
+        )
+        cls._raise_for_upload_response(response, uploader.id if uploader else None)
+        session_uri = response.headers.get("Location")
+        if not session_uri:
+            raise DriveError("Drive hat keine Upload-Session geliefert.")
+
+        DocumentUpload.query.filter(
+            DocumentUpload.created_at < datetime.utcnow() - UPLOAD_SESSION_MAX_AGE
+        ).delete(synchronize_session=False)
+        upload = DocumentUpload(
+            token=secrets.token_urlsafe(32),
+            uploader_id=uploader.id,
+            event_id=event_id,
+            session_uri=session_uri,
+            drive_folder_id=drive_folder_id,
+            drive_filename=sanitized_filename,
+            mime_type=effective_mime,
+            size_bytes=size_bytes,
+            received_bytes=0,
+        )
+        db.session.add(upload)
+        db.session.commit()
+        return upload
+
+    @classmethod
+    def upload_chunk(
+        cls, upload: DocumentUpload, first_byte: int, payload: bytes
+    ) -> Document | None:
+        """Reicht einen Chunk an die Drive-Session weiter.
+
+        Gibt nach dem letzten Chunk das neue Document zurueck, sonst None.
+        Passt `first_byte` nicht zum bestaetigten Stand, kommt
+        DriveUploadOffsetError mit dem Byte, ab dem der Client weitermacht.
+        """
+        if first_byte != upload.received_bytes:
+            raise DriveUploadOffsetError(upload.received_bytes)
+        last_byte = first_byte + len(payload) - 1
+        if not payload or last_byte >= upload.size_bytes:
+            raise DriveValidationError("Chunk liegt ausserhalb der angekuendigten Dateigroesse.")
+        is_final = last_byte == upload.size_bytes - 1
+        if not is_final and len(payload) % UPLOAD_CHUNK_GRANULARITY:
+            raise DriveValidationError("Chunk-Groesse muss ein Vielfaches von 256 KiB sein.")
+
+        response = cls._upload_request(
+            "put",
+            upload.session_uri,
+            data=payload,
+            headers={"Content-Range": f"bytes {first_byte}-{last_byte}/{upload.size_bytes}"},
+            timeout=120,
+        )
+        return cls._apply_upload_response(upload, response)
+
+    @classmethod
+    def sync_chunked_upload(cls, upload: DocumentUpload) -> Document | None:
+        """Stand der Session bei Drive abfragen (Wiederaufnahme nach Abbruch).
+
+        Aktualisiert `received_bytes`; war der Upload bei Drive schon komplett,
+        wird das Document angelegt und zurueckgegeben.
+        """
+        response = cls._upload_request(
+            "put",
+            upload.session_uri,
+            headers={"Content-Range": f"bytes */{upload.size_bytes}"},
+            timeout=30,
+        )
+        return cls._apply_upload_response(upload, response)
+
+    @classmethod
+    def _apply_upload_response(cls, upload: DocumentUpload, response) -> Document | None:
+        if response.status_code == 308:
+            upload.received_bytes = cls._received_from_range_header(
+                response.headers.get("Range")
+            )
+            db.session.commit()
+            return None
+        if response.status_code in (404, 410):
+            db.session.delete(upload)
+            db.session.commit()
+        cls._raise_for_upload_response(response, upload.uploader_id)
+        return cls._finish_chunked_upload(upload, response.json())
+
+    @staticmethod
+    def _received_from_range_header(range_header: str | None) -> int:
+        """`Range: bytes=0-N` aus einer 308-Antwort → Anzahl bestaetigter Bytes."""
+        if not range_header or "-" not in range_header:
+            return 0
+        return int(range_header.rsplit("-", 1)[1]) + 1
+
+    @classmethod
+    def _finish_chunked_upload(cls, upload: DocumentUpload, file_meta: dict) -> Document:
+        parents = file_meta.get("parents") or [upload.drive_folder_id]
+        try:
+            document = Document(
+                drive_file_id=file_meta["id"],
+                drive_parent_id=parents[0],
+                event_id=upload.event_id,
+                uploader_id=upload.uploader_id,
+                last_seen_at=datetime.utcnow(),
+            )
+            db.session.add(document)
+            db.session.delete(upload)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            cls._safe_delete_drive_file(cls._build_drive(), file_meta["id"])
+            raise
+        cls.invalidate_folder_listings(document.drive_parent_id)
+        cls._index_file(
+            document.drive_file_id,
+            document.drive_parent_id,
+            name=upload.drive_filename,
+            mime_type=upload.mime_type,
+            web_view_link=file_meta.get("webViewLink"),
+        )
+
+        SecurityService.log_audit_event(
+            AuditAction.DOCUMENT_UPLOADED,
+            entity="document",
+            entity_id=document.id,
+            actor_id=document.uploader_id,
+            extra_data={
+                "drive_folder_id": upload.drive_folder_id,
+                "drive_file_id": document.drive_file_id,
+                "size_bytes": upload.size_bytes,
+                "chunked": True,
+            },
+        )
+        return document
+
+    @staticmethod
+    def _raise_for_upload_response(response, actor_id: int | None) -> None:
+        status = response.status_code
+        if status in (200, 201):
+            return
+        if status == 403 and "storageQuotaExceeded" in (response.text or ""):
+            SecurityService.log_audit_event(
+                AuditAction.DRIVE_QUOTA_EXCEEDED,
+                entity="document",
+                actor_id=actor_id,
+                extra_data={"raw_reason": "storageQuotaExceeded"},
+            )
+            raise DriveQuotaExceededError(
+                "Drive-Speicher ist voll. Bitte wende dich an den Vorstand."
+            )
+        if status in (404, 410):
+            raise DriveError("Upload-Session ist abgelaufen. Bitte neu hochladen.")
+        raise DriveError(f"Drive-Upload fehlgeschlagen (HTTP {status}).")
+
     @staticmethod
     def _safe_delete_drive_file(drive, file_id: str) -> None:
         try:
@@ -966,27 +1602,81 @@ class DriveStorageService:
         return meta.get("name") or "Unbenannt"
 
     @classmethod
-    def download_document(cls, document: Document) -> tuple[bytes, str, str]:
-        """Bytes, MIME, Original-Dateiname aus Drive."""
+    def prepare_download(cls, document: Document) -> DriveDownload:
+        """Name, MIME, Groesse und ETag (MD5 aus Drive) fuer einen Download."""
+        drive = cls._build_drive()
+        meta = (
+            drive.files()
+            .get(
+                fileId=document.drive_file_id,
+                fields="id, name, mimeType, size, md5Checksum",
+                supportsAllDrives=True,
+            )
+            .execute()
+        )
+        return DriveDownload(
+            drive_file_id=document.drive_file_id,
+            name=meta.get("name") or "download",
+            mime_type=meta.get("mimeType") or "application/octet-stream",
+            size=int(meta["size"]) if meta.get("size") else None,
+            etag=meta.get("md5Checksum"),
+        )
+
+    @classmethod
+    def iter_download_chunks(
+        cls, download: DriveDownload, start: int = 0, stop: int | None = None
+    ) -> Iterator[bytes]:
+        """Bytes `[start, stop)` als Chunks von hoechstens DOWNLOAD_CHUNK_BYTES.
+
+        Mit bekannter Groesse: ein Drive-Range-Request pro Chunk (auch fuer
+        HTTP-Range-Anfragen). Ohne Groesse: MediaIoBaseDownload, dessen Puffer
+        nach jedem Chunk geleert wird. Der Drive-Client wird sofort gebaut,
+        der Generator braucht keinen App-Kontext.
+        """
+        drive = cls._build_drive()
+        if download.size is None:
+            return cls._iter_media_download(drive, download.drive_file_id)
+        stop = download.size if stop is None else min(stop, download.size)
+        return cls._iter_ranged_download(drive, download.drive_file_id, start, stop)
+
+    @classmethod
+    def _iter_ranged_download(
+        cls, drive, drive_file_id: str, start: int, stop: int
+    ) -> Iterator[bytes]:
+        offset = start
+        while offset < stop:
+            last = min(offset + DOWNLOAD_CHUNK_BYTES, stop) - 1
+            chunk = cls._drive_fetch_range(drive, drive_file_id, offset, last)
+            if not chunk:
+                break
+            yield chunk
+            offset += len(chunk)
+
+    @staticmethod
+    @_drive_retry
+    def _drive_fetch_range(drive, drive_file_id: str, first: int, last: int) -> bytes:
+        request = drive.files().get_media(fileId=drive_file_id, supportsAllDrives=True)
+        request.headers["Range"] = f"bytes={first}-{last}"
+        return request.execute()
+
+    @staticmethod
+    def _iter_media_download(drive, drive_file_id: str) -> Iterator[bytes]:
         try:
             from googleapiclient.http import MediaIoBaseDownload
         except ImportError as exc:
             raise DriveError("google-api-python-client fehlt.") from exc
 
-        drive = cls._build_drive()
-        meta = cls._drive_file_meta(drive, document.drive_file_id)
-        name = meta.get("name") or "download"
-        mime = meta.get("mimeType") or "application/octet-stream"
-
-        request = drive.files().get_media(
-            fileId=document.drive_file_id, supportsAllDrives=True
-        )
+        request = drive.files().get_media(fileId=drive_file_id, supportsAllDrives=True)
         buffer = io.BytesIO()
-        downloader = MediaIoBaseDownload(buffer, request)
+        downloader = MediaIoBaseDownload(buffer, request, chunksize=DOWNLOAD_CHUNK_BYTES)
         done = False
         while not done:
             _, done = downloader.next_chunk()
-        return buffer.getvalue(), mime, name
+            chunk = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            if chunk:
+                yield chunk
 
     @classmethod
     def get_web_view_link(cls, document: Document) -> str:
@@ -1036,6 +1726,8 @@ class DriveStorageService:
         document.drive_parent_id = new_parent_id
         document.last_seen_at = datetime.utcnow()
         db.session.commit()
+        cls.invalidate_folder_listings(old_parent_id, new_parent_id)
+        cls._index_file(document.drive_file_id, new_parent_id, name=meta.get("name"))
 
         if audit_move:
             SecurityService.log_audit_event(
@@ -1134,7 +1826,9 @@ class DriveStorageService:
             raise
 
         db.session.delete(document)
+        DriveSearchIndex.remove([snapshot["drive_file_id"]])
         db.session.commit()
+        cls.invalidate_folder_listings(snapshot["drive_parent_id"])
 
         SecurityService.log_audit_event(
             AuditAction.DOCUMENT_PERMANENTLY_DELETED,
@@ -1176,6 +1870,8 @@ class DriveStorageService:
 
         document.last_seen_at = datetime.utcnow()
         db.session.commit()
+        cls.invalidate_folder_listings(folder_id)
+        cls._index_file(document.drive_file_id, folder_id, name=new_filename)
 
         SecurityService.log_audit_event(
             AuditAction.DOCUMENT_RENAMED,
@@ -1218,8 +1914,11 @@ class DriveStorageService:
 
             if isinstance(exc, HttpError) and getattr(exc.resp, "status", None) == 404:
                 snapshot_id = document.id
+                parent_id = document.drive_parent_id
+                DriveSearchIndex.remove([document.drive_file_id])
                 db.session.delete(document)
                 db.session.commit()
+                cls.invalidate_folder_listings(parent_id)
                 SecurityService.log_audit_event(
                     AuditAction.DOCUMENT_AUTO_REMOVED,
                     entity="document",
@@ -1238,8 +1937,11 @@ class DriveStorageService:
 
         if meta.get("trashed"):
             snapshot_id = document.id
+            parent_id = document.drive_parent_id
+            DriveSearchIndex.remove([document.drive_file_id])
             db.session.delete(document)
             db.session.commit()
+            cls.invalidate_folder_listings(parent_id)
             SecurityService.log_audit_event(
                 AuditAction.DOCUMENT_AUTO_REMOVED,
                 entity="document",
@@ -1254,13 +1956,23 @@ class DriveStorageService:
         parents = meta.get("parents") or []
         actual_parent = parents[0] if parents else document.drive_parent_id
 
-        if actual_parent != document.drive_parent_id:
+        previous_parent = document.drive_parent_id
+        if actual_parent != previous_parent:
             document.drive_parent_id = actual_parent
             result.drift_detected = True
             result.actions.append("parent_updated")
 
         document.last_seen_at = datetime.utcnow()
         db.session.commit()
+        if result.drift_detected:
+            cls.invalidate_folder_listings(previous_parent, actual_parent)
+        cls._index_file(
+            document.drive_file_id,
+            actual_parent,
+            name=meta.get("name"),
+            mime_type=meta.get("mimeType"),
+            web_view_link=meta.get("webViewLink"),
+        )
 
         if result.drift_detected:
             SecurityService.log_audit_event(
@@ -1274,12 +1986,20 @@ class DriveStorageService:
 
     @classmethod
     def admin_full_resync(cls, actor: Member) -> ResyncReport:
-        """Alle Files im Shared Drive mit der DB abgleichen."""
+        """Alle Files im Shared Drive mit der DB abgleichen.
+
+        Abgleich mengenbasiert pro Drive-Seite (`_reconcile_page`), ein Commit
+        pro Seite. Verwaist sind danach alle Documents, deren `last_seen_at`
+        vor dem Laufstart liegt. Der Changes-Token wird vor dem Listing geholt:
+        Aenderungen waehrend des Laufs spielt der naechste inkrementelle Sync nach.
+        """
         report = ResyncReport()
         drive = cls._build_drive()
         drive_id = cls._get_drive_id()
+        start_page_token = cls._drive_start_page_token(drive, drive_id)
+        run_started = datetime.utcnow()
 
-        seen_file_ids: set[str] = set()
+        seen_folder_ids: set[str] = set()
         page_token: str | None = None
 
         while True:
@@ -1291,61 +2011,237 @@ class DriveStorageService:
                     driveId=drive_id,
                     includeItemsFromAllDrives=True,
                     supportsAllDrives=True,
-                    fields="nextPageToken, files(id, mimeType, parents)",
+                    fields="nextPageToken, files(id, name, mimeType, parents, webViewLink)",
                     pageSize=1000,
                     pageToken=page_token,
                 )
                 .execute()
             )
-            for item in response.get("files", []):
-                if item.get("mimeType") == GOOGLE_FOLDER_MIME:
-                    continue
-                fid = item["id"]
-                parents = item.get("parents") or []
-                if not parents:
-                    continue
-                parent_id = parents[0]
-                seen_file_ids.add(fid)
-                report.files_seen += 1
-
-                existing = Document.query.filter_by(drive_file_id=fid).one_or_none()
-                now = datetime.utcnow()
-                if existing is None:
-                    doc = Document(
-                        drive_file_id=fid,
-                        drive_parent_id=parent_id,
-                        uploader_id=None,
-                        last_seen_at=now,
-                    )
-                    db.session.add(doc)
-                    db.session.flush()
-                    report.imported += 1
-                    SecurityService.log_audit_event(
-                        AuditAction.DOCUMENT_AUTO_IMPORTED,
-                        entity="document",
-                        entity_id=doc.id,
-                        actor_id=actor.id,
-                        extra_data={"drive_file_id": fid, "drive_parent_id": parent_id},
-                    )
-                else:
-                    if existing.drive_parent_id != parent_id:
-                        existing.drive_parent_id = parent_id
-                        report.parent_updates += 1
-                    existing.last_seen_at = now
-
+            folder_items = [
+                it
+                for it in response.get("files", [])
+                if it.get("mimeType") == GOOGLE_FOLDER_MIME
+            ]
+            cls._remember_folders(folder_items)
+            seen_folder_ids.update(it["id"] for it in folder_items)
+
+            file_items = [
+                it
+                for it in response.get("files", [])
+                if it.get("mimeType") != GOOGLE_FOLDER_MIME and it.get("parents")
+            ]
+            parent_by_file_id = {it["id"]: it["parents"][0] for it in file_items}
+            report.files_seen += len(parent_by_file_id)
+            cls._reconcile_page(parent_by_file_id, report, actor)
+            DriveSearchIndex.upsert_page(file_items)
             db.session.commit()
 
             page_token = response.get("nextPageToken")
             if not page_token:
                 break
 
-        orphans = Document.query.filter(
-            ~Document.drive_file_id.in_(seen_file_ids)
-        ).all()
-        for orphan in orphans:
-            oid = orphan.id
-            dfid = orphan.drive_file_id
-            db.session.delete(orphan)
+        cls._forget_folders_except(seen_folder_ids)
+
+        orphans = (
+            db.session.query(Document.id, Document.drive_file_id)
+            .filter(
+                or_(Document.last_seen_at.is_(None), Document.last_seen_at < run_started)
+            )
+            .all()
+        )
+        if orphans:
+            db.session.execute(
+                delete(Document)
+                .where(Document.id.in_([oid for oid, _ in orphans]))
+                .execution_options(synchronize_session=False)
+            )
+            SecurityService.add_audit_events(
+                AuditAction.DOCUMENT_AUTO_REMOVED,
+                "document",
+                [
+                    (oid, {"reason": "orphan_after_resync", "drive_file_id": dfid})
+                    for oid, dfid in orphans
+                ],
+                actor.id,
+            )
+            report.orphans_removed = len(orphans)
+        DriveSearchIndex.prune_missing_documents()
+        db.session.commit()
+        cls._refresh_search_paths()
+
+        report.finished_at = datetime.utcnow()
+        state = cls._sync_state(drive_id)
+        state.start_page_token = start_page_token
+        state.last_full_resync_at = report.finished_at
+        db.session.commit()
+        cls.invalidate_folder_listings()
+
+        cls._log_resync_ran(report, actor)
+        return report
+
+    @staticmethod
+    def _reconcile_page(
+        parent_by_file_id: dict[str, str], report: ResyncReport, actor: Member
+    ) -> None:
+        """Eine Drive-Seite gegen `documents` abgleichen (ohne Commit).
+
+        Ein SELECT fuer die vorhandenen Documents, dann Bulk-INSERT fuer neue
+        Files, Bulk-UPDATE fuer Parent-Wechsel und `last_seen_at` sowie ein
+        Bulk-INSERT der Audit-Events – unabhaengig von der Zeilenzahl.
+        """
+        if not parent_by_file_id:
+            return
+        now = datetime.utcnow()
+        existing = {
+            drive_file_id: (doc_id, parent_id)
+            for doc_id, drive_file_id, parent_id in db.session.query(
+                Document.id, Document.drive_file_id, Document.drive_parent_id
+            ).filter(Document.drive_file_id.in_(list(parent_by_file_id)))
+        }
+
+        new_rows: list[dict] = []
+        moved_rows: list[dict] = []
+        unchanged_ids: list[int] = []
+        for fid, parent_id in parent_by_file_id.items():
+            known = existing.get(fid)
+            if known is None:
+                new_rows.append(
+                    {
+                        "drive_file_id": fid,
+                        "drive_parent_id": parent_id,
+                        "uploader_id": None,
+                        "last_seen_at": now,
+                    }
+                )
+            elif known[1] != parent_id:
+                moved_rows.append(
+                    {"id": known[0], "drive_parent_id": parent_id, "last_seen_at": now}
+                )
+            else:
+                unchanged_ids.append(known[0])
+
+        if new_rows:
+            inserted = db.session.execute(
+                insert(Document).returning(
+                    Document.id, Document.drive_file_id, Document.drive_parent_id
+                ),
+                new_rows,
+            ).all()
+            SecurityService.add_audit_events(
+                AuditAction.DOCUMENT_AUTO_IMPORTED,
+                "document",
+                [
+                    (doc_id, {"drive_file_id": fid, "drive_parent_id": parent_id})
+                    for doc_id, fid, parent_id in inserted
+                ],
+                actor.id,
+            )
+            report.imported += len(inserted)
+        if moved_rows:
+            db.session.execute(update(Document), moved_rows)
+            report.parent_updates += len(moved_rows)
+        if unchanged_ids:
+            db.session.execute(
+                update(Document)
+                .where(Document.id.in_(unchanged_ids))
+                .values(last_seen_at=now)
+                .execution_options(synchronize_session=False)
+            )
+
+    @classmethod
+    def admin_incremental_sync(cls, actor: Member) -> ResyncReport:
+        """Nur Drive-Aenderungen seit dem letzten Lauf anwenden (Changes API).
+
+        Ohne gespeicherten Token oder bei abgelaufenem Token (HTTP 404/410)
+        laeuft stattdessen `admin_full_resync`.
+        """
+        drive = cls._build_drive()
+        drive_id = cls._get_drive_id()
+        state = cls._sync_state(drive_id)
+        if not state.start_page_token:
+            report = cls.admin_full_resync(actor)
+            report.notes.append("Kein Changes-Token gespeichert: Voll-Re-Sync ausgefuehrt.")
+            return report
+
+        report = ResyncReport(mode="incremental")
+        page_token: str | None = state.start_page_token
+        new_start_token: str | None = None
+        changes_seen = 0
+        while page_token:
+            try:
+                response = cls._drive_list_changes(drive, drive_id, page_token)
+            except Exception as exc:
+                if not cls._is_expired_page_token_error(exc):
+                    raise
+                logger.warning("Drive-Changes-Token abgelehnt, Voll-Re-Sync: %s", exc)
+                report = cls.admin_full_resync(actor)
+                report.notes.append("Changes-Token abgelaufen: Voll-Re-Sync ausgefuehrt.")
+                return report
+
+            affected: set[str] = set()
+            changes_seen += len(response.get("changes", []))
+            for change in response.get("changes", []):
+                affected |= cls._apply_drive_change(change, report, actor)
+            db.session.commit()
+            if affected:
+                cls.invalidate_folder_listings(*affected)
+
+            page_token = response.get("nextPageToken")
+            new_start_token = response.get("newStartPageToken") or new_start_token
+
+        if changes_seen:
+            cls._refresh_search_paths()
+
+        report.finished_at = datetime.utcnow()
+        state = cls._sync_state(drive_id)
+        if new_start_token:
+            state.start_page_token = new_start_token
+        state.last_incremental_sync_at = report.finished_at
+        db.session.commit()
+
+        cls._log_resync_ran(report, actor)
+        return report
+
+    @classmethod
+    def _apply_drive_change(
+        cls, change: dict, report: ResyncReport, actor: Member
+    ) -> set[str]:
+        """Eine Drive-Change-Zeile auf `documents` / `drive_folders` anwenden.
+
+        Gibt die Ordner zurueck, deren Listing sich dadurch aendert.
+        """
+        if change.get("changeType", "file") != "file":
+            return set()
+        fid = change.get("fileId")
+        item = change.get("file") or {}
+        gone = bool(change.get("removed") or item.get("trashed"))
+        parents = item.get("parents") or []
+        affected = set(parents[:1])
+
+        previous_folder = DriveFolder.query.filter_by(drive_folder_id=fid).one_or_none()
+        if previous_folder is not None:
+            affected.update(filter(None, (fid, previous_folder.parent_id)))
+        if gone:
+            DriveSearchIndex.remove([fid])
+        if gone and previous_folder is not None:
+            # Entfernte Eintraege liefern oft kein `file` mehr (MIME unbekannt)
+            db.session.delete(previous_folder)
+            if has_request_context():
+                g.pop("_drive_folder_tree", None)
+        if item.get("mimeType") == GOOGLE_FOLDER_MIME:
+            if not gone:
+                cls._remember_folders([item])
+            return affected
+
+        existing = Document.query.filter_by(drive_file_id=fid).one_or_none()
+        if existing is not None:
+            affected.add(existing.drive_parent_id)
+        if gone or not parents:
+            if existing is None:
+                return affected
+            oid = existing.id
+            db.session.delete(existing)
+            db.session.flush()
             report.orphans_removed += 1
             SecurityService.log_audit_event(
                 AuditAction.DOCUMENT_AUTO_REMOVED,
@@ -1353,25 +2249,108 @@ class DriveStorageService:
                 entity_id=oid,
                 actor_id=actor.id,
                 extra_data={
-                    "reason": "orphan_after_resync",
-                    "drive_file_id": dfid,
+                    "reason": "drive_change_trashed"
+                    if item.get("trashed")
+                    else "drive_change_removed",
+                    "drive_file_id": fid,
                 },
             )
-        db.session.commit()
+            return affected
 
-        report.finished_at = datetime.utcnow()
+        parent_id = parents[0]
+        report.files_seen += 1
+        DriveSearchIndex.upsert_page([item])
+        now = datetime.utcnow()
+        if existing is None:
+            doc = Document(
+                drive_file_id=fid,
+                drive_parent_id=parent_id,
+                uploader_id=None,
+                last_seen_at=now,
+            )
+            db.session.add(doc)
+            db.session.flush()
+            report.imported += 1
+            SecurityService.log_audit_event(
+                AuditAction.DOCUMENT_AUTO_IMPORTED,
+                entity="document",
+                entity_id=doc.id,
+                actor_id=actor.id,
+                extra_data={"drive_file_id": fid, "drive_parent_id": parent_id},
+            )
+        else:
+            if existing.drive_parent_id != parent_id:
+                existing.drive_parent_id = parent_id
+                report.parent_updates += 1
+            existing.last_seen_at = now
+        return affected
+
+    @staticmethod
+    def _sync_state(drive_id: str) -> DriveSyncState:
+        state = DriveSyncState.query.filter_by(drive_id=drive_id).one_or_none()
+        if state is None:
+            state = DriveSyncState(drive_id=drive_id)
+            db.session.add(state)
+        return state
+
+    @staticmethod
+    @_drive_retry
+    def _drive_start_page_token(drive, drive_id: str) -> str | None:
+        response = (
+            drive.changes()
+            .getStartPageToken(driveId=drive_id, supportsAllDrives=True)
+            .execute()
+        )
+        return response.get("startPageToken")
+
+    @staticmethod
+    @_drive_retry
+    def _drive_list_changes(drive, drive_id: str, page_token: str) -> dict:
+        return (
+            drive.changes()
+            .list(
+                pageToken=page_token,
+                driveId=drive_id,
+                includeItemsFromAllDrives=True,
+                supportsAllDrives=True,
+                includeRemoved=True,
+                fields=(
+                    "nextPageToken, newStartPageToken, changes(changeType, fileId, "
+                    "removed, file(id, name, mimeType, parents, trashed, webViewLink))"
+                ),
+                pageSize=1000,
+            )
+            .execute()
+        )
+
+    @staticmethod
+    def _is_expired_page_token_error(exc: BaseException) -> bool:
+        try:
+            from googleapiclient.errors import HttpError
+        except ImportError:
+            return False
+        if not isinstance(exc, HttpError):
+            return False
+        status = getattr(exc.resp, "status", None)
+        try:
+            return int(status) in {404, 410}
+        except (TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def _log_resync_ran(report: ResyncReport, actor: Member) -> None:
         SecurityService.log_audit_event(
             AuditAction.DRIVE_RESYNC_RAN,
             entity="document",
             actor_id=actor.id,
             extra_data={
+                "mode": report.mode,
                 "imported": report.imported,
                 "parent_updates": report.parent_updates,
                 "orphans_removed": report.orphans_removed,
                 "files_seen": report.files_seen,
             },
         )
-        return report
 
     # -- Member-Lifecycle ---------------------------------------------------
 
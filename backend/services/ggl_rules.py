@@ -1,17 +1,83 @@
-from collections import defaultdict
+from collections import Counter
 from datetime import datetime
+from itertools import accumulate
 
+from flask import g, has_request_context
 from markupsafe import Markup, escape
+from sqlalchemy import and_, func
 from sqlalchemy.orm import joinedload
 
 from backend.models.participation import Participation
 from backend.models.event import Event
 from backend.models.member import Member
+from backend.models.ggl_season_standing import GGLSeasonStanding
 from backend.extensions import db
 
+class GGLRequestCache:
+    """Request-lokaler Speicher für GGL-Berechnungen (Rangliste, Mitglieder-Saisonwerte).
+
+    Lebt in flask.g und damit genau einen Request lang. Schreibende
+    GGLService-Methoden invalidieren die betroffene Saison.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self.members = {}
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def get_or_compute(self, kind, key, compute):
+        cache_key = (kind,) + key
+        if cache_key in self._entries:
+            self.hits[kind] += 1
+        else:
+            self.misses[kind] += 1
+            self._entries[cache_key] = compute()
+        return self._entries[cache_key]
+
+    def invalidate_season(self, season_year):
+        # Saison ist bei allen Einträgen das letzte Key-Element
+        self._entries = {
+            k: v for k, v in self._entries.items() if k[-1] != season_year
+        }
+
+
 class GGLService:
     """GGL (Gourmen Guessing League) service for points calculation and ranking"""
+
+    @staticmethod
+    def request_cache():
+        """GGLRequestCache des laufenden Requests; None ausserhalb eines Requests (Scripts, Cron)."""
+        if not has_request_context():
+            return None
+        cache = g.get('_ggl_request_cache')
+        if cache is None:
+            cache = g._ggl_request_cache = GGLRequestCache()
+        return cache
     
+    @staticmethod
+    def members_by_id(member_ids) -> dict:
+        """Member-Objekte für Ranglisten/Verlauf in einer IN-Query; im Request über alle Tabs geteilt."""
+        cache = GGLService.request_cache()
+        known = cache.members if cache is not None else {}
+        missing = set(member_ids) - set(known)
+        if missing:
+            for member in Member.query.filter(Member.id.in_(missing)).all():
+                known[member.id] = member
+            if cache is not None:
+                cache.misses['members'] += 1
+        elif cache is not None:
+            cache.hits['members'] += 1
+        return {mid: known[mid] for mid in member_ids if mid in known}
+
+    @staticmethod
+    def attach_members(ranking):
+        """Ergänzt jede Ranglistenzeile um 'member' (Member-Objekt) ohne Query pro Zeile."""
+        members = GGLService.members_by_id([row['member_id'] for row in ranking])
+        for row in ranking:
+            row['member'] = members.get(row['member_id'])
+        return ranking
+
     @staticmethod
     def calculate_event_points(event_id):
         """Calculate points for all participants in an event"""
@@ -42,6 +108,8 @@ class GGLService:
             participation.rank = rank
             participation.points = points
         
+        GGLService.refresh_season_standings(sorted_participations[0].event.season)
+
         # Update database
         db.session.commit()
         
@@ -81,70 +149,225 @@ class GGLService:
     
     @staticmethod
     def get_season_ranking(season_year):
-        """Saison-Rangliste (Tab Tabelle): Sortierung nach Gesamtpunkten, bei Gleichstand nach ØPkt (beides absteigend)."""
-        # Get all events in the season
-        events = Event.query.filter_by(season=season_year).all()
-        
-        # Collect all participations with valid guesses
-        member_points = defaultdict(list)
-        member_diffs = defaultdict(list)
-        member_participation_count = defaultdict(int)
-        
-        for event in events:
-            participations = Participation.query.filter_by(
-                event_id=event.id,
-                teilnahme=True
-            ).filter(
-                Participation.guess_bill_amount_rappen.isnot(None)
-            ).all()
-            
-            for participation in participations:
-                if participation.points is not None:
-                    member_points[participation.member_id].append(participation.points)
-                    member_participation_count[participation.member_id] += 1
-                if participation.diff_amount_rappen is not None:
-                    member_diffs[participation.member_id].append(participation.diff_amount_rappen)
-        
-        # Alle aktiven Spieler aufführen (auch ohne Teilnahme = 0 Punkte / 0 Events)
-        active_members = Member.query.filter_by(is_active=True).all()
-        season_stats = []
-        for member in active_members:
-            member_id = member.id
-            points_list = member_points.get(member_id, [])
-            total_points = sum(points_list)
-            participation_count = member_participation_count.get(member_id, 0)
-            avg_points = total_points / participation_count if participation_count > 0 else 0
-
-            # Calculate average difference
-            diffs_list = member_diffs.get(member_id, [])
-            total_diff = sum(diffs_list)
-            avg_diff_rappen = total_diff / len(diffs_list) if len(diffs_list) > 0 else 0
+        """Saison-Rangliste (Tab Tabelle): Sortierung nach Gesamtpunkten, bei Gleichstand nach ØPkt (beides absteigend).
+
+        Liest die materialisierte Tabelle ggl_season_standings (eine indizierte
+        Query). Aktive Mitglieder ohne Zeile haben in der Saison nicht geschätzt.
+        """
+        cache = GGLService.request_cache()
+        if cache is None:
+            return GGLService._load_season_ranking(season_year)
+        ranking = cache.get_or_compute(
+            'ranking', (season_year,), lambda: GGLService._load_season_ranking(season_year)
+        )
+        # Kopien: Aufrufer ergänzen Zeilen (z. B. 'member'), der Cache bleibt unverändert
+        return [dict(row) for row in ranking]
+
+    @staticmethod
+    def _load_season_ranking(season_year):
+        # Nur lesen: ohne Zeilen hat in der Saison niemand geschätzt (alle 0 Punkte).
+        # Geschrieben wird ausschliesslich über refresh_season_standings in den Schreibpfaden.
+        return GGLService._stored_season_ranking(season_year, missing_as_none=False)
+
+    @staticmethod
+    def _stored_season_ranking(season_year, missing_as_none=True):
+        """Rangliste aus ggl_season_standings; None, wenn die Saison keine Zeilen hat (ausser missing_as_none=False)."""
+        rows = (
+            db.session.query(Member.id, GGLSeasonStanding)
+            .outerjoin(
+                GGLSeasonStanding,
+                and_(
+                    GGLSeasonStanding.member_id == Member.id,
+                    GGLSeasonStanding.season == season_year,
+                ),
+            )
+            .filter(Member.is_active.is_(True))
+            .order_by(Member.id)
+            .all()
+        )
 
+        if missing_as_none and rows and all(standing is None for _, standing in rows):
+            return None
+
+        season_stats = []
+        for member_id, standing in rows:
+            if standing is None:
+                season_stats.append(GGLService._ranking_row(member_id, 0, 0, 0, 0))
+                continue
             season_stats.append({
                 'member_id': member_id,
-                'total_points': total_points,
-                'participation_count': participation_count,
-                'avg_points': avg_points,
-                'avg_diff_rappen': avg_diff_rappen,
-                'events_ranked': len(points_list)
+                'total_points': GGLService._points_value(standing.total_points),
+                'participation_count': standing.events_ranked,
+                'avg_points': standing.avg_points,
+                'avg_diff_rappen': standing.avg_diff_rappen,
+                'events_ranked': standing.events_ranked
             })
-        
+
+        # Rang beim Lesen neu setzen: deaktivierte Mitglieder fallen raus, neue kommen mit 0 dazu
+        GGLService._assign_tie_aware_ranks(season_stats)
+        return season_stats
+
+    @staticmethod
+    def _season_aggregate_rows(season_year, active_only=True):
+        """Ein Aggregat pro Mitglied: (member_id, Punkte, gewertete Events, Diff-Summe, Diff-Anzahl, Schätzungen, aktiv)."""
+        # Ein gruppiertes Aggregat pro Mitglied (statt einer Participation-Query pro Event).
+        # SUM/COUNT ignorieren NULL: Punkte und Differenzen werden wie bisher getrennt gezählt.
+        season_agg = (
+            db.session.query(
+                Participation.member_id.label('member_id'),
+                func.sum(Participation.points).label('total_points'),
+                func.count(Participation.points).label('events_ranked'),
+                func.sum(Participation.diff_amount_rappen).label('total_diff'),
+                func.count(Participation.diff_amount_rappen).label('diff_count'),
+                func.count(Participation.id).label('guesses_count'),
+            )
+            .join(Event, Event.id == Participation.event_id)
+            .filter(
+                Event.season == season_year,
+                Participation.teilnahme.is_(True),
+                Participation.guess_bill_amount_rappen.isnot(None),
+            )
+            .group_by(Participation.member_id)
+            .subquery()
+        )
+
+        # Alle aktiven Spieler aufführen (auch ohne Teilnahme = 0 Punkte / 0 Events)
+        query = (
+            db.session.query(
+                Member.id,
+                season_agg.c.total_points,
+                season_agg.c.events_ranked,
+                season_agg.c.total_diff,
+                season_agg.c.diff_count,
+                season_agg.c.guesses_count,
+                Member.is_active,
+            )
+            .outerjoin(season_agg, season_agg.c.member_id == Member.id)
+        )
+        if active_only:
+            query = query.filter(Member.is_active.is_(True))
+        return query.order_by(Member.id).all()
+
+    @staticmethod
+    def _ranking_row(member_id, total_points, events_ranked, total_diff, diff_count) -> dict:
+        """Tabellenzeile aus den Aggregaten eines Mitglieds (ohne Rang)."""
+        total_points = total_points or 0
+        participation_count = events_ranked or 0
+        avg_points = total_points / participation_count if participation_count > 0 else 0
+        avg_diff_rappen = (total_diff or 0) / diff_count if diff_count else 0
+        return {
+            'member_id': member_id,
+            'total_points': total_points,
+            'participation_count': participation_count,
+            'avg_points': avg_points,
+            'avg_diff_rappen': avg_diff_rappen,
+            'events_ranked': participation_count
+        }
+
+    @staticmethod
+    def _points_value(value):
+        """Gespeicherte Float-Punkte wie die Live-Summe liefern (ganzzahlig als int)."""
+        if value is None:
+            return 0
+        return int(value) if float(value).is_integer() else value
+
+    @staticmethod
+    def _compute_season_ranking(season_year):
+        """Live-Berechnung der Saison-Rangliste direkt aus den Participation-Zeilen."""
+        season_stats = [
+            GGLService._ranking_row(member_id, total_points, events_ranked, total_diff, diff_count)
+            for member_id, total_points, events_ranked, total_diff, diff_count, _, _ in
+            GGLService._season_aggregate_rows(season_year)
+        ]
+        GGLService._assign_tie_aware_ranks(season_stats)
+        return season_stats
+
+    @staticmethod
+    def refresh_season_standings(season_year):
+        """ggl_season_standings für eine Saison neu schreiben (ohne Commit) und die Rangliste zurückgeben.
+
+        Ränge aller Mitglieder können sich ändern: Aufrufer verwerfen nach dem
+        Commit alle Dashboard-Snapshots (DashboardSnapshotService.invalidate_all).
+        """
+        cache = GGLService.request_cache()
+        if cache is not None:
+            cache.invalidate_season(season_year)
+        season_stats, _ = GGLService._write_season_standings(season_year)
+        return season_stats
+
+    @staticmethod
+    def _write_season_standings(season_year):
+        """Ersetzt die Zeilen einer Saison; liefert (Rangliste, Anzahl geschriebener Zeilen)."""
+        # Auch inaktive Mitglieder speichern: bei Reaktivierung stimmt die Tabelle ohne Refresh.
+        rows = GGLService._season_aggregate_rows(season_year, active_only=False)
+
+        all_stats = []
+        season_stats = []
+        for member_id, total_points, events_ranked, total_diff, diff_count, guesses, is_active in rows:
+            stats = GGLService._ranking_row(member_id, total_points, events_ranked, total_diff, diff_count)
+            all_stats.append((stats, guesses or 0))
+            if is_active:
+                season_stats.append(stats)
+        GGLService._assign_tie_aware_ranks(season_stats)
+
+        GGLSeasonStanding.query.filter_by(season=season_year).delete(synchronize_session=False)
+        now = datetime.utcnow()
+        standings = [
+            GGLSeasonStanding(
+                member_id=stats['member_id'],
+                season=season_year,
+                total_points=stats['total_points'],
+                avg_points=stats['avg_points'],
+                avg_diff_rappen=stats['avg_diff_rappen'],
+                events_ranked=stats['events_ranked'],
+                guesses_count=guesses,
+                rank=stats.get('rank'),
+                updated_at=now,
+            )
+            for stats, guesses in all_stats
+            if guesses > 0
+        ]
+        db.session.add_all(standings)
+        db.session.flush()
+        return season_stats, len(standings)
+
+    @staticmethod
+    def verify_season_standings(season_year) -> list[str]:
+        """Vergleicht ggl_season_standings mit der Live-Berechnung; liefert Abweichungen als Text."""
+        live = {row['member_id']: row for row in GGLService._compute_season_ranking(season_year)}
+        stored_ranking = GGLService._stored_season_ranking(season_year)
+        if stored_ranking is None:
+            if any(row['participation_count'] or row['avg_diff_rappen'] for row in live.values()):
+                return [f'Saison {season_year}: nicht materialisiert']
+            return []
+        stored = {row['member_id']: row for row in stored_ranking}
+        problems = []
+        for member_id in sorted(set(live) | set(stored)):
+            live_row = live.get(member_id)
+            stored_row = stored.get(member_id)
+            if live_row != stored_row:
+                problems.append(
+                    f'Saison {season_year}, Mitglied {member_id}: '
+                    f'gespeichert={stored_row} live={live_row}'
+                )
+        return problems
+
+    @staticmethod
+    def _assign_tie_aware_ranks(season_stats: list) -> None:
+        """Sortiert die Tabellenzeilen in-place und setzt 'rank' (gleiche (Punkte, ØPkt) => gleicher Rang)."""
         # Sort by total points (descending), then by average points (descending)
-        season_stats.sort(key=lambda x: (x['total_points'], x['avg_points']), reverse=True)
-        
-        # Tie-aware Ranking: gleiche (Punkte, ØPkt) => gleicher Rang
+        season_stats.sort(key=GGLService._ggl_season_table_sort_key, reverse=True)
+
         current_rank = 1
         prev_key = None
         for i, stats in enumerate(season_stats):
-            key = (stats['total_points'], stats['avg_points'])
+            key = GGLService._ggl_season_table_sort_key(stats)
             if prev_key is None:
                 current_rank = 1
             elif key != prev_key:
                 current_rank = i + 1
             stats['rank'] = current_rank
             prev_key = key
-        
-        return season_stats
 
     @staticmethod
     def _ggl_season_table_sort_key(row: dict) -> tuple:
@@ -176,6 +399,45 @@ class GGLService:
     @staticmethod
     def get_member_season_stats(member_id, season_year):
         """Get season statistics for a specific member"""
+        cache = GGLService.request_cache()
+        if cache is None:
+            return GGLService._load_member_season_stats(member_id, season_year)
+        stats = cache.get_or_compute(
+            'member_stats',
+            (member_id, season_year),
+            lambda: GGLService._load_member_season_stats(member_id, season_year),
+        )
+        return dict(stats)
+
+    @staticmethod
+    def _load_member_season_stats(member_id, season_year):
+        standing = GGLSeasonStanding.query.filter_by(
+            member_id=member_id,
+            season=season_year
+        ).first()
+        if standing is None:
+            # Keine Zeile: keine Schätzung oder Saison nicht materialisiert
+            return GGLService._compute_member_season_stats(member_id, season_year)
+
+        total_events_in_season = Event.query.filter(
+            Event.season == season_year,
+            Event.published == True
+        ).count()
+
+        return {
+            'member_id': member_id,
+            'season': season_year,
+            'total_points': GGLService._points_value(standing.total_points),
+            'participation_count': standing.guesses_count,
+            'avg_points': standing.avg_points,
+            'avg_diff_rappen': standing.avg_diff_rappen,
+            'events_ranked': standing.events_ranked,
+            'total_events_in_season': total_events_in_season
+        }
+
+    @staticmethod
+    def _compute_member_season_stats(member_id, season_year):
+        """Live-Berechnung von get_member_season_stats aus den Participation-Zeilen."""
         # Get all events in the season where member participated
         participations = db.session.query(Participation).join(Event).filter(
             Participation.member_id == member_id,
@@ -243,181 +505,85 @@ class GGLService:
     @staticmethod
     def get_season_progression_data(season_year):
         """Get season progression data for chart visualization"""
-        # Get all events in the season, ordered by date
-        all_events = Event.query.filter_by(season=season_year).order_by(Event.datum).all()
-        
-        if not all_events:
+        # Alle gewerteten Schätzungen der Saison in einer Query (Events in Datumsreihenfolge)
+        rows = (
+            db.session.query(
+                Event,
+                Participation.member_id,
+                Participation.points,
+                Participation.guess_bill_amount_rappen,
+            )
+            .join(Participation, Participation.event_id == Event.id)
+            .filter(
+                Event.season == season_year,
+                Participation.teilnahme.is_(True),
+                Participation.guess_bill_amount_rappen.isnot(None),
+                Participation.points.isnot(None),
+            )
+            .order_by(Event.datum, Event.id)
+            .all()
+        )
+
+        if not rows:
             return {
                 'events': [],
                 'members': [],
                 'progression_data': {}
             }
-        
-        # Filter events that have points awarded
+
         events_with_points = []
-        for event in all_events:
-            participations = Participation.query.filter_by(
-                event_id=event.id,
-                teilnahme=True
-            ).filter(
-                Participation.guess_bill_amount_rappen.isnot(None)
-            ).all()
-            
-            valid_participations = [p for p in participations if p.points is not None]
-            if valid_participations:
+        event_col = {}
+        for event, _, _, _ in rows:
+            if event.id not in event_col:
+                event_col[event.id] = len(events_with_points)
                 events_with_points.append(event)
-        
-        if not events_with_points:
-            return {
-                'events': [],
-                'members': [],
-                'progression_data': {}
-            }
-        
-        # Get all members who participated in at least one event with points
-        member_ids = set()
-        for event in events_with_points:
-            participations = Participation.query.filter_by(
-                event_id=event.id,
-                teilnahme=True
-            ).filter(
-                Participation.guess_bill_amount_rappen.isnot(None)
-            ).all()
-            
-            for participation in participations:
-                if participation.points is not None:
-                    member_ids.add(participation.member_id)
-        
-        # Get member details
-        members = Member.query.filter(Member.id.in_(member_ids)).all()
-        
-        # Build progression data
-        progression_data = {}
-        for member in members:
-            progression_data[member.id] = {
-                'member': member,
-                'cumulative_points': [],
-                'cumulative_signed_diff_rappen': [],
-                'cumulative_abs_diff_rappen': [],
-                'ranks': []
-            }
-        
-        # Calculate cumulative points and ranks for each event with points
-        for event in events_with_points:
-            # Get participations for this event
-            participations = Participation.query.filter_by(
-                event_id=event.id,
-                teilnahme=True
-            ).filter(
-                Participation.guess_bill_amount_rappen.isnot(None)
-            ).all()
-            
-            # Filter participations with points
-            valid_participations = [p for p in participations if p.points is not None]
-            
-            # Sort by points (descending) to calculate ranks
-            sorted_participations = sorted(valid_participations, key=lambda p: p.points, reverse=True)
-            
-            # Calculate ranks
-            ranks = {}
-            current_rank = 1
-            for i, participation in enumerate(sorted_participations):
-                if i > 0 and participation.points < sorted_participations[i-1].points:
-                    current_rank = i + 1
-                ranks[participation.member_id] = current_rank
-            
-            # Update progression data
-            for member_id in member_ids:
-                if member_id in ranks:
-                    # Member participated in this event
-                    participation = next(p for p in valid_participations if p.member_id == member_id)
-                    current_points = participation.points
-                    previous_total = progression_data[member_id]['cumulative_points'][-1] if progression_data[member_id]['cumulative_points'] else 0
-                    # Handle None values from previous events
-                    if previous_total is None:
-                        previous_total = 0
-                    new_total = previous_total + current_points
-
-                    prev_diff = (
-                        progression_data[member_id]['cumulative_signed_diff_rappen'][-1]
-                        if progression_data[member_id]['cumulative_signed_diff_rappen']
-                        else 0
-                    )
-                    if prev_diff is None:
-                        prev_diff = 0
-                    if (
-                        event.rechnungsbetrag_rappen is not None
-                        and participation.guess_bill_amount_rappen is not None
-                    ):
-                        event_signed = (
-                            participation.guess_bill_amount_rappen
-                            - event.rechnungsbetrag_rappen
-                        )
-                    else:
-                        event_signed = 0
-                    new_diff = prev_diff + event_signed
-                    prev_abs_diff = (
-                        progression_data[member_id]['cumulative_abs_diff_rappen'][-1]
-                        if progression_data[member_id]['cumulative_abs_diff_rappen']
-                        else 0
-                    )
-                    if prev_abs_diff is None:
-                        prev_abs_diff = 0
-                    new_abs_diff = prev_abs_diff + abs(event_signed)
-                    
-                    progression_data[member_id]['cumulative_points'].append(new_total)
-                    progression_data[member_id]['cumulative_signed_diff_rappen'].append(new_diff)
-                    progression_data[member_id]['cumulative_abs_diff_rappen'].append(new_abs_diff)
-                    progression_data[member_id]['ranks'].append(ranks[member_id])
-                else:
-                    # Member didn't participate in this event - keep previous total
-                    previous_total = progression_data[member_id]['cumulative_points'][-1] if progression_data[member_id]['cumulative_points'] else 0
-                    if previous_total is None:
-                        previous_total = 0
-                    prev_diff = (
-                        progression_data[member_id]['cumulative_signed_diff_rappen'][-1]
-                        if progression_data[member_id]['cumulative_signed_diff_rappen']
-                        else 0
-                    )
-                    if prev_diff is None:
-                        prev_diff = 0
-                    prev_abs_diff = (
-                        progression_data[member_id]['cumulative_abs_diff_rappen'][-1]
-                        if progression_data[member_id]['cumulative_abs_diff_rappen']
-                        else 0
-                    )
-                    if prev_abs_diff is None:
-                        prev_abs_diff = 0
-                    
-                    progression_data[member_id]['cumulative_points'].append(previous_total)
-                    progression_data[member_id]['cumulative_signed_diff_rappen'].append(prev_diff)
-                    progression_data[member_id]['cumulative_abs_diff_rappen'].append(prev_abs_diff)
-                    progression_data[member_id]['ranks'].append(None)
-        
-        # Convert members to serializable format
+
+        members_lookup = GGLService.members_by_id({row[1] for row in rows})
+        members = [members_lookup[mid] for mid in sorted(members_lookup)]
+        member_row = {member.id: i for i, member in enumerate(members)}
+
+        # Dichte Mitglied×Event-Matrizen: Punkte (None = keine gewertete Schätzung)
+        # und signierte Differenz Schätzung − Rechnung (0 ohne Rechnungsbetrag)
+        n_events = len(events_with_points)
+        points = [[None] * n_events for _ in members]
+        signed = [[0] * n_events for _ in members]
+        for event, member_id, event_points, guess in rows:
+            i, j = member_row[member_id], event_col[event.id]
+            points[i][j] = event_points
+            if event.rechnungsbetrag_rappen is not None:
+                signed[i][j] = guess - event.rechnungsbetrag_rappen
+
+        # Rang pro Event: erste Position der Punktzahl in der absteigend sortierten Spalte
+        # (gleiche Punkte => gleicher Rang, danach Lücke)
+        ranks = [[None] * n_events for _ in members]
+        for j in range(n_events):
+            column = sorted(
+                (row[j] for row in points if row[j] is not None), reverse=True
+            )
+            first_rank = {}
+            for pos, value in enumerate(column, start=1):
+                first_rank.setdefault(value, pos)
+            for i, row in enumerate(points):
+                if row[j] is not None:
+                    ranks[i][j] = first_rank[row[j]]
+
         serializable_members = []
-        for member in members:
-            serializable_members.append({
+        serializable_progression_data = {}
+        for i, member in enumerate(members):
+            member_data = {
                 'id': member.id,
                 'display_name': member.display_name,
                 'spirit_animal': member.spirit_animal
-            })
-        
-        # Convert progression data to serializable format
-        serializable_progression_data = {}
-        for member_id, data in progression_data.items():
-            serializable_progression_data[member_id] = {
-                'member': {
-                    'id': data['member'].id,
-                    'display_name': data['member'].display_name,
-                    'spirit_animal': data['member'].spirit_animal
-                },
-                'cumulative_points': data['cumulative_points'],
-                'cumulative_signed_diff_rappen': data['cumulative_signed_diff_rappen'],
-                'cumulative_abs_diff_rappen': data['cumulative_abs_diff_rappen'],
-                'ranks': data['ranks']
             }
-        
+            serializable_members.append(dict(member_data))
+            serializable_progression_data[member.id] = {
+                'member': member_data,
+                'cumulative_points': list(accumulate(p or 0 for p in points[i])),
+                'cumulative_signed_diff_rappen': list(accumulate(signed[i])),
+                'cumulative_abs_diff_rappen': list(accumulate(abs(d) for d in signed[i])),
+                'ranks': ranks[i]
+            }
+
         return {
             'events': events_with_points,
             'members': serializable_members,
@@ -559,11 +725,7 @@ class GGLService:
             and member_id in leading_ids
         )
 
-        member_ids = {row['member_id'] for row in ranking}
-        members_by_id = {}
-        if member_ids:
-            for m in Member.query.filter(Member.id.in_(member_ids)).all():
-                members_by_id[m.id] = m
+        members_by_id = GGLService.members_by_id([row['member_id'] for row in ranking])
 
         def _label(mid: int) -> str:
             m = members_by_id.get(mid)
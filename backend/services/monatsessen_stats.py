@@ -1,13 +1,18 @@
 """Aggregierte Statistiken für vergangene Monatsessen (Events-Index Tab Statistiken)."""
 from __future__ import annotations
 
+import threading
+import time as time_module
 from collections import Counter, defaultdict
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime
 from statistics import mean
 from typing import Any
 
+from flask import current_app
 from sqlalchemy import and_, func, or_
 
+from backend.extensions import db
 from backend.models.event import Event, EventType
 from backend.models.member import Member
 from backend.models.participation import Participation, Esstyp
@@ -31,34 +36,57 @@ def _event_restaurant_label(event: Event) -> str:
     return (event.restaurant or event.place_name or '').strip() or '—'
 
 
-def _homepage_for_restaurant_label(past_ms: list[Event], label: str) -> str | None:
-    """Neuestes Event mit gleichem Restaurant-Label: Website bevorzugt `place_website`, sonst `website`."""
-    matching = [e for e in past_ms if _event_restaurant_label(e) == label]
-    matching.sort(key=lambda e: e.datum, reverse=True)
-    for e in matching:
-        u = (e.place_website or e.website or '').strip()
-        if u:
-            return u
-    return None
-
-
-def _meta_for_restaurant_label(past_ms: list[Event], label: str) -> tuple[str | None, str | None]:
-    """Nimmt das neueste Event je Restaurant-Label und liefert Küche + Adresse für Suche/Anzeige."""
-    matching = [e for e in past_ms if _event_restaurant_label(e) == label]
-    matching.sort(key=lambda e: e.datum, reverse=True)
-    if not matching:
-        return None, None
-    ev = matching[0]
-    cuisine = (ev.kueche or '').strip() or None
-    address = (ev.place_address or '').strip() or None
-    return cuisine, address
-
-
-def _latest_event_for_restaurant_label(past_ms: list[Event], label: str) -> Event | None:
-    matching = [e for e in past_ms if _event_restaurant_label(e) == label]
-    if not matching:
-        return None
-    return max(matching, key=lambda e: e.datum)
+@dataclass
+class RestaurantLabelGroup:
+    """Alle Events eines Restaurant-Labels, neuestes zuerst, mit vorberechneten Anzeige-Feldern."""
+
+    label: str
+    events: list[Event]
+    latest: Event
+    homepage: str | None
+    kueche: str | None
+    adresse: str | None
+
+
+class RestaurantLabelIndex:
+    """
+    Gruppiert Events in einem Durchlauf nach Restaurant-Label (statt pro Label
+    erneut über alle Events zu scannen). Bei gleichem Datum gewinnt – wie bisher –
+    das Event, das in der Eingabeliste zuerst kommt.
+    """
+
+    def __init__(self, events: list[Event]):
+        self.label_by_event_id: dict[int, str] = {}
+        grouped: dict[str, list[Event]] = defaultdict(list)
+        for ev in events:
+            label = _event_restaurant_label(ev)
+            self.label_by_event_id[ev.id] = label
+            grouped[label].append(ev)
+
+        self.groups: dict[str, RestaurantLabelGroup] = {}
+        for label, label_events in grouped.items():
+            # stabil: gleiche Daten behalten die Eingabereihenfolge
+            newest_first = sorted(label_events, key=lambda e: e.datum, reverse=True)
+            latest = newest_first[0]
+            homepage = next(
+                (
+                    u
+                    for u in ((e.place_website or e.website or '').strip() for e in newest_first)
+                    if u
+                ),
+                None,
+            )
+            self.groups[label] = RestaurantLabelGroup(
+                label=label,
+                events=newest_first,
+                latest=latest,
+                homepage=homepage,
+                kueche=(latest.kueche or '').strip() or None,
+                adresse=(latest.place_address or '').strip() or None,
+            )
+
+    def sorted_labels(self) -> list[str]:
+        return sorted(self.groups)
 
 
 def _landing_hitlist_sort_key(row: dict[str, Any]) -> tuple:
@@ -115,24 +143,12 @@ def get_landing_extras(now: datetime) -> dict[str, Any]:
 
 _HITLIST_SORT_KEYS = frozenset({'rating', 'recent', 'name'})
 
+# Öffentliche Seiten (Landing, /restaurants): Index pro App-Instanz, stale-while-revalidate.
+_HITLIST_CACHE_KEY = 'public_hitlist_cache'
 
-def get_landing_restaurant_table(
-    now: datetime,
-    page: int = 1,
-    per_page: int = 10,
-    query: str | None = None,
-    sort: str | None = None,
-) -> tuple[list[dict[str, Any]], int, int, int, int]:
-    """
-    Öffentliche Landing-Hitlist: alle Monatsessen-Restaurants bis einschliesslich heute,
-    ausser Events mit deaktivierten Bewertungen (allow_ratings=False).
-
-    Rückgabe: (page_rows, filtered_total, total_pages, page, baseline_total)
-    baseline_total = Anzahl Einträge vor Textsuche (für Hero „Restaurant-Count“).
 
-    ``sort``: ``rating`` (Standard, Ø absteigend), ``recent`` (zuletzt besucht zuerst), ``name`` (A-Z).
-    """
-    today = now.date()
+def _build_landing_hitlist_rows(today: date) -> list[dict[str, Any]]:
+    """Alle Hitlist-Zeilen (ein Eintrag pro Restaurant-Label), unsortiert nach Label."""
     past_ms: list[Event] = (
         Event.query.filter(
             Event.published.is_(True),
@@ -148,45 +164,122 @@ def get_landing_restaurant_table(
         .all()
     )
     if not past_ms:
-        return [], 0, 1, 1, 0
+        return []
 
     event_ids = [e.id for e in past_ms]
     ratings_rows: list[EventRating] = EventRating.query.filter(
         EventRating.event_id.in_(event_ids)
     ).all()
-    event_to_restaurant_label: dict[int, str] = {
-        ev.id: _event_restaurant_label(ev) for ev in past_ms
-    }
+    label_index = RestaurantLabelIndex(past_ms)
     restaurant_rating_vals: dict[str, list[float]] = defaultdict(list)
     for row in ratings_rows:
-        eid = row.event_id
-        label = event_to_restaurant_label.get(eid, '—')
+        label = label_index.label_by_event_id.get(row.event_id, '—')
         restaurant_rating_vals[label].append(float(row.average_rating))
 
-    labels = sorted({_event_restaurant_label(e) for e in past_ms})
-
     rows_full: list[dict[str, Any]] = []
-    for label in labels:
-        latest_ev = _latest_event_for_restaurant_label(past_ms, label)
-        if not latest_ev:
-            continue
+    for label in label_index.sorted_labels():
+        group = label_index.groups[label]
+        latest_ev = group.latest
         ovs = restaurant_rating_vals.get(label, [])
         overall_avg = round(mean(ovs), 1) if ovs else None
-        cuisine, address = _meta_for_restaurant_label(past_ms, label)
         ort = (latest_ev.place_locality or '').strip() or None
         rows_full.append(
             {
                 'restaurant': label,
                 'ort': ort,
                 'overall_avg': overall_avg,
-                'homepage': _homepage_for_restaurant_label(past_ms, label),
-                'kueche': cuisine,
-                'adresse': address,
+                'homepage': group.homepage,
+                'kueche': group.kueche,
+                'adresse': group.adresse,
                 'besucht_am': latest_ev.display_date,
                 '_latest_datum': latest_ev.datum,
             }
         )
+    return rows_full
+
+
+def build_public_hitlist_index(now: datetime) -> dict[str, Any]:
+    """Alles, was Landing und /restaurants aus der DB brauchen, in einem Durchlauf."""
+    return {
+        'built_at': time_module.monotonic(),
+        'day': now.date(),
+        'rows': _build_landing_hitlist_rows(now.date()),
+        'extras': get_landing_extras(now),
+        'member_count': Member.query.filter_by(is_active=True).count(),
+    }
+
+
+def _refresh_public_hitlist_index(app, state: dict[str, Any], now: datetime) -> None:
+    try:
+        state['index'] = build_public_hitlist_index(now)
+    except Exception:
+        app.logger.exception('Hitlist-Index: Neuaufbau fehlgeschlagen')
+    finally:
+        state['refreshing'] = False
+
+
+def _refresh_public_hitlist_index_in_background(app, state: dict[str, Any], now: datetime) -> None:
+    with app.app_context():
+        try:
+            _refresh_public_hitlist_index(app, state, now)
+        finally:
+            db.session.remove()
+
+
+def get_public_hitlist_index(now: datetime) -> dict[str, Any]:
+    """
+    Hitlist-Index mit stale-while-revalidate: frisch → direkt; abgelaufen (oder neuer Tag)
+    bis ``PUBLIC_HITLIST_MAX_STALE_SECONDS`` → alter Index, Neuaufbau im Hintergrund;
+    sonst synchron neu bauen.
+    """
+    app = current_app._get_current_object()
+    state = app.extensions.setdefault(
+        _HITLIST_CACHE_KEY, {'index': None, 'refreshing': False, 'lock': threading.Lock()}
+    )
+    index = state['index']
+    if index is not None:
+        age = time_module.monotonic() - index['built_at']
+        if age < app.config.get('PUBLIC_HITLIST_FRESH_SECONDS', 300) and index['day'] == now.date():
+            return index
+        if age < app.config.get('PUBLIC_HITLIST_MAX_STALE_SECONDS', 86400):
+            with state['lock']:
+                if state['refreshing']:
+                    return index
+                state['refreshing'] = True
+            threading.Thread(
+                target=_refresh_public_hitlist_index_in_background,
+                args=(app, state, now),
+                daemon=True,
+            ).start()
+            return index
+
+    index = build_public_hitlist_index(now)
+    state['index'] = index
+    return index
+
 
+def get_landing_restaurant_table(
+    now: datetime,
+    page: int = 1,
+    per_page: int = 10,
+    query: str | None = None,
+    sort: str | None = None,
+) -> tuple[list[dict[str, Any]], int, int, int, int]:
+    """
+    Öffentliche Landing-Hitlist: alle Monatsessen-Restaurants bis einschliesslich heute,
+    ausser Events mit deaktivierten Bewertungen (allow_ratings=False).
+
+    Rückgabe: (page_rows, filtered_total, total_pages, page, baseline_total)
+    baseline_total = Anzahl Einträge vor Textsuche (für Hero „Restaurant-Count“).
+
+    ``sort``: ``rating`` (Standard, Ø absteigend), ``recent`` (zuletzt besucht zuerst), ``name`` (A-Z).
+    Suche, Sortierung und Pagination laufen auf dem gecachten Index (get_public_hitlist_index).
+    """
+    index_rows = get_public_hitlist_index(now)['rows']
+    if not index_rows:
+        return [], 0, 1, 1, 0
+
+    rows_full: list[dict[str, Any]] = [dict(r) for r in index_rows]
     baseline_total = len(rows_full)
 
     sort_key = (sort or 'rating').strip().lower()
@@ -237,109 +330,217 @@ def _organizer_spirit_rufname(member: Member | None) -> str:
     return member.display_spirit_rufname
 
 
-def get_monatsessen_statistics(
-    *,
-    now: datetime,
-    season_year: int | None,
-    organizer_id: int | None,
-    current_member_id: int,
-) -> dict[str, Any] | None:
+# Snapshot aller vergangenen Monatsessen (filterunabhängig), pro App-Instanz gecacht.
+# Neuaufbau nur bei neuem Kalendertag oder geändertem Fingerprint (Events,
+# Teilnahmen, Bewertungen, Mitglieder: Anzahl + letztes updated_at).
+_SNAPSHOT_EXTENSION_KEY = 'monatsessen_stats_snapshot'
+
+
+def _snapshot_fingerprint() -> tuple:
+    """Eine Query: Anzahl und letzte Änderung je Quelltabelle."""
+    row = db.session.query(
+        *(
+            col
+            for model in (Event, Participation, EventRating, Member)
+            for col in (
+                db.session.query(func.count(model.id)).scalar_subquery(),
+                db.session.query(func.max(model.updated_at)).scalar_subquery(),
+            )
+        )
+    ).one()
+    return tuple(row)
+
+
+def get_monatsessen_snapshot(now: datetime) -> dict[str, Any]:
+    """Snapshot aus dem Cache; baut neu, wenn sich Tag oder Fingerprint geändert haben."""
+    today_start = datetime.combine(now.date(), datetime.min.time())
+    fingerprint = _snapshot_fingerprint()
+    cached = current_app.extensions.get(_SNAPSHOT_EXTENSION_KEY)
+    if cached and cached['today_start'] == today_start and cached['fingerprint'] == fingerprint:
+        return cached
+
+    snapshot = build_monatsessen_snapshot(today_start)
+    snapshot['fingerprint'] = fingerprint
+    current_app.extensions[_SNAPSHOT_EXTENSION_KEY] = snapshot
+    return snapshot
+
+
+def build_monatsessen_snapshot(today_start: datetime) -> dict[str, Any]:
     """
-    Liefert Kontext für Tab Statistiken (nur Monatsessen, Filter Jahr/Organisator).
-    Rückgabe None, wenn keine vergangenen Monatsessen im Filter.
+    Filterunabhängige Teile der Statistik für alle vergangenen Monatsessen:
+    Event-Aggregate, Bitsets (Bit i = i-tes Event) für Berechtigung/Zusage je
+    aktivem Mitglied, Teilnahmen mit Zusage je Mitglied und Bewertungs-Buckets.
     """
     # Nur wirklich vergangene Events berücksichtigen:
     # Alles ab heutigem Kalendertag (inkl. heute) gilt als kommend und bleibt draußen.
-    today_start = datetime.combine(now.date(), datetime.min.time())
-
-    q = (
+    past_ms: list[Event] = (
         Event.query.filter(
             Event.published.is_(True),
             Event.event_typ == EventType.MONATSESSEN,
             Event.datum < today_start,
         )
-        .order_by(Event.datum.asc())
+        .order_by(Event.datum.asc(), Event.id.asc())
+        .all()
     )
-    if season_year is not None:
-        q = q.filter(Event.season == season_year)
-    if organizer_id is not None:
-        q = q.filter(Event.organisator_id == organizer_id)
-
-    past_ms: list[Event] = q.all()
-    if not past_ms:
-        return None
-
     event_ids = [e.id for e in past_ms]
+    index_by_event = {ev.id: i for i, ev in enumerate(past_ms)}
+    label_index = RestaurantLabelIndex(past_ms)
+
     parts: list[Participation] = (
         Participation.query.filter(Participation.event_id.in_(event_ids)).all()
+        if event_ids else []
     )
-    part_map: dict[tuple[int, int], Participation] = {
-        (p.event_id, p.member_id): p for p in parts
-    }
-    parts_by_event: dict[int, list[Participation]] = defaultdict(list)
+    ratings_rows: list[EventRating] = (
+        EventRating.query.filter(EventRating.event_id.in_(event_ids)).all()
+        if event_ids else []
+    )
+    active_members: list[Member] = (
+        Member.query.filter_by(is_active=True).order_by(Member.id.asc()).all()
+    )
+
+    shares_by_event: dict[int, list[int]] = defaultdict(list)
+    confirmed_by_event: dict[int, set[int]] = defaultdict(set)
+    billbro_events: set[int] = set()
+    # Teilnahmen mit Zusage je Mitglied (auch inaktive): Event-Index → (Esstyp, Anteil)
+    member_attended: dict[int, dict[int, tuple[str | None, int | None]]] = defaultdict(dict)
     for p in parts:
-        parts_by_event[p.event_id].append(p)
+        if p.guess_bill_amount_rappen is not None or p.calculated_share_rappen is not None:
+            billbro_events.add(p.event_id)
+        if not p.teilnahme:
+            continue
+        confirmed_by_event[p.event_id].add(p.member_id)
+        if p.calculated_share_rappen is not None:
+            shares_by_event[p.event_id].append(p.calculated_share_rappen)
+        member_attended[p.member_id][index_by_event[p.event_id]] = (
+            p.esstyp.name if p.esstyp is not None else None,
+            p.calculated_share_rappen,
+        )
 
-    ratings_rows: list[EventRating] = EventRating.query.filter(
-        EventRating.event_id.in_(event_ids)
-    ).all()
-    event_to_restaurant_label: dict[int, str] = {
-        ev.id: _event_restaurant_label(ev) for ev in past_ms
-    }
-    ratings_by_event: dict[int, list[float]] = defaultdict(list)
-    restaurant_rating_vals: dict[str, dict[str, list[float]]] = defaultdict(
-        lambda: {'food': [], 'drinks': [], 'service': [], 'overall': []}
-    )
+    ratings_by_event: dict[int, list[tuple[float, float, float, float]]] = defaultdict(list)
     for row in ratings_rows:
-        eid = row.event_id
-        ratings_by_event[eid].append(float(row.average_rating))
-        label = event_to_restaurant_label.get(eid, '—')
-        b = restaurant_rating_vals[label]
-        b['food'].append(float(row.food_rating))
-        b['drinks'].append(float(row.drinks_rating))
-        b['service'].append(float(row.service_rating))
-        b['overall'].append(float(row.average_rating))
-
-    active_members: list[Member] = Member.query.filter_by(is_active=True).all()
-    member_by_id = {m.id: m for m in active_members}
+        ratings_by_event[row.event_id].append(
+            (
+                float(row.food_rating),
+                float(row.drinks_rating),
+                float(row.service_rating),
+                float(row.average_rating),
+            )
+        )
+
+    members: list[dict[str, Any]] = []
+    eligible_by_event: list[list[int]] = [[] for _ in past_ms]
+    for m in active_members:
+        eligible_mask = 0
+        confirmed_mask = 0
+        for i, ev in enumerate(past_ms):
+            if not _member_eligible_for_event(m, ev):
+                continue
+            eligible_mask |= 1 << i
+            eligible_by_event[i].append(m.id)
+            if m.id in confirmed_by_event.get(ev.id, ()):
+                confirmed_mask |= 1 << i
+        members.append(
+            {
+                'id': m.id,
+                'label': m.display_name_with_spirit,
+                'rufname': _organizer_spirit_rufname(m),
+                'eligible_mask': eligible_mask,
+                'confirmed_mask': confirmed_mask,
+            }
+        )
+
+    events: list[dict[str, Any]] = []
+    for i, ev in enumerate(past_ms):
+        eligible = eligible_by_event[i]
+        confirmed = confirmed_by_event.get(ev.id, set())
+        shares = shares_by_event.get(ev.id, [])
+        ratings = ratings_by_event.get(ev.id, [])
+        events.append(
+            {
+                'id': ev.id,
+                'datum': ev.datum,
+                'season': ev.season,
+                'organisator_id': ev.organisator_id,
+                'label': label_index.label_by_event_id[ev.id],
+                'trend_label': (ev.restaurant or ev.place_name or '').strip() or 'Monatsessen',
+                'kueche': (ev.kueche or '').strip(),
+                'rechnungsbetrag_rappen': ev.rechnungsbetrag_rappen,
+                'trinkgeld_rappen': ev.trinkgeld_rappen,
+                'has_billbro_data': ev.rechnungsbetrag_rappen is not None or ev.id in billbro_events,
+                'participation_rate': (
+                    100.0 * sum(1 for mid in eligible if mid in confirmed) / len(eligible)
+                    if eligible else None
+                ),
+                'shares': shares,
+                'avg_share_rappen': float(mean(shares)) if shares else None,
+                'ratings': ratings,
+                'overall_avg': float(mean(r[3] for r in ratings)) if ratings else None,
+            }
+        )
+
+    return {
+        'today_start': today_start,
+        'events': events,
+        'members': members,
+        'member_attended': dict(member_attended),
+        # Restaurant-Label → Event-Indizes (neuestes zuerst) für die Bewertungs-Tabelle
+        'restaurants': {
+            label: [index_by_event[ev.id] for ev in group.events]
+            for label, group in label_index.groups.items()
+        },
+    }
+
+
+def get_monatsessen_statistics(
+    *,
+    now: datetime,
+    season_year: int | None,
+    organizer_id: int | None,
+    current_member_id: int,
+) -> dict[str, Any] | None:
+    """
+    Liefert Kontext für Tab Statistiken (nur Monatsessen, Filter Jahr/Organisator).
+    Rückgabe None, wenn keine vergangenen Monatsessen im Filter.
+    Die Filter werden auf dem gecachten Snapshot ausgewertet (siehe get_monatsessen_snapshot).
+    """
+    snapshot = get_monatsessen_snapshot(now)
+
+    selected = [
+        (i, ev)
+        for i, ev in enumerate(snapshot['events'])
+        if (season_year is None or ev['season'] == season_year)
+        and (organizer_id is None or ev['organisator_id'] == organizer_id)
+    ]
+    if not selected:
+        return None
+
+    filter_mask = 0
+    for i, _ in selected:
+        filter_mask |= 1 << i
+    past_ms = [ev for _, ev in selected]
+    member_by_id = {m['id']: m for m in snapshot['members']}
+
+    def _member_label(member_id: int) -> str:
+        m = member_by_id.get(member_id)
+        return m['label'] if m else f'#{member_id}'
+
+    def _member_rufname(member_id: int) -> str:
+        m = member_by_id.get(member_id)
+        return m['rufname'] if m else '—'
 
     # Ø Teilnahmequote je Monatsessen (Mittel der Event-Quoten)
-    event_participation_rates: list[float] = []
-    for ev in past_ms:
-        eligible = [m for m in active_members if _member_eligible_for_event(m, ev)]
-        if not eligible:
-            continue
-        confirmed = 0
-        for m in eligible:
-            p = part_map.get((ev.id, m.id))
-            if p and p.teilnahme:
-                confirmed += 1
-        event_participation_rates.append(100.0 * confirmed / len(eligible))
+    event_participation_rates = [
+        ev['participation_rate'] for ev in past_ms if ev['participation_rate'] is not None
+    ]
     avg_ms_participation_pct = (
         mean(event_participation_rates) if event_participation_rates else 0.0
     )
 
     # Monatsessen mit BillBro-Daten (z. B. Rechnung, Schätzung, berechneter Anteil)
-    count_billbro_monatsessen = 0
-    for ev in past_ms:
-        event_parts = parts_by_event.get(ev.id, [])
-        has_billbro_data = (
-            ev.rechnungsbetrag_rappen is not None
-            or any(
-                (p.guess_bill_amount_rappen is not None)
-                or (p.calculated_share_rappen is not None)
-                for p in event_parts
-            )
-        )
-        if has_billbro_data:
-            count_billbro_monatsessen += 1
+    count_billbro_monatsessen = sum(1 for ev in past_ms if ev['has_billbro_data'])
 
     # Ø Kosten pro Person (alle erfassten Anteile, teilnahme=True)
-    share_rappen_values = [
-        p.calculated_share_rappen
-        for p in parts
-        if p.teilnahme and p.calculated_share_rappen is not None
-    ]
+    share_rappen_values = [share for ev in past_ms for share in ev['shares']]
     avg_share_chf = (
         mean(share_rappen_values) / 100.0 if share_rappen_values else None
     )
@@ -348,88 +549,68 @@ def get_monatsessen_statistics(
     tip_pcts: list[float] = []
     for ev in past_ms:
         if (
-            ev.rechnungsbetrag_rappen
-            and ev.rechnungsbetrag_rappen > 0
-            and ev.trinkgeld_rappen is not None
+            ev['rechnungsbetrag_rappen']
+            and ev['rechnungsbetrag_rappen'] > 0
+            and ev['trinkgeld_rappen'] is not None
         ):
-            tip_pcts.append(100.0 * ev.trinkgeld_rappen / ev.rechnungsbetrag_rappen)
+            tip_pcts.append(100.0 * ev['trinkgeld_rappen'] / ev['rechnungsbetrag_rappen'])
     avg_tip_pct = mean(tip_pcts) if tip_pcts else None
 
     current_member = member_by_id.get(current_member_id)
-    eligible_for_user = (
-        [e for e in past_ms if current_member and _member_eligible_for_event(current_member, e)]
-        if current_member
-        else []
-    )
-    user_confirmed = 0
-    for e in eligible_for_user:
-        p = part_map.get((e.id, current_member_id))
-        if p and p.teilnahme:
-            user_confirmed += 1
+    if current_member:
+        user_eligible_mask = current_member['eligible_mask'] & filter_mask
+        user_eligible_count = bin(user_eligible_mask).count('1')
+        user_confirmed = bin(current_member['confirmed_mask'] & user_eligible_mask).count('1')
+    else:
+        user_eligible_count = 0
+        user_confirmed = 0
     user_participation_pct = (
-        100.0 * user_confirmed / len(eligible_for_user) if eligible_for_user else 0.0
+        100.0 * user_confirmed / user_eligible_count if user_eligible_count else 0.0
     )
 
     esstyp_counts = {Esstyp.ALLIN: 0, Esstyp.NORMAL: 0, Esstyp.SPARSAM: 0}
     user_share_rappen: list[int] = []
-    for e in past_ms:
-        p = part_map.get((e.id, current_member_id))
-        if not p or not p.teilnahme:
+    attended = snapshot['member_attended'].get(current_member_id, {})
+    for i, _ in selected:
+        if i not in attended:
             continue
-        if p.esstyp is not None and p.esstyp in esstyp_counts:
-            esstyp_counts[p.esstyp] += 1
-        if p.calculated_share_rappen is not None:
-            user_share_rappen.append(p.calculated_share_rappen)
+        esstyp_name, share = attended[i]
+        if esstyp_name is not None and Esstyp[esstyp_name] in esstyp_counts:
+            esstyp_counts[Esstyp[esstyp_name]] += 1
+        if share is not None:
+            user_share_rappen.append(share)
     user_avg_pay_chf = (
         mean(user_share_rappen) / 100.0 if user_share_rappen else None
     )
 
     kuechen = Counter()
     for ev in past_ms:
-        k = (ev.kueche or '').strip()
-        if k:
-            kuechen[k] += 1
+        if ev['kueche']:
+            kuechen[ev['kueche']] += 1
     top_kueche = kuechen.most_common(1)[0][0] if kuechen else None
 
     # Rekorde: Ø-Anteil pro Event
-    def _event_avg_share_rappen(ev: Event) -> float | None:
-        vals = [
-            p.calculated_share_rappen
-            for p in part_map.values()
-            if p.event_id == ev.id
-            and p.teilnahme
-            and p.calculated_share_rappen is not None
-        ]
-        if not vals:
-            return None
-        return float(mean(vals))
-
-    event_avgs: list[tuple[Event, float]] = []
-    for ev in past_ms:
-        a = _event_avg_share_rappen(ev)
-        if a is not None:
-            event_avgs.append((ev, a))
+    event_avgs: list[tuple[dict[str, Any], float]] = [
+        (ev, ev['avg_share_rappen']) for ev in past_ms if ev['avg_share_rappen'] is not None
+    ]
 
     expensive = min(event_avgs, key=lambda t: -t[1]) if event_avgs else None
     cheapest = min(event_avgs, key=lambda t: t[1]) if event_avgs else None
 
-    max_tip_event: Event | None = None
+    max_tip_event: dict[str, Any] | None = None
     max_tip_rappen = 0
     for ev in past_ms:
-        if ev.trinkgeld_rappen is None:
+        if ev['trinkgeld_rappen'] is None:
             continue
-        if ev.trinkgeld_rappen > max_tip_rappen:
-            max_tip_rappen = ev.trinkgeld_rappen
+        if ev['trinkgeld_rappen'] > max_tip_rappen:
+            max_tip_rappen = ev['trinkgeld_rappen']
             max_tip_event = ev
     if max_tip_rappen <= 0:
         max_tip_event = None
 
-    event_overall_avgs: list[tuple[Event, float]] = []
-    for ev in past_ms:
-        xs = ratings_by_event.get(ev.id)
-        if not xs:
-            continue
-        event_overall_avgs.append((ev, float(mean(xs))))
+    event_overall_avgs = [
+        (ev, ev['overall_avg']) for ev in past_ms if ev['overall_avg'] is not None
+    ]
 
     record_best_rated: dict[str, Any] | None = None
     record_worst_rated: dict[str, Any] | None = None
@@ -437,30 +618,26 @@ def get_monatsessen_statistics(
         best_ev, best_avg = max(event_overall_avgs, key=lambda t: t[1])
         worst_ev, worst_avg = min(event_overall_avgs, key=lambda t: t[1])
         record_best_rated = {
-            'restaurant': _event_restaurant_label(best_ev),
+            'restaurant': best_ev['label'],
             'overall_avg': round(best_avg, 1),
         }
         record_worst_rated = {
-            'restaurant': _event_restaurant_label(worst_ev),
+            'restaurant': worst_ev['label'],
             'overall_avg': round(worst_avg, 1),
         }
 
-    # Charts: Teilnahmequote je Member
+    # Charts: Teilnahmequote je Member (Bitsets: berechtigt ∧ Filter, davon zugesagt)
     member_chart: list[dict[str, Any]] = []
-    for m in active_members:
-        el = [e for e in past_ms if _member_eligible_for_event(m, e)]
-        if not el:
+    for m in snapshot['members']:
+        el_mask = m['eligible_mask'] & filter_mask
+        if not el_mask:
             continue
-        att = sum(
-            1
-            for e in el
-            if (part_map.get((e.id, m.id)) and part_map[(e.id, m.id)].teilnahme)
-        )
-        pct = 100.0 * att / len(el)
+        att = bin(m['confirmed_mask'] & el_mask).count('1')
+        pct = 100.0 * att / bin(el_mask).count('1')
         member_chart.append(
             {
-                'id': m.id,
-                'label': m.display_name_with_spirit,
+                'id': m['id'],
+                'label': m['label'],
                 'rate': round(pct, 1),
             }
         )
@@ -469,14 +646,13 @@ def get_monatsessen_statistics(
     # Ø Kosten je Organisator (Mittel der Event-Durchschnittsanteile)
     org_avgs: dict[int, list[float]] = defaultdict(list)
     for ev, avg_r in event_avgs:
-        org_avgs[ev.organisator_id].append(avg_r / 100.0)
+        org_avgs[ev['organisator_id']].append(avg_r / 100.0)
     organizer_chart: list[dict[str, Any]] = []
     for oid, chfs in org_avgs.items():
-        om = member_by_id.get(oid)
         organizer_chart.append(
             {
                 'id': oid,
-                'label': om.display_name_with_spirit if om else f'#{oid}',
+                'label': _member_label(oid),
                 'avg_chf': round(mean(chfs), 2),
             }
         )
@@ -487,43 +663,44 @@ def get_monatsessen_statistics(
     share_trend_values: list[float] = []
     share_trend_restaurants: list[str] = []
     overall_avg_share_chf = round(mean([avg_r / 100.0 for _, avg_r in event_avgs]), 2) if event_avgs else None
-    for ev, avg_r in sorted(event_avgs, key=lambda t: t[0].datum):
-        date_label = ev.datum.strftime('%d.%m.%y')
-        restaurant_label = (ev.restaurant or ev.place_name or '').strip() or 'Monatsessen'
-        share_trend_labels.append(date_label)
+    for ev, avg_r in event_avgs:
+        share_trend_labels.append(ev['datum'].strftime('%d.%m.%y'))
         share_trend_values.append(round(avg_r / 100.0, 2))
-        share_trend_restaurants.append(restaurant_label)
+        share_trend_restaurants.append(ev['trend_label'])
 
     # Restaurant-Tabelle (alle mit mind. einer Bewertung; Sortierung/Top 10 im Client)
+    all_events = snapshot['events']
     restaurant_ratings_rows: list[dict[str, Any]] = []
-    for label, b in restaurant_rating_vals.items():
-        if not b['overall']:
+    for label, indices in snapshot['restaurants'].items():
+        bucket = [
+            rating
+            for i in indices
+            if filter_mask >> i & 1
+            for rating in all_events[i]['ratings']
+        ]
+        if not bucket:
             continue
         restaurant_ratings_rows.append(
             {
                 'restaurant': label,
-                'overall_avg': round(mean(b['overall']), 2),
-                'food_avg': round(mean(b['food']), 2),
-                'drinks_avg': round(mean(b['drinks']), 2),
-                'service_avg': round(mean(b['service']), 2),
-                'count': len(b['overall']),
+                'overall_avg': round(mean(r[3] for r in bucket), 2),
+                'food_avg': round(mean(r[0] for r in bucket), 2),
+                'drinks_avg': round(mean(r[1] for r in bucket), 2),
+                'service_avg': round(mean(r[2] for r in bucket), 2),
+                'count': len(bucket),
             }
         )
     restaurant_ratings_rows.sort(key=lambda x: (-x['overall_avg'], x['restaurant']))
 
     # Ø Gesamtbewertung je Organisator (Mittel der Event-Durchschnitte, nur Events mit Ratings)
     org_event_overall: dict[int, list[float]] = defaultdict(list)
-    for ev in past_ms:
-        xs = ratings_by_event.get(ev.id)
-        if not xs:
-            continue
-        org_event_overall[ev.organisator_id].append(float(mean(xs)))
+    for ev, overall in event_overall_avgs:
+        org_event_overall[ev['organisator_id']].append(overall)
     organizer_rating_chart: list[dict[str, Any]] = []
     for oid, ev_avgs in org_event_overall.items():
-        om = member_by_id.get(oid)
         organizer_rating_chart.append(
             {
-                'label': om.display_name_with_spirit if om else f'#{oid}',
+                'label': _member_label(oid),
                 'avg': round(mean(ev_avgs), 2),
             }
         )
@@ -567,7 +744,7 @@ def get_monatsessen_statistics(
         'avg_share_chf': int(round(avg_share_chf)) if avg_share_chf is not None else None,
         'avg_tip_pct': round(avg_tip_pct, 1) if avg_tip_pct is not None else None,
         'user_confirmed': user_confirmed,
-        'user_eligible_count': len(eligible_for_user),
+        'user_eligible_count': user_eligible_count,
         'user_participation_pct': int(round(user_participation_pct)),
         'user_esstyp_allin': esstyp_counts[Esstyp.ALLIN],
         'user_esstyp_normal': esstyp_counts[Esstyp.NORMAL],
@@ -577,10 +754,8 @@ def get_monatsessen_statistics(
         'record_expensive': (
             {
                 'avg_chf': round(expensive[1] / 100.0, 2),
-                'restaurant': _event_restaurant_label(expensive[0]),
-                'organizer': _organizer_spirit_rufname(
-                    member_by_id.get(expensive[0].organisator_id)
-                ),
+                'restaurant': expensive[0]['label'],
+                'organizer': _member_rufname(expensive[0]['organisator_id']),
             }
             if expensive
             else None
@@ -588,10 +763,8 @@ def get_monatsessen_statistics(
         'record_cheapest': (
             {
                 'avg_chf': round(cheapest[1] / 100.0, 2),
-                'restaurant': _event_restaurant_label(cheapest[0]),
-                'organizer': _organizer_spirit_rufname(
-                    member_by_id.get(cheapest[0].organisator_id)
-                ),
+                'restaurant': cheapest[0]['label'],
+                'organizer': _member_rufname(cheapest[0]['organisator_id']),
             }
             if cheapest
             else None
@@ -599,10 +772,10 @@ def get_monatsessen_statistics(
         'record_max_tip': (
             {
                 'chf': round(max_tip_rappen / 100.0, 2),
-                'restaurant': _event_restaurant_label(max_tip_event),
+                'restaurant': max_tip_event['label'],
                 'overall_avg': (
-                    round(mean(ratings_by_event[max_tip_event.id]), 1)
-                    if ratings_by_event.get(max_tip_event.id)
+                    round(max_tip_event['overall_avg'], 1)
+                    if max_tip_event['overall_avg'] is not None
                     else None
                 ),
             }
@@ -1,10 +1,8 @@
-import json
-import base64
 from datetime import datetime, timedelta
 from flask import current_app
 from backend.extensions import db
 from backend.models.push_subscription import PushSubscription
-from pywebpush import webpush, WebPushException
+from backend.services.push_outbox import PushOutboxService
 
 # PushSubscription Model wurde nach backend/models/push_subscription.py verschoben
 
@@ -16,7 +14,7 @@ class NotifierService:
         """Send push notification to user"""
         try:
             # Get user's push subscriptions
-            subscriptions = PushSubscription.query.filter_by(member_id=user_id).all()
+            subscriptions = PushSubscription.query.filter_by(member_id=user_id, is_active=True).all()
             
             if not subscriptions:
                 current_app.logger.info(f"No push subscriptions found for user {user_id}")
@@ -33,23 +31,10 @@ class NotifierService:
             if data:
                 payload.update(data)
             
-            success_count = 0
-            for subscription in subscriptions:
-                try:
-                    success = NotifierService._send_to_subscription(subscription, payload)
-                    if success:
-                        success_count += 1
-                        subscription.last_used_at = datetime.utcnow()
-                    else:
-                        # Remove invalid subscription
-                        db.session.delete(subscription)
-                except Exception as e:
-                    current_app.logger.error(f"Error sending to subscription {subscription.id}: {e}")
-                    db.session.delete(subscription)
-            
-            db.session.commit()
-            current_app.logger.info(f"Push notification sent to {success_count}/{len(subscriptions)} subscriptions for user {user_id}")
-            return success_count > 0
+            # Only enqueue; the push outbox worker delivers and deactivates dead subscriptions
+            queued_count = PushOutboxService.enqueue(subscriptions, payload)
+            current_app.logger.info(f"Push notification queued for {queued_count} subscriptions of user {user_id}")
+            return queued_count > 0
             
         except Exception as e:
             current_app.logger.error(f"Error sending push notification to user {user_id}: {e}")
@@ -177,46 +162,6 @@ class NotifierService:
             db.session.rollback()
             return False
     
-    @staticmethod
-    def _send_to_subscription(subscription, payload):
-        """Send push notification to a specific subscription"""
-        try:
-            # Prepare subscription data for pywebpush
-            subscription_data = {
-                'endpoint': subscription.endpoint,
-                'keys': {
-                    'p256dh': subscription.p256dh_key,
-                    'auth': subscription.auth_key
-                }
-            }
-            
-            # Prepare VAPID data
-            vapid_private_key = current_app.config.get('VAPID_PRIVATE_KEY')
-            vapid_claims = current_app.config.get('VAPID_CLAIMS', {'sub': 'mailto:admin@gourmen.ch'})
-            
-            # Send push notification using pywebpush
-            response = webpush(
-                subscription_info=subscription_data,
-                data=json.dumps(payload),
-                vapid_private_key=vapid_private_key,
-                vapid_claims=vapid_claims
-            )
-            
-            current_app.logger.info(f"Push notification sent to subscription {subscription.id}: {response.status_code}")
-            return True
-            
-        except WebPushException as e:
-            current_app.logger.error(f"WebPush error for subscription {subscription.id}: {e}")
-            # If subscription is invalid, mark it for deletion
-            if e.response and e.response.status_code in [410, 404]:
-                current_app.logger.info(f"Subscription {subscription.id} is invalid, will be removed")
-                return False
-            return False
-            
-        except Exception as e:
-            current_app.logger.error(f"Error sending to subscription {subscription.id}: {e}")
-            return False
-    
     @staticmethod
     def _send_fallback_notification(user_id, title, message, data=None):
         """Fallback notification method for users without push subscriptions (e.g., Safari/iOS)"""
@@ -0,0 +1,91 @@
+"""
+Push-Fan-out für Gourmen PWA
+Beliefert viele Subscriptions parallel (begrenzter Thread-Pool) und nutzt pro
+Push-Service-Origin (FCM, Mozilla, Apple, ...) eine Keep-Alive-Session.
+
+Die Worker-Threads machen nur HTTP – keine DB-Zugriffe. Ergebnisse kommen
+gesammelt zurück und werden vom Aufrufer im Request-/Cron-Thread angewendet.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Iterable, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Maximal gleichzeitige Pushes pro Fan-out (= Verbindungen pro Push-Service)
+FANOUT_MAX_WORKERS = 16
+# Timeout pro Push-Request (Sekunden), damit kein Worker ewig haengt
+PUSH_SEND_TIMEOUT_SECONDS = 10
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+# (Schlüssel, subscription_data, payload) – Schlüssel z.B. PushSubscription.id
+FanoutJob = Tuple[Hashable, Dict, Dict]
+SendFn = Callable[[Dict, Dict, requests.Session], dict]
+
+
+def origin_of(endpoint: str) -> str:
+    """`scheme://host` eines Subscription-Endpoints."""
+    parsed = urlparse(endpoint or '')
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def session_for(endpoint: str) -> requests.Session:
+    """Prozessweite Keep-Alive-Session für den Push-Service des Endpoints."""
+    origin = origin_of(endpoint)
+    session = _sessions.get(origin)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(origin)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=FANOUT_MAX_WORKERS)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _sessions[origin] = session
+    return session
+
+
+def close_sessions() -> None:
+    """Alle gepoolten Verbindungen schliessen (Shutdown, Tests)."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+def deliver(jobs: Iterable[FanoutJob], send: SendFn,
+            max_workers: int = FANOUT_MAX_WORKERS) -> Dict[Hashable, dict]:
+    """
+    Sendet alle Jobs parallel und liefert {Schlüssel: Ergebnis-dict}.
+
+    `send(subscription_data, payload, session)` muss ein dict im Format von
+    `PushNotificationService.send_push_notification(..., return_error_details=True)`
+    liefern; Exceptions werden als `{'success': False, 'error': ...}` erfasst.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return {}
+
+    def run(job: FanoutJob) -> dict:
+        _key, subscription_data, payload = job
+        try:
+            return send(subscription_data, payload, session_for(subscription_data.get('endpoint', '')))
+        except Exception as e:  # noqa: BLE001 – ein Gerät darf den Fan-out nicht abbrechen
+            logger.error(f"Push fan-out error for {subscription_data.get('endpoint', '')[:50]}...: {e}")
+            return {'success': False, 'error': str(e)}
+
+    workers = max(1, min(max_workers, len(jobs)))
+    if workers == 1:
+        return {job[0]: run(job) for job in jobs}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='push-fanout') as pool:
+        results = pool.map(run, jobs)
+        return {job[0]: result for job, result in zip(jobs, results)}
@@ -0,0 +1,209 @@
+"""
+Push-Zustellmetriken für Gourmen PWA
+Jeder Versand (send_push_notification) meldet Latenz, Statuscode und
+Push-Service-Origin. Pro Prozess wird im Speicher aggregiert (Zähler plus
+Latenz-Histogramm mit festen Buckets); `flush` schreibt periodisch eine Zeile
+pro Origin nach `push_delivery_stats`. `summary` führt DB-Zeilen und noch nicht
+geschriebene Werte zusammen und schätzt p50/p95 aus den Histogrammen.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from flask import current_app
+from sqlalchemy import insert
+
+from backend.extensions import db
+from backend.models.push_delivery_stat import PushDeliveryStat
+from backend.services.push_fanout import origin_of
+
+logger = logging.getLogger(__name__)
+
+# Obergrenzen der Latenz-Buckets in ms; dahinter ein Überlauf-Bucket
+LATENCY_BUCKETS_MS = (25, 50, 100, 200, 400, 800, 1600, 3200, 6400, 12800)
+
+_pending: Dict[str, '_Aggregate'] = {}
+_pending_lock = threading.Lock()
+_last_flush = 0.0
+
+
+class _Aggregate:
+    """Zähler und Histogramm für einen Origin in einem Zeitfenster"""
+
+    def __init__(self, started_at: datetime = None):
+        self.started_at = started_at or datetime.utcnow()
+        self.sends = 0
+        self.errors = 0
+        self.latency_sum_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.statuses = Counter()
+
+    def add(self, latency_ms: float, status: Optional[int], success: bool) -> None:
+        self.sends += 1
+        self.errors += 0 if success else 1
+        self.latency_sum_ms += latency_ms
+        self.buckets[_bucket_index(latency_ms)] += 1
+        self.statuses[_status_key(status)] += 1
+
+    def merge_row(self, row: PushDeliveryStat) -> None:
+        self.sends += row.send_count
+        self.errors += row.error_count
+        self.latency_sum_ms += row.latency_sum_ms
+        for i, count in enumerate(row.latency_buckets or []):
+            if i < len(self.buckets):
+                self.buckets[i] += count
+        self.statuses.update(row.status_counts or {})
+
+    def merge(self, other: '_Aggregate') -> None:
+        self.sends += other.sends
+        self.errors += other.errors
+        self.latency_sum_ms += other.latency_sum_ms
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        self.statuses.update(other.statuses)
+
+
+def _bucket_index(latency_ms: float) -> int:
+    for i, upper in enumerate(LATENCY_BUCKETS_MS):
+        if latency_ms <= upper:
+            return i
+    return len(LATENCY_BUCKETS_MS)
+
+
+def _status_key(status: Optional[int]) -> str:
+    return str(status) if status is not None else 'none'
+
+
+def percentile(buckets: List[int], q: float) -> Optional[float]:
+    """
+    Schätzt das q-Quantil (0..1) aus Bucket-Zählern; linear innerhalb des
+    Buckets interpoliert. Im Überlauf-Bucket wird die letzte Grenze gemeldet.
+    """
+    total = sum(buckets)
+    if not total:
+        return None
+    rank = q * total
+    seen = 0
+    for i, count in enumerate(buckets):
+        if count and seen + count >= rank:
+            if i >= len(LATENCY_BUCKETS_MS):
+                return float(LATENCY_BUCKETS_MS[-1])
+            lower = LATENCY_BUCKETS_MS[i - 1] if i else 0
+            upper = LATENCY_BUCKETS_MS[i]
+            return round(lower + (upper - lower) * (rank - seen) / count, 1)
+        seen += count
+    return float(LATENCY_BUCKETS_MS[-1])
+
+
+class PushMetrics:
+    """Erfassen, Wegschreiben und Auswerten der Push-Zustellmetriken"""
+
+    @staticmethod
+    def record(endpoint: str, latency_ms: float, status: Optional[int], success: bool) -> None:
+        """Einen Versand verbuchen (thread-safe, nur im Speicher)."""
+        origin = origin_of(endpoint) if endpoint else 'unknown'
+        with _pending_lock:
+            aggregate = _pending.get(origin)
+            if aggregate is None:
+                aggregate = _pending[origin] = _Aggregate()
+            aggregate.add(latency_ms, status, success)
+
+    @staticmethod
+    def _take_pending() -> Dict[str, _Aggregate]:
+        global _pending
+        with _pending_lock:
+            taken, _pending = _pending, {}
+        return taken
+
+    @staticmethod
+    def _snapshot_pending() -> Dict[str, _Aggregate]:
+        with _pending_lock:
+            snapshot = {}
+            for origin, aggregate in _pending.items():
+                copy = _Aggregate(aggregate.started_at)
+                copy.merge(aggregate)
+                snapshot[origin] = copy
+        return snapshot
+
+    @staticmethod
+    def flush() -> int:
+        """Gesammelte Werte als eine Zeile pro Origin schreiben und committen; liefert die Zeilenzahl."""
+        global _last_flush
+        _last_flush = time.monotonic()
+        taken = PushMetrics._take_pending()
+        if not taken:
+            return 0
+        now = datetime.utcnow()
+        try:
+            db.session.execute(
+                insert(PushDeliveryStat),
+                [
+                    {
+                        'origin': origin,
+                        'period_start': aggregate.started_at,
+                        'period_end': now,
+                        'send_count': aggregate.sends,
+                        'error_count': aggregate.errors,
+                        'latency_sum_ms': aggregate.latency_sum_ms,
+                        'latency_buckets': aggregate.buckets,
+                        'status_counts': dict(aggregate.statuses),
+                    }
+                    for origin, aggregate in taken.items()
+                ],
+            )
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f"Failed to flush push metrics: {e}")
+            # Werte nicht verlieren – beim nächsten Flush erneut versuchen
+            with _pending_lock:
+                for origin, aggregate in taken.items():
+                    aggregate.merge(_pending.get(origin) or _Aggregate())
+                    _pending[origin] = aggregate
+            return 0
+        return len(taken)
+
+    @staticmethod
+    def flush_if_due() -> int:
+        """`flush`, sofern seit dem letzten Flush PUSH_METRICS_FLUSH_SECONDS vergangen sind."""
+        interval = current_app.config.get('PUSH_METRICS_FLUSH_SECONDS', 60)
+        if time.monotonic() - _last_flush < interval:
+            return 0
+        return PushMetrics.flush()
+
+    @staticmethod
+    def summary(hours: int = 24) -> Dict[str, Dict]:
+        """
+        p50/p95-Latenz, Fehlerquote und Statuscodes pro Origin der letzten
+        `hours` Stunden (geschriebene Zeilen plus noch nicht geschriebene Werte).
+        """
+        since = datetime.utcnow() - timedelta(hours=hours)
+        aggregates: Dict[str, _Aggregate] = {}
+        rows = PushDeliveryStat.query.filter(PushDeliveryStat.period_end >= since).all()
+        for row in rows:
+            aggregates.setdefault(row.origin, _Aggregate()).merge_row(row)
+        for origin, aggregate in PushMetrics._snapshot_pending().items():
+            aggregates.setdefault(origin, _Aggregate()).merge(aggregate)
+
+        return {
+            origin: {
+                'sends': aggregate.sends,
+                'errors': aggregate.errors,
+                'error_rate': round(aggregate.errors / aggregate.sends, 4) if aggregate.sends else 0.0,
+                'latency_p50_ms': percentile(aggregate.buckets, 0.50),
+                'latency_p95_ms': percentile(aggregate.buckets, 0.95),
+                'latency_avg_ms': round(aggregate.latency_sum_ms / aggregate.sends, 1) if aggregate.sends else None,
+                'status_counts': dict(aggregate.statuses),
+            }
+            for origin, aggregate in sorted(aggregates.items())
+        }
+
+    @staticmethod
+    def reset() -> None:
+        """Noch nicht geschriebene Werte verwerfen und ein neues Flush-Intervall beginnen (Tests)."""
+        global _last_flush
+        PushMetrics._take_pending()
+        _last_flush = time.monotonic()
@@ -5,13 +5,19 @@ Handles echte Web Push Notifications über das Betriebssystem
 
 import json
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict
+from flask import current_app
+from sqlalchemy import select
 from backend.extensions import db
 from backend.models.event import Event
 from backend.models.participation import Participation
 from backend.models.member import Member
 from backend.models.push_subscription import PushSubscription
+from backend.services import push_fanout
+from backend.services.push_metrics import PushMetrics
+from backend.services.push_outbox import PushOutboxService
 from backend.services.vapid_service import VAPIDService
 
 logger = logging.getLogger(__name__)
@@ -23,7 +29,6 @@ ICON_PATH = '/static/img/pwa/mustache-96.png'    # Kleines Statusleisten-Icon (e
 
 try:
     from pywebpush import webpush, WebPushException
-    from py_vapid import Vapid02
     WEBPUSH_AVAILABLE = True
 except ImportError:
     logger.warning("pywebpush not available - install with: pip install pywebpush")
@@ -33,30 +38,67 @@ class PushNotificationService:
     """Service für echte Push-Benachrichtigungen über das Betriebssystem"""
     
     @staticmethod
-    def _send_with_cleanup(subscription, payload) -> dict:
+    def _send_pooled(subscription_data: Dict, payload: Dict, session) -> dict:
+        """Einzelversand für den Fan-out (Keep-Alive-Session des Push-Services)."""
+        return PushNotificationService.send_push_notification(
+            subscription_data,
+            payload,
+            return_error_details=True,
+            requests_session=session
+        )
+
+    @staticmethod
+    def _deliver_to_subscriptions(subscriptions: List[PushSubscription], payload: Dict) -> dict:
         """
-        Sendet Push, markiert Nutzung und deaktiviert abgelaufene Subscriptions (410).
-        Gibt ein dict mit success/ status/ error zurück.
+        Sendet `payload` parallel an alle Subscriptions (siehe push_fanout),
+        markiert Nutzung, deaktiviert abgelaufene Subscriptions (404/410) und zählt
+        die Fehlerserie nur bei endgültigen Fehlschlägen hoch – gleiche Regeln wie
+        die Outbox (PushOutboxService.classify_result); transiente Fehler (Netzwerk,
+        429, 5xx) zählen nicht, damit ein kurzer Ausfall keine Geräte deaktiviert.
+        Gibt {'sent', 'deactivated', 'results': {subscription_id: result}} zurück.
         """
-        result = PushNotificationService.send_push_notification(
-            subscription.subscription_data,
-            payload,
-            return_error_details=True
+        results = push_fanout.deliver(
+            [(s.id, s.subscription_data, payload) for s in subscriptions],
+            PushNotificationService._send_pooled
+        )
+        outcomes = {sid: PushOutboxService.classify_result(result) for sid, result in results.items()}
+        used_ids = [sid for sid, outcome in outcomes.items() if outcome == 'sent']
+        gone_ids = [sid for sid, outcome in outcomes.items() if outcome == 'gone']
+        failed_ids = [sid for sid, outcome in outcomes.items() if outcome == 'failed']
+        unhealthy = 0
+        try:
+            # Gebündelte UPDATEs für Nutzung, abgelaufene und fehlschlagende Subscriptions
+            PushSubscription.mark_many_used(used_ids)
+            PushSubscription.deactivate_many(gone_ids)
+            unhealthy = PushSubscription.record_failures(
+                failed_ids, current_app.config.get('PUSH_MAX_CONSECUTIVE_FAILURES', 3)
+            )
+            db.session.commit()
+            if gone_ids or unhealthy:
+                logger.info(f"Deactivated {len(gone_ids)} expired and {unhealthy} failing subscriptions")
+        except Exception as cleanup_error:
+            db.session.rollback()
+            logger.warning(f"Failed to store push results: {cleanup_error}")
+        PushMetrics.flush_if_due()
+        return {"sent": len(used_ids), "deactivated": len(gone_ids) + unhealthy, "results": results}
+
+    @staticmethod
+    def _active_subscriptions(*member_criteria) -> List[PushSubscription]:
+        """
+        Aktive Subscriptions aktiver Mitglieder in einer Query (Join statt
+        einer Subscription-Query pro Mitglied). `member_criteria` filtern Member.
+        """
+        return (
+            PushSubscription.query
+            .join(Member, PushSubscription.member_id == Member.id)
+            .filter(
+                PushSubscription.is_active == True,
+                Member.is_active == True,
+                *member_criteria
+            )
+            .order_by(PushSubscription.id)
+            .all()
         )
-        if isinstance(result, dict) and result.get("success"):
-            subscription.mark_used()
-            return result
-        
-        status = result.get("status") if isinstance(result, dict) else None
-        if status == 410:
-            try:
-                subscription.is_active = False
-                db.session.commit()
-                logger.info(f"Deactivated expired subscription {getattr(subscription, 'endpoint', '')[:50]}...")
-            except Exception as cleanup_error:
-                db.session.rollback()
-                logger.warning(f"Failed to deactivate expired subscription: {cleanup_error}")
-        return result
 
     @staticmethod
     def send_test_push_to_active_subscriptions(limit: int = None) -> dict:
@@ -85,88 +127,46 @@ class PushNotificationService:
                 }
             }
             
-            sent = 0
-            deactivated = 0
-            for subscription in subscriptions:
-                result = PushNotificationService._send_with_cleanup(subscription, payload)
-
-                if isinstance(result, dict) and result.get("success"):
-                    sent += 1
-                else:
-                    status = result.get("status") if isinstance(result, dict) else None
-                    if status == 410:
-                        deactivated += 1
+            delivery = PushNotificationService._deliver_to_subscriptions(subscriptions, payload)
+            sent = delivery["sent"]
             
             return {
                 "success": sent > 0,
                 "sent": sent,
                 "requested": len(subscriptions),
                 "limit": limit,
-                "deactivated": deactivated
+                "deactivated": delivery["deactivated"]
             }
         except Exception as e:
             logger.error(f"Error sending test push: {e}")
             return {"success": False, "error": str(e)}
     
     @staticmethod
-    def send_push_notification(subscription_data: Dict, payload: Dict, return_error_details: bool = False):
+    def send_push_notification(subscription_data: Dict, payload: Dict, return_error_details: bool = False,
+                               requests_session=None):
         """
         Sendet eine echte Push-Benachrichtigung über das Betriebssystem
+        `requests_session`: optionale Keep-Alive-Session (Fan-out, siehe push_fanout)
         """
         if not WEBPUSH_AVAILABLE:
             logger.error("pywebpush not available - cannot send push notifications")
             return {'success': False, 'error': 'pywebpush not available'} if return_error_details else False
         
+        endpoint_url = subscription_data.get('endpoint', '')
+        started = time.perf_counter()
         try:
-            # VAPID-Keys holen
-            vapid_private_key_pem = VAPIDService.get_vapid_private_key()
-            vapid_public_key = VAPIDService.get_vapid_public_key()
-            
-            # Erstelle Vapid02-Objekt
-            # py_vapid interpretiert Strings als Dateipfade, daher temporäre Datei
-            import tempfile
-            import os as os_module
-            
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.pem', delete=False, encoding='utf-8') as tmp:
-                tmp.write(vapid_private_key_pem)
-                tmp_path = tmp.name
-            
-            try:
-                vapid = Vapid02.from_file(private_key_file=tmp_path)
-            finally:
-                # Lösche temporäre Datei
-                try:
-                    os_module.unlink(tmp_path)
-                except Exception:
-                    pass
-            
-            # Push-Benachrichtigung senden
-            # Extrahiere Push-Server Domain für aud (audience)
-            try:
-                endpoint_url = subscription_data.get('endpoint', '')
-                # Für FCM (Chrome/Android)
-                if 'fcm.googleapis.com' in endpoint_url or 'android.googleapis.com' in endpoint_url:
-                    audience = 'https://fcm.googleapis.com'
-                # Für Mozilla (Firefox)
-                elif 'mozilla.com' in endpoint_url:
-                    audience = 'https://updates.push.services.mozilla.com'
-                # Fallback: Extrahiere aus endpoint
-                else:
-                    from urllib.parse import urlparse
-                    parsed = urlparse(endpoint_url)
-                    audience = f"{parsed.scheme}://{parsed.netloc}"
-            except Exception:
-                audience = 'https://fcm.googleapis.com'  # Fallback auf FCM
-            
-            result = webpush(
+            # Prozessweiter Signer: Key einmal geladen, Header pro Push-Service gecacht
+            signer = VAPIDService.get_signer()
+
+            response = webpush(
                 subscription_info=subscription_data,
                 data=json.dumps(payload),
-                vapid_private_key=vapid,
-                vapid_claims={
-                    "sub": "mailto:ulrich.andreas@hotmail.com",
-                    "aud": audience
-                }
+                headers=signer.headers_for_endpoint(endpoint_url),
+                timeout=push_fanout.PUSH_SEND_TIMEOUT_SECONDS,
+                requests_session=requests_session,
             )
+            PushMetrics.record(endpoint_url, (time.perf_counter() - started) * 1000,
+                               getattr(response, 'status_code', None) or 201, True)
             
             logger.info(f"Push notification sent successfully to {subscription_data['endpoint'][:50]}...")
             return {'success': True} if return_error_details else True
@@ -179,10 +179,12 @@ class PushNotificationService:
                 body = e.response.json() if hasattr(e.response, 'json') else getattr(e.response, 'content', None)
             except Exception:
                 pass
+            PushMetrics.record(endpoint_url, (time.perf_counter() - started) * 1000, status, False)
             logger.error(f"WebPush error: status={status} detail={body} exc={e}")
             return ({'success': False, 'status': status, 'error': str(e), 'detail': body}
                     if return_error_details else False)
         except Exception as e:
+            PushMetrics.record(endpoint_url, (time.perf_counter() - started) * 1000, None, False)
             logger.error(f"Unexpected error sending push notification: {e}")
             return {'success': False, 'error': str(e)} if return_error_details else False
     
@@ -241,15 +243,11 @@ class PushNotificationService:
                 ]
             }
             
-            # Sende an alle Subscriptions des Organisators
-            success_count = 0
-            for subscription in subscriptions:
-                res = PushNotificationService._send_with_cleanup(subscription, payload)
-                if isinstance(res, dict) and res.get("success"):
-                    success_count += 1
+            # Für alle Subscriptions des Organisators einreihen (Versand: Outbox-Worker)
+            queued_count = PushOutboxService.enqueue(subscriptions, payload)
             
-            logger.info(f"Sent organizer reminder to {success_count}/{len(subscriptions)} subscriptions for {organizer.email}")
-            return success_count > 0
+            logger.info(f"Queued organizer reminder for {queued_count} subscriptions of {organizer.email}")
+            return queued_count > 0
             
         except Exception as e:
             logger.error(f"Error sending event reminder to organizer: {e}")
@@ -265,15 +263,12 @@ class PushNotificationService:
             if not event or not event.is_upcoming:
                 return {"success": False, "message": "Event nicht gefunden oder bereits vorbei"}
             
-            # Finde Mitglieder die noch nicht geantwortet haben
-            responded_member_ids = db.session.query(Participation.member_id).filter_by(
-                event_id=event_id
-            ).subquery()
-            
-            non_responded_members = Member.query.filter(
-                Member.is_active == True,
-                ~Member.id.in_(responded_member_ids)
-            ).all()
+            # Mitglieder die noch nicht geantwortet haben
+            responded_member_ids = select(Participation.member_id).where(
+                Participation.event_id == event_id
+            )
+            not_responded = ~Member.id.in_(responded_member_ids)
+            members_count = Member.query.filter(Member.is_active == True, not_responded).count()
             
             # Push-Benachrichtigung Payload
             organizer = event.organisator
@@ -303,29 +298,18 @@ class PushNotificationService:
                 ]
             }
             
-            sent_count = 0
-            total_subscriptions = 0
+            # Alle Geräte dieser Mitglieder in einer Query
+            subscriptions = PushNotificationService._active_subscriptions(not_responded)
             
-            for member in non_responded_members:
-                # Hole Push-Subscriptions des Mitglieds
-                subscriptions = PushSubscription.query.filter_by(
-                    member_id=member.id,
-                    is_active=True
-                ).all()
-                
-                total_subscriptions += len(subscriptions)
-                
-                # Sende an alle Subscriptions des Mitglieds
-                for subscription in subscriptions:
-                    res = PushNotificationService._send_with_cleanup(subscription, payload)
-                    if isinstance(res, dict) and res.get("success"):
-                        sent_count += 1
+            # Für alle Geräte einreihen, der Outbox-Worker versendet
+            total_subscriptions = len(subscriptions)
+            queued_count = PushOutboxService.enqueue(subscriptions, payload)
             
             return {
                 "success": True, 
-                "message": f"Erinnerungen an {sent_count} Geräte von {len(non_responded_members)} Mitgliedern gesendet",
-                "sent_count": sent_count,
-                "members_count": len(non_responded_members),
+                "message": f"Erinnerungen für {queued_count} Geräte von {members_count} Mitgliedern eingeplant",
+                "queued_count": queued_count,
+                "members_count": members_count,
                 "total_subscriptions": total_subscriptions
             }
             
@@ -436,13 +420,14 @@ class PushNotificationService:
             if not event or not event.is_upcoming:
                 return {"success": False, "message": "Event nicht gefunden oder bereits vorbei"}
             
-            # Finde alle Teilnehmenden (teilnahme=True)
+            # Alle Teilnehmenden (teilnahme=True)
             participants = Participation.query.filter_by(
                 event_id=event_id,
                 teilnahme=True
-            ).all()
+            )
+            participants_count = participants.count()
             
-            if not participants:
+            if not participants_count:
                 return {"success": False, "message": "Keine Teilnehmer gefunden"}
             
             # Wochentag auf Deutsch
@@ -480,33 +465,20 @@ class PushNotificationService:
                 ]
             }
             
-            sent_count = 0
-            total_subscriptions = 0
+            # Alle Geräte der (aktiven) Teilnehmenden in einer Query
+            subscriptions = PushNotificationService._active_subscriptions(
+                Member.id.in_(participants.with_entities(Participation.member_id))
+            )
             
-            for participation in participants:
-                member = participation.member
-                if not member or not member.is_active:
-                    continue
-                
-                # Hole Push-Subscriptions des Mitglieds
-                subscriptions = PushSubscription.query.filter_by(
-                    member_id=member.id,
-                    is_active=True
-                ).all()
-                
-                total_subscriptions += len(subscriptions)
-                
-                # Sende an alle Subscriptions des Mitglieds
-                for subscription in subscriptions:
-                    res = PushNotificationService._send_with_cleanup(subscription, payload)
-                    if isinstance(res, dict) and res.get("success"):
-                        sent_count += 1
+            # Für alle Geräte einreihen, der Outbox-Worker versendet
+            total_subscriptions = len(subscriptions)
+            queued_count = PushOutboxService.enqueue(subscriptions, payload)
             
             return {
                 "success": True,
-                "message": f"Wochenreminder an {sent_count} Geräte von {len(participants)} Teilnehmern gesendet",
-                "sent_count": sent_count,
-                "participants_count": len(participants),
+                "message": f"Wochenreminder für {queued_count} Geräte von {participants_count} Teilnehmern eingeplant",
+                "queued_count": queued_count,
+                "participants_count": participants_count,
                 "total_subscriptions": total_subscriptions
             }
             
@@ -594,22 +566,20 @@ class PushNotificationService:
             participants = Participation.query.filter_by(
                 event_id=event_id,
                 teilnahme=True
-            ).all()
+            )
             
-            if not participants:
+            if not participants.count():
                 return {"success": False, "message": "Keine Teilnehmer gefunden"}
             
-            # Finde wer bereits bewertet hat
-            rated_member_ids = db.session.query(EventRating.participant_id).filter_by(
-                event_id=event_id
-            ).all()
-            rated_member_ids = [r[0] for r in rated_member_ids]
-            
-            # Filter: Nur Teilnehmer die NICHT bewertet haben
-            non_rated_participants = [p for p in participants if p.member_id not in rated_member_ids]
+            # Nur Teilnehmer die NICHT bewertet haben
+            rated_member_ids = select(EventRating.participant_id).where(
+                EventRating.event_id == event_id
+            )
+            non_rated_participants = participants.filter(~Participation.member_id.in_(rated_member_ids))
+            non_rated_count = non_rated_participants.count()
             
-            if not non_rated_participants:
-                return {"success": True, "message": "Alle Teilnehmer haben bereits bewertet", "sent_count": 0}
+            if not non_rated_count:
+                return {"success": True, "message": "Alle Teilnehmer haben bereits bewertet", "queued_count": 0}
             
             # Restaurant-Name (mit Fallback)
             restaurant_name = event.restaurant or event.place_name or "das Restaurant"
@@ -634,33 +604,20 @@ class PushNotificationService:
                 ]
             }
             
-            sent_count = 0
-            total_subscriptions = 0
+            # Alle Geräte der (aktiven) Teilnehmenden ohne Bewertung in einer Query
+            subscriptions = PushNotificationService._active_subscriptions(
+                Member.id.in_(non_rated_participants.with_entities(Participation.member_id))
+            )
             
-            for participation in non_rated_participants:
-                member = participation.member
-                if not member or not member.is_active:
-                    continue
-                
-                # Hole Push-Subscriptions des Mitglieds
-                subscriptions = PushSubscription.query.filter_by(
-                    member_id=member.id,
-                    is_active=True
-                ).all()
-                
-                total_subscriptions += len(subscriptions)
-                
-                # Sende an alle Subscriptions des Mitglieds
-                for subscription in subscriptions:
-                    res = PushNotificationService._send_with_cleanup(subscription, payload)
-                    if isinstance(res, dict) and res.get("success"):
-                        sent_count += 1
+            # Für alle Geräte einreihen, der Outbox-Worker versendet
+            total_subscriptions = len(subscriptions)
+            queued_count = PushOutboxService.enqueue(subscriptions, payload)
             
             return {
                 "success": True,
-                "message": f"Rating-Reminder an {sent_count} Geräte von {len(non_rated_participants)} Teilnehmern gesendet",
-                "sent_count": sent_count,
-                "participants_count": len(non_rated_participants),
+                "message": f"Rating-Reminder für {queued_count} Geräte von {non_rated_count} Teilnehmern eingeplant",
+                "queued_count": queued_count,
+                "participants_count": non_rated_count,
                 "total_subscriptions": total_subscriptions
             }
             
@@ -737,6 +694,7 @@ class PushNotificationService:
                 existing.auth_key = subscription_data['keys']['auth']
                 existing.user_agent = user_agent
                 existing.is_active = True
+                existing.consecutive_failures = 0
                 existing.updated_at = datetime.utcnow()
             else:
                 # Erstelle neue Subscription
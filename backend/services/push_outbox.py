@@ -0,0 +1,289 @@
+"""
+Push-Outbox für Gourmen PWA
+Request-Handler und Cron reihen Pushes nur in `push_outbox` ein; der
+Delivery-Worker holt fällige Nachrichten batchweise, versendet sie über den
+Fan-out (push_fanout) und schreibt das Ergebnis zurück.
+
+Worker-Varianten:
+- In-Process-Thread im Web-Prozess (PUSH_OUTBOX_INPROCESS_WORKER), startet
+  beim ersten Request bzw. Einreihen im jeweiligen Prozess (gunicorn --preload forkt).
+- Eigener Service: `SERVICE_TYPE=push-worker` → `run_push_worker.py`.
+- Der Cron-Lauf stellt am Ende selbst zu (`drain`).
+"""
+
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from flask import current_app
+from sqlalchemy import and_, insert, or_, update
+from sqlalchemy.orm import joinedload
+
+from backend.extensions import db
+from backend.models.push_outbox import PushOutboxMessage, PushOutboxStatus
+from backend.models.push_subscription import PushSubscription
+
+logger = logging.getLogger(__name__)
+
+# Backoff für transiente Fehler: 30s, 60s, 120s, ... max. 1h
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 60 * 60
+# SENDING-Zeilen eines abgestürzten Workers werden danach neu vergeben
+STALE_LOCK_AFTER = timedelta(minutes=10)
+# Statuscodes, bei denen ein späterer Versuch sinnvoll ist (None = Netzwerkfehler)
+TRANSIENT_STATUS_CODES = frozenset({None, 408, 425, 429, 500, 502, 503, 504})
+# Subscription existiert beim Push-Service nicht mehr
+GONE_STATUS_CODES = frozenset({404, 410})
+
+_worker_thread = None
+_worker_pid = None
+_worker_lock = threading.Lock()
+_wake_event = threading.Event()
+
+
+class PushOutboxService:
+    """Einreihen, Zustellen und Worker-Steuerung der Push-Outbox"""
+
+    @staticmethod
+    def enqueue(subscriptions: List[PushSubscription], payload: Dict) -> int:
+        """Reiht `payload` für alle Subscriptions ein (ein Bulk-INSERT), committet und weckt den Worker."""
+        if not subscriptions:
+            return 0
+        now = datetime.utcnow()
+        kind = (payload.get('data') or {}).get('type') or payload.get('type')
+        db.session.execute(
+            insert(PushOutboxMessage),
+            [
+                {
+                    'subscription_id': subscription.id,
+                    'kind': kind,
+                    'payload': payload,
+                    'status': PushOutboxStatus.PENDING,
+                    'attempts': 0,
+                    'next_attempt_at': now,
+                    'created_at': now,
+                }
+                for subscription in subscriptions
+            ],
+        )
+        db.session.commit()
+        PushOutboxService.wake()
+        return len(subscriptions)
+
+    @staticmethod
+    def classify_result(result: Dict) -> str:
+        """
+        Einzelergebnis eines Versands einordnen: 'sent', 'gone' (404/410 –
+        Subscription deaktivieren), 'transient' (Netzwerk, 429, 5xx – später
+        erneut versuchen, zählt nicht zur Fehlerserie) oder 'failed' (endgültig).
+        """
+        if result.get('success'):
+            return 'sent'
+        status = result.get('status')
+        if status in GONE_STATUS_CODES:
+            return 'gone'
+        if status in TRANSIENT_STATUS_CODES:
+            return 'transient'
+        return 'failed'
+
+    @staticmethod
+    def retry_delay(attempts: int) -> timedelta:
+        """Wartezeit vor dem nächsten Versuch nach `attempts` Fehlversuchen."""
+        return timedelta(seconds=min(RETRY_BASE_SECONDS * 2 ** max(0, attempts - 1), RETRY_MAX_SECONDS))
+
+    @staticmethod
+    def _claim_batch(limit: int) -> List[Dict]:
+        """
+        Fällige Nachrichten als SENDING markieren (Postgres: SKIP LOCKED).
+        Liefert einfache dicts, damit nach dem Commit nichts nachgeladen wird.
+        """
+        now = datetime.utcnow()
+        query = (
+            PushOutboxMessage.query
+            .options(joinedload(PushOutboxMessage.subscription))
+            .filter(or_(
+                and_(PushOutboxMessage.status == PushOutboxStatus.PENDING,
+                     PushOutboxMessage.next_attempt_at <= now),
+                and_(PushOutboxMessage.status == PushOutboxStatus.SENDING,
+                     PushOutboxMessage.locked_at < now - STALE_LOCK_AFTER),
+            ))
+            .order_by(PushOutboxMessage.id)
+            .limit(limit)
+        )
+        if db.session.get_bind().dialect.name == 'postgresql':
+            query = query.with_for_update(skip_locked=True, of=PushOutboxMessage)
+        claimed = []
+        for message in query.all():
+            subscription = message.subscription
+            active = subscription is not None and subscription.is_active
+            claimed.append({
+                'id': message.id,
+                'subscription_id': message.subscription_id,
+                'attempts': message.attempts,
+                'next_attempt_at': message.next_attempt_at,
+                'payload': message.payload,
+                'subscription_data': subscription.subscription_data if active else None,
+            })
+        if claimed:
+            db.session.execute(
+                update(PushOutboxMessage)
+                .where(PushOutboxMessage.id.in_([m['id'] for m in claimed]))
+                .values(status=PushOutboxStatus.SENDING, locked_at=now)
+                .execution_options(synchronize_session=False)
+            )
+        db.session.commit()
+        return claimed
+
+    @staticmethod
+    def deliver_batch(batch_size: int = None) -> Dict[str, int]:
+        """Ein Batch fälliger Nachrichten zustellen; liefert Zähler pro Ergebnis."""
+        from backend.services import push_fanout
+        from backend.services.push_notifications import PushNotificationService
+
+        config = current_app.config
+        batch_size = batch_size or config.get('PUSH_OUTBOX_BATCH_SIZE', 100)
+        max_attempts = config.get('PUSH_OUTBOX_MAX_ATTEMPTS', 5)
+        max_failures = config.get('PUSH_MAX_CONSECUTIVE_FAILURES', 3)
+        counts = {'claimed': 0, 'sent': 0, 'retry': 0, 'expired': 0, 'failed': 0}
+
+        messages = PushOutboxService._claim_batch(batch_size)
+        if not messages:
+            return counts
+        counts['claimed'] = len(messages)
+
+        results = push_fanout.deliver(
+            [(m['id'], m['subscription_data'], m['payload']) for m in messages if m['subscription_data']],
+            PushNotificationService._send_pooled
+        )
+
+        # Ergebnisse sammeln und gebündelt zurückschreiben: ein executemany für
+        # die Outbox, gebündelte UPDATEs für benutzte, tote und fehlschlagende
+        # Subscriptions. Nur endgültige Fehlschläge zählen zur Fehlerserie,
+        # damit ein kurzer Ausfall des Push-Services nicht alle deaktiviert.
+        now = datetime.utcnow()
+        message_rows = []
+        used_ids = []
+        gone_ids = []
+        failed_ids = []
+        for message in messages:
+            row = {
+                'id': message['id'],
+                'status': PushOutboxStatus.EXPIRED,
+                'attempts': message['attempts'],
+                'next_attempt_at': message['next_attempt_at'],
+                'locked_at': None,
+                'last_status_code': None,
+                'last_error': None,
+                'sent_at': None,
+            }
+            message_rows.append(row)
+            if not message['subscription_data']:
+                # Subscription inzwischen gelöscht oder deaktiviert
+                counts['expired'] += 1
+                continue
+
+            result = results.get(message['id']) or {}
+            outcome = PushOutboxService.classify_result(result)
+            row.update(attempts=message['attempts'] + 1, last_status_code=result.get('status'),
+                       last_error=result.get('error'))
+            if outcome == 'sent':
+                row.update(status=PushOutboxStatus.SENT, sent_at=now)
+                used_ids.append(message['subscription_id'])
+                counts['sent'] += 1
+            elif outcome == 'gone':
+                gone_ids.append(message['subscription_id'])
+                counts['expired'] += 1
+            elif outcome == 'transient' and row['attempts'] < max_attempts:
+                row.update(status=PushOutboxStatus.PENDING,
+                           next_attempt_at=now + PushOutboxService.retry_delay(row['attempts']))
+                counts['retry'] += 1
+            else:
+                row['status'] = PushOutboxStatus.FAILED
+                failed_ids.append(message['subscription_id'])
+                counts['failed'] += 1
+
+        db.session.execute(update(PushOutboxMessage), message_rows)
+        PushSubscription.mark_many_used(used_ids, now)
+        PushSubscription.deactivate_many(gone_ids)
+        unhealthy = PushSubscription.record_failures(failed_ids, max_failures)
+        db.session.commit()
+        if gone_ids:
+            logger.info(f"Deactivated {len(gone_ids)} expired push subscriptions")
+        if unhealthy:
+            logger.info(f"Deactivated {unhealthy} push subscriptions after {max_failures} failures in a row")
+        logger.info(f"Push outbox batch delivered: {counts}")
+        return counts
+
+    @staticmethod
+    def drain(max_batches: int = None) -> Dict[str, int]:
+        """
+        Batches zustellen, bis nichts mehr fällig ist (Retries mit Backoff bleiben
+        liegen); danach die Zustellmetriken wegschreiben, sofern fällig.
+        """
+        from backend.services.push_metrics import PushMetrics
+
+        totals = {'claimed': 0, 'sent': 0, 'retry': 0, 'expired': 0, 'failed': 0}
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            counts = PushOutboxService.deliver_batch()
+            if not counts['claimed']:
+                break
+            for key, value in counts.items():
+                totals[key] += value
+            batches += 1
+        PushMetrics.flush_if_due()
+        return totals
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def wake() -> None:
+        """Worker-Thread anstossen (startet ihn bei Bedarf in diesem Prozess)."""
+        try:
+            app = current_app._get_current_object()
+        except RuntimeError:
+            return
+        if not app.config.get('PUSH_OUTBOX_INPROCESS_WORKER'):
+            return
+        PushOutboxService.start_worker_thread(app)
+        _wake_event.set()
+
+    @staticmethod
+    def start_worker_thread(app) -> None:
+        """Daemon-Thread mit `run_worker` starten, falls in diesem Prozess noch keiner läuft."""
+        global _worker_thread, _worker_pid
+        if _worker_pid == os.getpid() and _worker_thread is not None and _worker_thread.is_alive():
+            # Schneller Pfad ohne Lock (läuft bei jedem Request)
+            return
+        with _worker_lock:
+            if _worker_thread is not None and _worker_thread.is_alive() and _worker_pid == os.getpid():
+                return
+            _worker_thread = threading.Thread(
+                target=PushOutboxService.run_worker,
+                args=(app,),
+                name='push-outbox-worker',
+                daemon=True,
+            )
+            _worker_pid = os.getpid()
+            _worker_thread.start()
+            logger.info("Push outbox worker thread started")
+
+    @staticmethod
+    def run_worker(app, poll_seconds: int = None, stop_event: threading.Event = None) -> None:
+        """Endlosschleife: Outbox leeren, dann bis zum nächsten Wecken/Poll warten."""
+        poll_seconds = poll_seconds or app.config.get('PUSH_OUTBOX_POLL_SECONDS', 15)
+        while stop_event is None or not stop_event.is_set():
+            with app.app_context():
+                try:
+                    PushOutboxService.drain()
+                except Exception as e:
+                    db.session.rollback()
+                    logger.error(f"Push outbox worker error: {e}", exc_info=True)
+                finally:
+                    db.session.remove()
+            _wake_event.wait(poll_seconds)
+            _wake_event.clear()
@@ -1,5 +1,8 @@
 from datetime import datetime, timedelta, time
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+from flask import current_app
+from sqlalchemy import and_, or_
+from backend.extensions import db
 from backend.models.event import Event
 from backend.models.participation import Participation
 from backend.models.rating import EventRating
@@ -14,6 +17,9 @@ class RetroCleanupService:
     `get_upcoming_rsvp_prompt_event`, nicht der Cleanup-Seite."""
 
     UPCOMING_WINDOW_DAYS = 30
+    # get_progress läuft im Context-Processor bei jedem Render: Ergebnis pro Mitglied
+    # cachen, bei RSVP-/Bewertungs-Schreibzugriffen invalidieren (TTL als Sicherheitsnetz).
+    PROGRESS_CACHE_TTL_SECONDS = 300
 
     @classmethod
     def _today_start_utc(cls) -> datetime:
@@ -21,7 +27,7 @@ class RetroCleanupService:
 
     @classmethod
     def _member_join_date(cls, member_id: int):
-        member = Member.query.get(member_id)
+        member = db.session.get(Member, member_id)
         if not member or not member.beitritt:
             return None
         return datetime.combine(member.beitritt, time.min)
@@ -61,27 +67,54 @@ class RetroCleanupService:
         past = cls._past_events_query(join_dt).all()
         return sorted(past, key=lambda e: e.datum, reverse=True)
 
+    @classmethod
+    def _cleanup_states(cls, member_id: int) -> List[Tuple[Event, Optional[Participation], bool]]:
+        """Alle Cleanup-Kandidaten mit Teilnahme und Bewertungs-Flag in einer Query
+        (LEFT JOIN auf participations und event_ratings), neuestes Datum zuerst."""
+        join_dt = cls._member_join_date(member_id)
+        rated = (
+            db.session.query(EventRating.event_id.label('event_id'))
+            .filter(EventRating.participant_id == member_id)
+            .distinct()
+            .subquery()
+        )
+        rows = (
+            cls._past_events_query(join_dt)
+            .outerjoin(
+                Participation,
+                and_(Participation.event_id == Event.id, Participation.member_id == member_id),
+            )
+            .outerjoin(rated, rated.c.event_id == Event.id)
+            .add_entity(Participation)
+            .add_columns(rated.c.event_id)
+            .order_by(Event.datum.desc())
+            .all()
+        )
+        return [(event, participation, rated_id is not None) for event, participation, rated_id in rows]
+
     @classmethod
     def list_open_cleanup_events(cls, member_id: int) -> List[Event]:
         """Offene Bereinigungspositionen in derselben Reihenfolge wie cleanup_candidate_events."""
-        open_events: List[Event] = []
-        for event in cls.cleanup_candidate_events(member_id):
-            participation = cls._get_participation(event.id, member_id)
-            has_rating = cls._has_rating(event.id, member_id)
-            if cls._is_open(event, participation, has_rating, member_id):
-                open_events.append(event)
-        return open_events
+        return [
+            event
+            for event, participation, has_rating in cls._cleanup_states(member_id)
+            if cls._is_open(event, participation, has_rating, member_id)
+        ]
 
     @classmethod
     def get_upcoming_rsvp_prompt_event(cls, member_id: int) -> Optional[Event]:
         """Nächstes Event im Fenster heute…+30 ohne Zu-/Absage (frühestes Datum zuerst)."""
         join_dt = cls._member_join_date(member_id)
-        q = cls._upcoming_events_query(join_dt).order_by(Event.datum.asc())
-        for event in q:
-            p = cls._get_participation(event.id, member_id)
-            if p is None or p.responded_at is None:
-                return event
-        return None
+        return (
+            cls._upcoming_events_query(join_dt)
+            .outerjoin(
+                Participation,
+                and_(Participation.event_id == Event.id, Participation.member_id == member_id),
+            )
+            .filter(or_(Participation.id.is_(None), Participation.responded_at.is_(None)))
+            .order_by(Event.datum.asc())
+            .first()
+        )
 
     @classmethod
     def get_today_billbro_prompt_event(cls, member_id: int) -> Optional[Event]:
@@ -136,16 +169,30 @@ class RetroCleanupService:
 
     @classmethod
     def get_progress(cls, member_id: int) -> dict:
-        events = cls.cleanup_candidate_events(member_id)
-        total = len(events)
-        completed = 0
-
-        for event in events:
-            participation = cls._get_participation(event.id, member_id)
-            has_rating = cls._has_rating(event.id, member_id)
+        cache = cls._progress_cache()
+        now = datetime.utcnow()
+        entry = cache.get(member_id)
+        # Tageswechsel verschiebt die Kandidaten (Datum vor heute) → Tag im Eintrag prüfen
+        if entry and entry[0] > now and entry[1] == now.date():
+            return dict(entry[2])
+
+        progress = cls._compute_progress(member_id)
+        cache[member_id] = (
+            now + timedelta(seconds=cls.PROGRESS_CACHE_TTL_SECONDS),
+            now.date(),
+            progress,
+        )
+        return dict(progress)
 
-            if cls._is_completed(event, participation, has_rating, member_id):
-                completed += 1
+    @classmethod
+    def _compute_progress(cls, member_id: int) -> dict:
+        states = cls._cleanup_states(member_id)
+        total = len(states)
+        completed = sum(
+            1
+            for event, participation, has_rating in states
+            if cls._is_completed(event, participation, has_rating, member_id)
+        )
 
         pending = total - completed
         return {
@@ -154,6 +201,21 @@ class RetroCleanupService:
             "pending": pending,
         }
 
+    @staticmethod
+    def _progress_cache() -> Dict[int, Tuple[datetime, object, dict]]:
+        """Cache pro App-Instanz (member_id → (gültig bis, Tag, Fortschritt))."""
+        return current_app.extensions.setdefault('retro_cleanup_progress', {})
+
+    @classmethod
+    def invalidate_member(cls, member_id: int) -> None:
+        """Nach RSVP- oder Bewertungsänderung eines Mitglieds aufrufen."""
+        cls._progress_cache().pop(member_id, None)
+
+    @classmethod
+    def invalidate_all(cls) -> None:
+        """Nach Änderungen an Events selbst (Datum, Veröffentlichung, Bewertungen an/aus, Löschen)."""
+        cls._progress_cache().clear()
+
     @classmethod
     def allows_cleanup_rsvp(cls, event) -> bool:
         """POST cleanup/rsvp: nur für vergangene Events (Cleanup-Seite)."""
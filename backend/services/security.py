@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 from cryptography.fernet import Fernet
 from werkzeug.security import generate_password_hash, check_password_hash
 import pyotp
-from flask import current_app, session, request
+from flask import current_app, session, request, has_request_context
 from backend.extensions import db
 from backend.models.audit_event import AuditEvent, AuditAction
 
@@ -239,6 +239,33 @@ class SecurityService:
         except Exception as e:
             # Don't let audit logging break the main functionality
             current_app.logger.error(f"Failed to log audit event: {e}")
+
+    @staticmethod
+    def add_audit_events(action, entity, entries, actor_id):
+        """Mehrere Audit-Events als ein Bulk-Insert, ohne eigenen Commit.
+
+        `entries` ist eine Liste von (entity_id, extra_data). Der Aufrufer
+        committet (z.B. einmal pro Seite beim Drive-Re-Sync).
+        """
+        if not entries:
+            return
+        ip = request.remote_addr if has_request_context() else None
+        now = datetime.utcnow()
+        db.session.execute(
+            db.insert(AuditEvent),
+            [
+                {
+                    'actor_id': actor_id,
+                    'action': action,
+                    'entity': entity,
+                    'entity_id': entity_id,
+                    'ip': ip,
+                    'at': now,
+                    'extra_json': extra_data,
+                }
+                for entity_id, extra_data in entries
+            ],
+        )
     
 def require_step_up(f):
     """Decorator to require step-up authentication"""
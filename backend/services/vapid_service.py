@@ -6,6 +6,9 @@ Generiert und verwaltet VAPID-Keys für echte Push-Benachrichtigungen
 import base64
 import json
 import logging
+import threading
+import time
+from urllib.parse import urlparse
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives.serialization import Encoding, PrivateFormat, NoEncryption
@@ -13,6 +16,66 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# Kontakt im `sub`-Claim der VAPID-JWTs
+VAPID_SUBJECT = 'mailto:ulrich.andreas@hotmail.com'
+# Gueltigkeit eines VAPID-JWT (RFC 8292 erlaubt max. 24h)
+VAPID_TOKEN_LIFETIME_SECONDS = 12 * 60 * 60
+# So lange vor Ablauf wird ein gecachter Header neu signiert
+VAPID_TOKEN_RENEW_MARGIN_SECONDS = 10 * 60
+
+_signer = None
+_signer_lock = threading.Lock()
+
+
+class VAPIDSigner:
+    """Prozessweiter VAPID-Signer: Key einmal aus dem Speicher laden, Header pro Audience cachen.
+
+    Ersetzt das fruehere Muster pro Push (PEM in Tempfile schreiben,
+    `Vapid02.from_file`, Datei loeschen, neu signieren). Die Authorization-Header
+    gelten pro Push-Service-Origin und werden bis kurz vor Ablauf wiederverwendet.
+    """
+
+    def __init__(self, private_key_pem: str, subject: str = VAPID_SUBJECT,
+                 lifetime_seconds: int = VAPID_TOKEN_LIFETIME_SECONDS,
+                 renew_margin_seconds: int = VAPID_TOKEN_RENEW_MARGIN_SECONDS):
+        from py_vapid import Vapid02
+
+        self._vapid = Vapid02.from_pem(private_key_pem.encode('utf-8'))
+        self.subject = subject
+        self.lifetime_seconds = lifetime_seconds
+        self.renew_margin_seconds = renew_margin_seconds
+        self._headers = {}  # audience -> (exp, headers)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def audience_for(endpoint: str) -> str:
+        """Push-Service-Origin (`aud`-Claim) zu einem Subscription-Endpoint."""
+        # FCM verschickt auch ueber android.googleapis.com, signiert wird fuer fcm
+        if 'fcm.googleapis.com' in endpoint or 'android.googleapis.com' in endpoint:
+            return 'https://fcm.googleapis.com'
+        if 'mozilla.com' in endpoint:
+            return 'https://updates.push.services.mozilla.com'
+        parsed = urlparse(endpoint or '')
+        if not parsed.scheme or not parsed.netloc:
+            return 'https://fcm.googleapis.com'
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def headers_for(self, audience: str) -> dict:
+        """VAPID-Header (`Authorization`) fuer eine Audience, gecacht bis kurz vor `exp`."""
+        now = int(time.time())
+        with self._lock:
+            cached = self._headers.get(audience)
+            if cached and cached[0] - self.renew_margin_seconds > now:
+                return dict(cached[1])
+            exp = now + self.lifetime_seconds
+            headers = self._vapid.sign({'sub': self.subject, 'aud': audience, 'exp': exp})
+            self._headers[audience] = (exp, headers)
+            return dict(headers)
+
+    def headers_for_endpoint(self, endpoint: str) -> dict:
+        return self.headers_for(self.audience_for(endpoint))
+
+
 class VAPIDService:
     """Service für VAPID (Voluntary Application Server Identification) Keys"""
     
@@ -136,3 +199,22 @@ class VAPIDService:
                 
         except Exception as e:
             raise Exception(f"VAPID private key not available: {e}")
+
+    @staticmethod
+    def get_signer() -> VAPIDSigner:
+        """Prozessweiter VAPIDSigner (Key wird beim ersten Push geladen)."""
+        global _signer
+        signer = _signer
+        if signer is None:
+            with _signer_lock:
+                if _signer is None:
+                    _signer = VAPIDSigner(VAPIDService.get_vapid_private_key())
+                signer = _signer
+        return signer
+
+    @staticmethod
+    def reset_signer():
+        """Signer verwerfen, z. B. nach Key-Rotation oder in Tests."""
+        global _signer
+        with _signer_lock:
+            _signer = None
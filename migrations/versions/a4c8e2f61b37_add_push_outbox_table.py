@@ -0,0 +1,56 @@
+"""add push_outbox table (dauerhafte Push-Warteschlange fuer den Delivery-Worker)
+
+Revision ID: a4c8e2f61b37
+Revises: f7c3d5e9a102
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "a4c8e2f61b37"
+down_revision = "f7c3d5e9a102"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "push_outbox",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("subscription_id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=50), nullable=True),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "SENDING", "SENT", "EXPIRED", "FAILED", name="pushoutboxstatus"),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("locked_at", sa.DateTime(), nullable=True),
+        sa.Column("last_status_code", sa.Integer(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["subscription_id"], ["push_subscriptions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_push_outbox_subscription_id", "push_outbox", ["subscription_id"], unique=False
+    )
+    op.create_index(
+        "ix_push_outbox_status_next_attempt_at",
+        "push_outbox",
+        ["status", "next_attempt_at"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_push_outbox_status_next_attempt_at", table_name="push_outbox")
+    op.drop_index("ix_push_outbox_subscription_id", table_name="push_outbox")
+    op.drop_table("push_outbox")
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP TYPE IF EXISTS pushoutboxstatus")
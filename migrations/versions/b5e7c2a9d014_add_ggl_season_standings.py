@@ -0,0 +1,56 @@
+"""add ggl_season_standings table (materialisierte GGL-Saisontabelle)
+
+Revision ID: b5e7c2a9d014
+Revises: d4e8f1a2b903
+Create Date: 2026-10-17
+
+Befuellung bestehender Saisons: Migration d1f6a3c8b247 (Backfill);
+Pruefen/Neuaufbau: `python scripts/rebuild_ggl_standings.py`.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b5e7c2a9d014"
+down_revision = "d4e8f1a2b903"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "ggl_season_standings",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("member_id", sa.Integer(), nullable=False),
+        sa.Column("season", sa.Integer(), nullable=False),
+        sa.Column("total_points", sa.Float(), nullable=False),
+        sa.Column("avg_points", sa.Float(), nullable=False),
+        sa.Column("avg_diff_rappen", sa.Float(), nullable=False),
+        sa.Column("events_ranked", sa.Integer(), nullable=False),
+        sa.Column("guesses_count", sa.Integer(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["member_id"], ["members.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("member_id", "season", name="uq_ggl_standing_member_season"),
+    )
+    op.create_index(
+        "ix_ggl_season_standings_member_id", "ggl_season_standings", ["member_id"], unique=False
+    )
+    op.create_index(
+        "ix_ggl_season_standings_season", "ggl_season_standings", ["season"], unique=False
+    )
+    op.create_index(
+        "ix_ggl_season_standings_season_rank",
+        "ggl_season_standings",
+        ["season", "rank"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_ggl_season_standings_season_rank", table_name="ggl_season_standings")
+    op.drop_index("ix_ggl_season_standings_season", table_name="ggl_season_standings")
+    op.drop_index("ix_ggl_season_standings_member_id", table_name="ggl_season_standings")
+    op.drop_table("ggl_season_standings")
@@ -0,0 +1,40 @@
+"""add drive_folders table (lokaler Ordner-Baum fuer Breadcrumbs/Archiv)
+
+Revision ID: c7d2e4f6a810
+Revises: b5e7c2a9d014
+Create Date: 2026-10-17
+
+Keine Befuellung noetig: DriveStorageService laedt fehlende Ordner beim
+ersten Zugriff aus Drive nach. Der Admin-Re-Sync fuellt den Baum komplett.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "c7d2e4f6a810"
+down_revision = "b5e7c2a9d014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "drive_folders",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("drive_folder_id", sa.String(length=100), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("parent_id", sa.String(length=100), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_drive_folders_drive_folder_id", "drive_folders", ["drive_folder_id"], unique=True
+    )
+    op.create_index("ix_drive_folders_parent_id", "drive_folders", ["parent_id"], unique=False)
+
+
+def downgrade():
+    op.drop_index("ix_drive_folders_parent_id", table_name="drive_folders")
+    op.drop_index("ix_drive_folders_drive_folder_id", table_name="drive_folders")
+    op.drop_table("drive_folders")
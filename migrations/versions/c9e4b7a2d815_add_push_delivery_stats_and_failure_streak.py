@@ -0,0 +1,55 @@
+"""add push_delivery_stats table and failure streak on push_subscriptions
+
+Revision ID: c9e4b7a2d815
+Revises: a4c8e2f61b37
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "c9e4b7a2d815"
+down_revision = "a4c8e2f61b37"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "push_delivery_stats",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("origin", sa.String(length=255), nullable=False),
+        sa.Column("period_start", sa.DateTime(), nullable=False),
+        sa.Column("period_end", sa.DateTime(), nullable=False),
+        sa.Column("send_count", sa.Integer(), nullable=False),
+        sa.Column("error_count", sa.Integer(), nullable=False),
+        sa.Column("latency_sum_ms", sa.Float(), nullable=False),
+        sa.Column("latency_buckets", sa.JSON(), nullable=False),
+        sa.Column("status_counts", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_push_delivery_stats_origin", "push_delivery_stats", ["origin"], unique=False
+    )
+    op.create_index(
+        "ix_push_delivery_stats_period_end", "push_delivery_stats", ["period_end"], unique=False
+    )
+
+    op.add_column(
+        "push_subscriptions",
+        sa.Column("consecutive_failures", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "push_subscriptions",
+        sa.Column("last_failure_at", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("push_subscriptions") as batch_op:
+        batch_op.drop_column("last_failure_at")
+        batch_op.drop_column("consecutive_failures")
+    op.drop_index("ix_push_delivery_stats_period_end", table_name="push_delivery_stats")
+    op.drop_index("ix_push_delivery_stats_origin", table_name="push_delivery_stats")
+    op.drop_table("push_delivery_stats")
@@ -0,0 +1,59 @@
+"""backfill ggl_season_standings fuer Saisons ohne Zeilen
+
+Revision ID: d1f6a3c8b247
+Revises: c9e4b7a2d815
+Create Date: 2026-10-17
+
+Das Lesen der GGL-Tabelle schreibt nicht mehr nach; bestehende Saisons werden
+hier einmalig befuellt (gleiche Aggregate wie GGLService._write_season_standings).
+Der Rang bleibt leer, er wird beim Lesen gesetzt. Saisons mit vorhandenen
+Zeilen bleiben unveraendert. Pruefen: `python scripts/rebuild_ggl_standings.py --verify`.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d1f6a3c8b247"
+down_revision = "c9e4b7a2d815"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.get_bind().execute(
+        sa.text(
+            """
+            INSERT INTO ggl_season_standings (
+                member_id, season, total_points, avg_points, avg_diff_rappen,
+                events_ranked, guesses_count, rank, updated_at
+            )
+            SELECT
+                p.member_id,
+                e.season,
+                COALESCE(SUM(p.points), 0),
+                CASE WHEN COUNT(p.points) > 0
+                     THEN CAST(SUM(p.points) AS FLOAT) / COUNT(p.points) ELSE 0 END,
+                CASE WHEN COUNT(p.diff_amount_rappen) > 0
+                     THEN CAST(SUM(p.diff_amount_rappen) AS FLOAT) / COUNT(p.diff_amount_rappen) ELSE 0 END,
+                COUNT(p.points),
+                COUNT(p.id),
+                NULL,
+                CURRENT_TIMESTAMP
+            FROM participations p
+            JOIN events e ON e.id = p.event_id
+            WHERE p.teilnahme = :teilnahme
+              AND p.guess_bill_amount_rappen IS NOT NULL
+              AND NOT EXISTS (
+                  SELECT 1 FROM ggl_season_standings s WHERE s.season = e.season
+              )
+            GROUP BY p.member_id, e.season
+            """
+        ),
+        {"teilnahme": True},
+    )
+
+
+def downgrade():
+    # Befuellung ist idempotent und Daten-only; die Zeilen bleiben (refresh_season_standings pflegt sie).
+    pass
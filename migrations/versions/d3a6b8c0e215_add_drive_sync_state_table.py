@@ -0,0 +1,39 @@
+"""add drive_sync_state table (Changes-API-Token fuer inkrementellen Drive-Sync)
+
+Revision ID: d3a6b8c0e215
+Revises: c7d2e4f6a810
+Create Date: 2026-10-17
+
+Keine Befuellung noetig: der erste Sync ohne Token laeuft als Voll-Re-Sync
+und speichert danach den Start-Token.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d3a6b8c0e215"
+down_revision = "c7d2e4f6a810"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "drive_sync_state",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("drive_id", sa.String(length=100), nullable=False),
+        sa.Column("start_page_token", sa.String(length=255), nullable=True),
+        sa.Column("last_incremental_sync_at", sa.DateTime(), nullable=True),
+        sa.Column("last_full_resync_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_drive_sync_state_drive_id", "drive_sync_state", ["drive_id"], unique=True
+    )
+
+
+def downgrade():
+    op.drop_index("ix_drive_sync_state_drive_id", table_name="drive_sync_state")
+    op.drop_table("drive_sync_state")
@@ -0,0 +1,46 @@
+"""add document_uploads table (Chunk-Uploads via Drive-Resumable-Session)
+
+Revision ID: e5b9c1d3f427
+Revises: d3a6b8c0e215
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "e5b9c1d3f427"
+down_revision = "d3a6b8c0e215"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "document_uploads",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("token", sa.String(length=64), nullable=False),
+        sa.Column("uploader_id", sa.Integer(), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=True),
+        sa.Column("session_uri", sa.Text(), nullable=False),
+        sa.Column("drive_folder_id", sa.String(length=100), nullable=False),
+        sa.Column("drive_filename", sa.String(length=255), nullable=False),
+        sa.Column("mime_type", sa.String(length=255), nullable=False),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("received_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["uploader_id"], ["members.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_document_uploads_token", "document_uploads", ["token"], unique=True)
+    op.create_index(
+        "ix_document_uploads_uploader_id", "document_uploads", ["uploader_id"], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index("ix_document_uploads_uploader_id", table_name="document_uploads")
+    op.drop_index("ix_document_uploads_token", table_name="document_uploads")
+    op.drop_table("document_uploads")
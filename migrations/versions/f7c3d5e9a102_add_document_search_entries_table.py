@@ -0,0 +1,89 @@
+"""add document_search_entries table (lokaler Volltext-Index fuer Vereinsdokumente)
+
+Revision ID: f7c3d5e9a102
+Revises: e5b9c1d3f427
+Create Date: 2026-10-17
+
+Befuellt wird der Index vom naechsten Admin-Voll-Re-Sync (Name + Ordner-Pfad);
+Text aus dem Datei-Inhalt kommt nur bei neuen Uploads dazu.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "f7c3d5e9a102"
+down_revision = "e5b9c1d3f427"
+branch_labels = None
+depends_on = None
+
+
+SQLITE_FTS = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS document_search_fts USING fts5("
+    "name, folder_path, body_text, content='document_search_entries', "
+    "content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS document_search_entries_ai "
+    "AFTER INSERT ON document_search_entries BEGIN "
+    "INSERT INTO document_search_fts(rowid, name, folder_path, body_text) "
+    "VALUES (new.id, new.name, new.folder_path, new.body_text); END",
+    "CREATE TRIGGER IF NOT EXISTS document_search_entries_ad "
+    "AFTER DELETE ON document_search_entries BEGIN "
+    "INSERT INTO document_search_fts(document_search_fts, rowid, name, folder_path, body_text) "
+    "VALUES ('delete', old.id, old.name, old.folder_path, old.body_text); END",
+    "CREATE TRIGGER IF NOT EXISTS document_search_entries_au "
+    "AFTER UPDATE ON document_search_entries BEGIN "
+    "INSERT INTO document_search_fts(document_search_fts, rowid, name, folder_path, body_text) "
+    "VALUES ('delete', old.id, old.name, old.folder_path, old.body_text); "
+    "INSERT INTO document_search_fts(rowid, name, folder_path, body_text) "
+    "VALUES (new.id, new.name, new.folder_path, new.body_text); END",
+)
+
+
+def upgrade():
+    op.create_table(
+        "document_search_entries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("drive_file_id", sa.String(length=100), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("mime_type", sa.String(length=255), nullable=True),
+        sa.Column("web_view_link", sa.String(length=500), nullable=True),
+        sa.Column("parent_id", sa.String(length=100), nullable=True),
+        sa.Column("folder_path", sa.Text(), nullable=False),
+        sa.Column("folder_ids", sa.Text(), nullable=False),
+        sa.Column("body_text", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_document_search_entries_drive_file_id",
+        "document_search_entries",
+        ["drive_file_id"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_document_search_entries_parent_id",
+        "document_search_entries",
+        ["parent_id"],
+        unique=False,
+    )
+
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute(
+            "CREATE INDEX ix_document_search_entries_tsv ON document_search_entries "
+            "USING gin (to_tsvector('simple', name || ' ' || folder_path || ' ' || body_text))"
+        )
+    elif dialect == "sqlite":
+        for statement in SQLITE_FTS:
+            op.execute(statement)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_document_search_entries_tsv")
+    elif dialect == "sqlite":
+        op.execute("DROP TABLE IF EXISTS document_search_fts")
+    op.drop_index("ix_document_search_entries_parent_id", table_name="document_search_entries")
+    op.drop_index("ix_document_search_entries_drive_file_id", table_name="document_search_entries")
+    op.drop_table("document_search_entries")
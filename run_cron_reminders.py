@@ -4,6 +4,7 @@ Railway Cron Job Script für alle Event-Erinnerungen
 Dieses Script wird von Railway's Cron Schedule ausgeführt und prüft:
 - 3-Wochen-Erinnerungen (täglich)
 - Montag-vor-Event-Erinnerungen (nur Montags)
+- Zustellung der dabei eingereihten Pushes (Push-Outbox)
 - Zukünftige weitere Reminder können hier hinzugefügt werden
 """
 
@@ -44,6 +45,8 @@ def run_all_reminders(test_reminder: bool = False):
         
         # Erstelle Flask App Context
         app = create_app()
+        # Kein Outbox-Thread im Cron-Prozess: Schritt 5 stellt selbst zu
+        app.config['PUSH_OUTBOX_INPROCESS_WORKER'] = False
         
         # Optionaler, sofortiger Test-Reminder
         if test_reminder:
@@ -75,7 +78,7 @@ def run_all_reminders(test_reminder: bool = False):
                 for event_result in result_3week.get('results', []):
                     logger.info(f"      Event {event_result['event_id']}: {event_result['event_name']}")
                     logger.info(f"         Organizer: {event_result['organizer_reminder_sent']}")
-                    logger.info(f"         Members: {event_result['member_reminders'].get('sent_count', 0)} notifications")
+                    logger.info(f"         Members: {event_result['member_reminders'].get('queued_count', 0)} notifications queued")
             else:
                 logger.error(f"   ❌ 3-week reminders failed: {result_3week.get('error', 'Unknown')}")
                 all_success = False
@@ -97,7 +100,7 @@ def run_all_reminders(test_reminder: bool = False):
                     for event_result in result_weekly.get('results', []):
                         logger.info(f"      Event {event_result['event_id']}: {event_result['event_name']}")
                         reminder_result = event_result.get('reminder_result', {})
-                        logger.info(f"         Participants: {reminder_result.get('sent_count', 0)} notifications")
+                        logger.info(f"         Participants: {reminder_result.get('queued_count', 0)} notifications queued")
             else:
                 logger.error(f"   ❌ Weekly reminders failed: {result_weekly.get('error', 'Unknown')}")
                 all_success = False
@@ -116,7 +119,7 @@ def run_all_reminders(test_reminder: bool = False):
                 for event_result in result_rating.get('results', []):
                     logger.info(f"      Event {event_result['event_id']}: {event_result['event_name']}")
                     reminder_result = event_result.get('reminder_result', {})
-                    logger.info(f"         Participants: {reminder_result.get('sent_count', 0)} notifications")
+                    logger.info(f"         Participants: {reminder_result.get('queued_count', 0)} notifications queued")
             else:
                 logger.error(f"   ❌ Rating reminders failed: {result_rating.get('error', 'Unknown')}")
                 all_success = False
@@ -126,11 +129,24 @@ def run_all_reminders(test_reminder: bool = False):
             # ========================================
             # 4. Auth-Token Cleanup (taeglich)
             # ========================================
-            logger.info("🧹 [4/4] Cleaning up old auth tokens...")
+            logger.info("🧹 [4/5] Cleaning up old auth tokens...")
             cutoff = datetime.utcnow() - timedelta(days=30)
             deleted_count = AuthToken.query.filter(AuthToken.expires_at < cutoff).delete()
             db.session.commit()
             logger.info(f"   ✅ Auth-Token cleanup: {deleted_count} rows deleted")
+
+            logger.info("")
+
+            # ========================================
+            # 5. Push-Outbox zustellen (eingereihte Reminder)
+            # ========================================
+            logger.info("📬 [5/5] Delivering queued push notifications...")
+            outbox_result = CronService.run_push_outbox()
+            if outbox_result['success']:
+                logger.info(f"   ✅ Push outbox: {outbox_result['delivery']}")
+            else:
+                logger.error(f"   ❌ Push outbox failed: {outbox_result.get('error', 'Unknown')}")
+                all_success = False
             
             logger.info("")
             logger.info("=" * 60)
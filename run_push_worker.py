@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+Push-Outbox Worker (Railway-Service mit SERVICE_TYPE=push-worker)
+Holt fällige Nachrichten aus `push_outbox`, versendet sie parallel und
+schreibt Ergebnisse zurück. Transiente Fehler werden mit Backoff wiederholt.
+
+Läuft dieser Service, im Web-Service PUSH_OUTBOX_INPROCESS_WORKER=false setzen.
+"""
+
+import sys
+import os
+import logging
+import argparse
+
+# Füge den Projektpfad hinzu
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Logging konfigurieren
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Push-Outbox Delivery Worker")
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Outbox einmal leeren und beenden"
+    )
+    parser.add_argument(
+        "--poll-seconds",
+        type=int,
+        default=None,
+        help="Wartezeit zwischen zwei Durchläufen (Default: PUSH_OUTBOX_POLL_SECONDS)"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    from backend.app import create_app
+    from backend.services.push_metrics import PushMetrics
+    from backend.services.push_outbox import PushOutboxService
+
+    app = create_app()
+    app.config['PUSH_OUTBOX_INPROCESS_WORKER'] = False
+
+    if args.once:
+        with app.app_context():
+            result = PushOutboxService.drain()
+            PushMetrics.flush()
+        logger.info(f"📬 Push outbox drained: {result}")
+        return 0
+
+    logger.info("📬 Push outbox worker started")
+    PushOutboxService.run_worker(app, poll_seconds=args.poll_seconds)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Drive-Voll-Re-Sync (DriveStorageService.admin_full_resync)
+
+Laeuft gegen einen In-Memory-Fake-Drive und eine In-Memory-SQLite-DB
+(Testing-Config) – kein Google-Zugriff. Gemessen werden SQL-Statements und
+Laufzeit des mengenbasierten Abgleichs pro Seite im Vergleich zum frueheren
+Abgleich pro Datei (Lookup + Flush + Audit-Commit pro neuer Datei).
+
+Usage:
+    python scripts/benchmark_drive_resync.py
+    python scripts/benchmark_drive_resync.py --files 1000 10000 --existing-ratio 0.5
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event as sa_event
+
+from backend.app import create_app
+from backend.extensions import db
+from backend.models.audit_event import AuditAction
+from backend.models.document import Document
+from backend.models.member import Member
+from backend.services.drive_storage import GOOGLE_FOLDER_MIME, DriveStorageService
+from backend.services.security import SecurityService
+from tests.fake_drive import FakeDrive
+
+DRIVE_ID = "bench-drive"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark Drive-Voll-Re-Sync")
+    parser.add_argument(
+        "--files",
+        type=int,
+        nargs="+",
+        default=[10000],
+        help="Anzahl Dateien im Fake-Drive pro Lauf",
+    )
+    parser.add_argument(
+        "--existing-ratio",
+        type=float,
+        default=0.5,
+        help="Anteil der Dateien, die vor dem Lauf schon als Document existieren",
+    )
+    parser.add_argument(
+        "--skip-baseline",
+        action="store_true",
+        help="Nur den mengenbasierten Abgleich messen",
+    )
+    return parser.parse_args()
+
+
+def build_drive(file_count, folder_count=20):
+    """Flacher Fake-Drive: `folder_count` Ordner unter der Wurzel, Dateien reihum."""
+    drive = FakeDrive(drive_id=DRIVE_ID)
+    for i in range(folder_count):
+        drive.add_folder(f"folder-{i}", f"Ordner {i}", DRIVE_ID)
+    for i in range(file_count):
+        drive.add(
+            file_id=f"file-{i}",
+            name=f"Datei {i}.pdf",
+            parents=[f"folder-{i % folder_count}"],
+            mimeType="application/pdf",
+        )
+    drive.reset_counters()
+    return drive
+
+
+def legacy_full_resync(drive, actor):
+    """Frueherer Abgleich pro Datei (nur Documents, fuer den Vergleich)."""
+    page_token = None
+    while True:
+        response = drive.files().list(pageSize=1000, pageToken=page_token).execute()
+        for item in response.get("files", []):
+            if item.get("mimeType") == GOOGLE_FOLDER_MIME:
+                continue
+            fid = item["id"]
+            parent_id = item["parents"][0]
+            existing = Document.query.filter_by(drive_file_id=fid).one_or_none()
+            now = datetime.utcnow()
+            if existing is None:
+                doc = Document(drive_file_id=fid, drive_parent_id=parent_id, last_seen_at=now)
+                db.session.add(doc)
+                db.session.flush()
+                SecurityService.log_audit_event(
+                    AuditAction.DOCUMENT_AUTO_IMPORTED,
+                    entity="document",
+                    entity_id=doc.id,
+                    actor_id=actor.id,
+                    extra_data={"drive_file_id": fid, "drive_parent_id": parent_id},
+                )
+            else:
+                if existing.drive_parent_id != parent_id:
+                    existing.drive_parent_id = parent_id
+                existing.last_seen_at = now
+        db.session.commit()
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+
+
+def run(file_count, existing_ratio, legacy):
+    """Frische DB, vorhandene Documents anlegen, Re-Sync messen."""
+    app = create_app("testing")
+    app.config["GOOGLE_DRIVE_ID"] = DRIVE_ID
+    drive = build_drive(file_count)
+    DriveStorageService._build_drive = classmethod(lambda cls: drive)
+
+    with app.app_context():
+        db.create_all()
+        actor = Member(vorname="Bench", nachname="Mark", email="bench@example.test", passwort_hash="x")
+        db.session.add(actor)
+        existing = int(file_count * existing_ratio)
+        db.session.add_all(
+            Document(drive_file_id=f"file-{i}", drive_parent_id="folder-moved")
+            for i in range(existing)
+        )
+        db.session.commit()
+
+        statements = []
+        listener = lambda *args: statements.append(1)  # noqa: E731
+        sa_event.listen(db.engine, "before_cursor_execute", listener)
+        started = time.perf_counter()
+        if legacy:
+            legacy_full_resync(drive, actor)
+        else:
+            DriveStorageService.admin_full_resync(actor)
+        elapsed = time.perf_counter() - started
+        sa_event.remove(db.engine, "before_cursor_execute", listener)
+
+        assert Document.query.count() == file_count
+        db.session.remove()
+        db.drop_all()
+    return elapsed, len(statements), drive.api_calls
+
+
+def main():
+    """Main function"""
+    args = parse_args()
+    print("⏱️  Drive-Voll-Re-Sync (Fake-Drive, SQLite in-memory)")
+    print("=" * 30)
+
+    for file_count in args.files:
+        elapsed, statements, api_calls = run(file_count, args.existing_ratio, legacy=False)
+        print(
+            f"  📊 {file_count:>6} Dateien | pro Seite  {elapsed * 1000:9.1f} ms | "
+            f"{statements:>6} SQL | {api_calls:>3} Drive-Calls"
+        )
+        if not args.skip_baseline:
+            elapsed_old, statements_old, _ = run(file_count, args.existing_ratio, legacy=True)
+            print(
+                f"  📊 {file_count:>6} Dateien | pro Datei  {elapsed_old * 1000:9.1f} ms | "
+                f"{statements_old:>6} SQL | x{elapsed_old / elapsed:.1f} langsamer"
+            )
+
+    print("\n✅ Fertig")
+
+
+if __name__ == "__main__":
+    main()
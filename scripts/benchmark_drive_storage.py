@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark-Suite: DriveStorageService gegen den In-Memory-Fake-Drive
+
+Baut pro Groesse einen Shared Drive (Ordner-Baum mit 3 Ebenen, Dateien in den
+Blatt-Ordnern) in `tests.fake_drive.FakeDrive` und misst pro Operation die
+Drive-API-Calls und die Laufzeit: Voll-Re-Sync, Ordner-Listing (kalt/warm),
+Breadcrumb, Suche (ganzer Drive / Unterbaum) und inkrementeller Sync.
+Mit `--latency` schlaegt jeder Drive-Call zusaetzlich diese Wartezeit auf,
+damit Call-Zahlen als Wall-Time sichtbar werden.
+
+Usage:
+    python scripts/benchmark_drive_storage.py
+    python scripts/benchmark_drive_storage.py --sizes 100 1000 --latency 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.app import create_app
+from backend.extensions import db
+from backend.models.member import Member
+from backend.services.drive_storage import DriveStorageService
+from tests.fake_drive import FakeDrive
+
+DRIVE_ID = "bench-drive"
+TOP_FOLDERS = 8
+SUB_FOLDERS = 5
+LEAF_FOLDERS = 4
+NAME_WORDS = ("Protokoll", "Beleg", "Budget", "Einladung", "Menu", "Rechnung", "Statuten")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark DriveStorageService (Fake-Drive)")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000],
+        help="Anzahl Dateien im Fake-Drive pro Lauf",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Kuenstliche Latenz pro Drive-Call in Millisekunden",
+    )
+    return parser.parse_args()
+
+
+def build_drive(file_count, latency_ms):
+    """Ordner-Baum root → Top → Sub → Blatt; Dateien reihum in den Blaettern."""
+    drive = FakeDrive(drive_id=DRIVE_ID)
+    leaves = []
+    for t in range(TOP_FOLDERS):
+        top = drive.add_folder(f"top-{t}", f"Bereich {t}", DRIVE_ID)["id"]
+        for s in range(SUB_FOLDERS):
+            sub = drive.add_folder(f"{top}-sub-{s}", f"Jahr {2020 + s}", top)["id"]
+            for leaf in range(LEAF_FOLDERS):
+                leaves.append(drive.add_folder(f"{sub}-leaf-{leaf}", f"Ordner {leaf}", sub)["id"])
+    for i in range(file_count):
+        word = NAME_WORDS[i % len(NAME_WORDS)]
+        drive.add(
+            file_id=f"file-{i}",
+            name=f"{word} {i}.pdf",
+            parents=[leaves[i % len(leaves)]],
+            mimeType="application/pdf",
+        )
+    drive.latency = latency_ms / 1000.0
+    return drive, leaves
+
+
+def measure(drive, label, fn):
+    drive.reset_counters()
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    print(f"    {label:<28} {elapsed * 1000:9.1f} ms | {drive.api_calls:>5} Drive-Calls")
+    return result
+
+
+def run(file_count, latency_ms):
+    app = create_app("testing")
+    app.config["GOOGLE_DRIVE_ID"] = DRIVE_ID
+    drive, leaves = build_drive(file_count, latency_ms)
+    DriveStorageService._build_drive = classmethod(lambda cls: drive)
+
+    with app.app_context():
+        db.create_all()
+        actor = Member(vorname="Bench", nachname="Mark", email="bench@example.test", passwort_hash="x")
+        db.session.add(actor)
+        db.session.commit()
+
+        leaf = leaves[len(leaves) // 2]
+        top = leaf.split("-sub-")[0]
+        measure(drive, "Voll-Re-Sync", lambda: DriveStorageService.admin_full_resync(actor))
+        measure(drive, "list_folder Top (kalt)", lambda: DriveStorageService.list_folder(top))
+        measure(drive, "list_folder Blatt (kalt)", lambda: DriveStorageService.list_folder(leaf))
+        measure(drive, "list_folder Blatt (warm)", lambda: DriveStorageService.list_folder(leaf))
+        measure(drive, "Breadcrumb Blatt", lambda: DriveStorageService.get_folder_breadcrumb(leaf))
+        hits = measure(drive, "Suche ganzer Drive", lambda: DriveStorageService.search_files("protokoll"))
+        measure(drive, "Suche Unterbaum", lambda: DriveStorageService.search_files("beleg", scope_folder_id=top))
+
+        for i in range(min(10, file_count)):
+            drive.files().update(fileId=f"file-{i}", body={"name": f"Umbenannt {i}.pdf"}).execute()
+        measure(drive, "Inkrementeller Sync (10)", lambda: DriveStorageService.admin_incremental_sync(actor))
+
+        db.session.remove()
+        db.drop_all()
+    return hits.total
+
+
+def main():
+    """Main function"""
+    args = parse_args()
+    print(f"⏱️  DriveStorageService gegen Fake-Drive (Latenz {args.latency:g} ms/Call)")
+    print("=" * 30)
+
+    for file_count in args.sizes:
+        print(f"  📊 {file_count} Dateien, {TOP_FOLDERS * SUB_FOLDERS * LEAF_FOLDERS} Blatt-Ordner")
+        total_hits = run(file_count, args.latency)
+        print(f"    Suchtreffer «protokoll»: {total_hits}")
+
+    print("\n✅ Fertig")
+
+
+if __name__ == "__main__":
+    main()
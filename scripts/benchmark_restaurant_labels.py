@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Micro-Benchmark: Restaurant-Label-Gruppierung (RestaurantLabelIndex)
+
+Vergleicht den einmaligen Gruppierungs-Durchlauf mit den früheren Scans
+pro Label (O(Labels × Events)) auf synthetischen Events – ohne Datenbank.
+
+Usage:
+    python scripts/benchmark_restaurant_labels.py
+    python scripts/benchmark_restaurant_labels.py --sizes 4000 16000 64000 --skip-baseline
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.models.event import Event, EventType
+from backend.services.monatsessen_stats import RestaurantLabelIndex, _event_restaurant_label
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark Restaurant-Label-Gruppierung")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 2000, 4000],
+        help="Anzahl synthetischer Events pro Lauf",
+    )
+    parser.add_argument(
+        "--labels-ratio",
+        type=float,
+        default=0.5,
+        help="Anteil eindeutiger Restaurant-Labels relativ zur Event-Anzahl",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Wiederholungen (bestes Ergebnis zählt)")
+    parser.add_argument(
+        "--skip-baseline",
+        action="store_true",
+        help="Nur den Index messen (Baseline wird bei grossen Grössen langsam)",
+    )
+    return parser.parse_args()
+
+
+def synthetic_events(count, labels_ratio, seed=42):
+    """Transiente Events (nicht in der DB) mit zufälligen Labels und Websites."""
+    rng = random.Random(seed)
+    label_count = max(1, int(count * labels_ratio))
+    start = datetime(2010, 1, 1, 19, 0, 0)
+    events = []
+    for i in range(count):
+        ev = Event(
+            datum=start + timedelta(days=rng.randint(0, 6000)),
+            event_typ=EventType.MONATSESSEN,
+            restaurant=f"Restaurant {rng.randrange(label_count)}",
+            website=rng.choice([None, "", "https://example.test"]),
+            kueche=rng.choice([None, "Thai", "Italienisch"]),
+        )
+        ev.id = i + 1
+        events.append(ev)
+    events.sort(key=lambda e: e.datum)
+    return events
+
+
+def baseline_label_scan(events):
+    """Bisheriges Verfahren: pro Label erneut über alle Events filtern (3 Scans pro Label)."""
+    result = {}
+    for label in sorted({_event_restaurant_label(e) for e in events}):
+        matching = [e for e in events if _event_restaurant_label(e) == label]
+        latest = max(matching, key=lambda e: e.datum)
+        newest_first = sorted(
+            [e for e in events if _event_restaurant_label(e) == label],
+            key=lambda e: e.datum,
+            reverse=True,
+        )
+        homepage = next(
+            (u for u in ((e.place_website or e.website or '').strip() for e in newest_first) if u),
+            None,
+        )
+        meta_first = sorted(
+            [e for e in events if _event_restaurant_label(e) == label],
+            key=lambda e: e.datum,
+            reverse=True,
+        )[0]
+        result[label] = (latest.id, homepage, (meta_first.kueche or '').strip() or None)
+    return result
+
+
+def indexed(events):
+    index = RestaurantLabelIndex(events)
+    return {
+        label: (group.latest.id, group.homepage, group.kueche)
+        for label, group in ((label, index.groups[label]) for label in index.sorted_labels())
+    }
+
+
+def best_of(fn, events, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(events)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    """Main function"""
+    args = parse_args()
+    print("⏱️  Restaurant-Label-Gruppierung")
+    print("=" * 30)
+
+    previous = None
+    for size in args.sizes:
+        events = synthetic_events(size, args.labels_ratio)
+        index_time, index_result = best_of(indexed, events, args.repeat)
+        line = f"  📊 {size:>7} Events | Index {index_time * 1000:8.2f} ms ({index_time / size * 1e6:6.2f} µs/Event)"
+
+        if not args.skip_baseline:
+            baseline_time, baseline_result = best_of(baseline_label_scan, events, 1)
+            if baseline_result != index_result:
+                print(f"  ❌ Ergebnisse weichen ab bei {size} Events")
+                sys.exit(1)
+            line += f" | Label-Scans {baseline_time * 1000:10.2f} ms (x{baseline_time / index_time:,.0f})"
+
+        if previous:
+            prev_size, prev_time = previous
+            line += f" | Wachstum x{index_time / prev_time:.1f} bei x{size / prev_size:.1f} Events"
+        previous = (size, index_time)
+        print(line)
+
+    print("\n✅ Fertig")
+
+
+if __name__ == "__main__":
+    main()
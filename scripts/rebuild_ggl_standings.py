@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+GGL-Saisontabelle (ggl_season_standings) neu aufbauen und prüfen
+
+Usage:
+    python scripts/rebuild_ggl_standings.py            # alle Saisons neu schreiben + prüfen
+    python scripts/rebuild_ggl_standings.py --verify   # nur prüfen, nichts schreiben
+    python scripts/rebuild_ggl_standings.py --season 2025
+"""
+
+import argparse
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.app import create_app
+from backend.extensions import db
+from backend.services.ggl_rules import GGLService
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="GGL-Saisontabelle neu aufbauen")
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Nur gegen die Live-Berechnung prüfen, nichts schreiben",
+    )
+    parser.add_argument(
+        "--season",
+        type=int,
+        help="Nur diese Saison bearbeiten (Standard: alle Saisons mit Events)",
+    )
+    return parser.parse_args()
+
+
+def rebuild_standings(seasons, verify_only=False):
+    """Rebuild (optional) and verify standings; returns number of mismatches."""
+    mismatches = 0
+    for season_year in seasons:
+        if not verify_only:
+            GGLService.refresh_season_standings(season_year)
+            db.session.commit()
+            print(f"  🔄 Saison {season_year} neu geschrieben")
+
+        problems = GGLService.verify_season_standings(season_year)
+        if problems:
+            mismatches += len(problems)
+            for problem in problems:
+                print(f"  ❌ {problem}")
+        else:
+            print(f"  ✅ Saison {season_year} stimmt mit Live-Berechnung überein")
+    return mismatches
+
+
+def main():
+    """Main function"""
+    args = parse_args()
+    print("🏆 GGL-Saisontabelle")
+    print("=" * 30)
+
+    app = create_app(os.environ.get('FLASK_ENV', 'development'))
+
+    with app.app_context():
+        seasons = [args.season] if args.season else GGLService.get_available_seasons()
+        try:
+            mismatches = rebuild_standings(seasons, verify_only=args.verify)
+        except Exception as e:
+            print(f"❌ Fehler: {e}")
+            db.session.rollback()
+            raise
+
+    if mismatches:
+        print(f"\n❌ {mismatches} Abweichungen gefunden")
+        sys.exit(1)
+    print(f"\n✅ {len(seasons)} Saisons geprüft")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,11 +10,14 @@ if [ "$SERVICE_TYPE" = "cron" ]; then
     else
         exec python run_cron_reminders.py
     fi
+elif [ "$SERVICE_TYPE" = "push-worker" ]; then
+    echo "Starting push outbox worker..."
+    exec python run_push_worker.py
 elif [ "$SERVICE_TYPE" = "web" ]; then
     echo "Starting web service..."
     exec gunicorn 'backend.app:create_app()' --bind 0.0.0.0:$PORT --workers=1 --timeout=300 --worker-class=sync --preload --access-logfile=- --error-logfile=- --log-level=info
 else
-    echo "ERROR: SERVICE_TYPE not set or invalid. Set to 'web' or 'cron'"
+    echo "ERROR: SERVICE_TYPE not set or invalid. Set to 'web', 'cron' or 'push-worker'"
     exit 1
 fi
 
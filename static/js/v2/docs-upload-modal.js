@@ -64,6 +64,118 @@
     });
   }
 
+  // --- Chunk-Upload (Resumable) ------------------------------------------
+  // Grosse Dateien gehen in Chunks an /docs/upload/session; bei Abbruch
+  // fragt der Client den bestaetigten Stand ab und macht dort weiter.
+  // SVGs (Sanitization) und Browser ohne fetch nutzen das normale Formular.
+  const form = modal.querySelector('form');
+  const sessionUrl = modal.getAttribute('data-chunk-session-url');
+  const submitBtn = form && form.querySelector('button[type="submit"]');
+  const csrfInput = form && form.querySelector('input[name="csrf_token"]');
+  const eventSelect = modal.querySelector('#docs-upload-event');
+  const MAX_RETRIES = 5;
+
+  function canChunk(file) {
+    return !!(sessionUrl && window.fetch && file && file.slice && file.type !== 'image/svg+xml');
+  }
+
+  function wait(ms) {
+    return new Promise(function (resolve) { setTimeout(resolve, ms); });
+  }
+
+  function jsonOrError(r) {
+    return r.json().catch(function () { return {}; }).then(function (data) {
+      data.status = r.status;
+      return data;
+    });
+  }
+
+  function setProgress(text) {
+    if (submitBtn) submitBtn.textContent = text;
+  }
+
+  function startSession(file) {
+    return fetch(sessionUrl, {
+      method: 'POST',
+      credentials: 'same-origin',
+      headers: { 'Content-Type': 'application/json', 'X-CSRFToken': csrfInput.value, Accept: 'application/json' },
+      body: JSON.stringify({
+        filename: file.name,
+        size: file.size,
+        mime_type: file.type,
+        title: titleInput ? titleInput.value : '',
+        drive_folder_id: folderHidden ? folderHidden.value : '',
+        event_id: eventSelect ? eventSelect.value : ''
+      })
+    }).then(jsonOrError);
+  }
+
+  function sendChunks(file, session, offset, attempt) {
+    const url = sessionUrl + '/' + encodeURIComponent(session.token);
+    if (offset >= file.size) return Promise.reject(new Error('Upload unvollständig.'));
+    const end = Math.min(offset + session.chunk_bytes, file.size);
+    setProgress('Hochladen … ' + Math.floor((offset / file.size) * 100) + ' %');
+    return fetch(url, {
+      method: 'PUT',
+      credentials: 'same-origin',
+      headers: {
+        'Content-Range': 'bytes ' + offset + '-' + (end - 1) + '/' + file.size,
+        'Content-Type': 'application/octet-stream',
+        'X-CSRFToken': csrfInput.value,
+        Accept: 'application/json'
+      },
+      body: file.slice(offset, end)
+    }).then(jsonOrError).then(function (data) {
+      if (data.done) return data;
+      if (data.status === 200 || data.status === 409) {
+        return sendChunks(file, session, data.received, 0);
+      }
+      if (data.status >= 500 && attempt < MAX_RETRIES) {
+        return resume(file, session, attempt + 1);
+      }
+      throw new Error(data.error || 'Upload fehlgeschlagen.');
+    }, function () {
+      if (attempt < MAX_RETRIES) return resume(file, session, attempt + 1);
+      throw new Error('Verbindung unterbrochen. Bitte erneut versuchen.');
+    });
+  }
+
+  function resume(file, session, attempt) {
+    const url = sessionUrl + '/' + encodeURIComponent(session.token);
+    return wait(1000 * Math.pow(2, attempt - 1)).then(function () {
+      return fetch(url, { credentials: 'same-origin', headers: { Accept: 'application/json' } });
+    }).then(jsonOrError).then(function (data) {
+      if (data.done) return data;
+      if (data.status !== 200) throw new Error(data.error || 'Upload-Session nicht mehr verfügbar.');
+      return sendChunks(file, session, data.received, attempt);
+    }, function () {
+      if (attempt < MAX_RETRIES) return resume(file, session, attempt + 1);
+      throw new Error('Verbindung unterbrochen. Bitte erneut versuchen.');
+    });
+  }
+
+  if (form && fileInput) {
+    form.addEventListener('submit', function (e) {
+      const file = fileInput.files && fileInput.files[0];
+      if (!canChunk(file)) return;
+      e.preventDefault();
+      const label = submitBtn ? submitBtn.textContent : '';
+      if (submitBtn) submitBtn.disabled = true;
+      startSession(file).then(function (session) {
+        if (session.status !== 201) throw new Error(session.error || 'Upload fehlgeschlagen.');
+        return sendChunks(file, session, session.received || 0, 0);
+      }).then(function (result) {
+        window.location.href = result.redirect;
+      }).catch(function (err) {
+        window.alert(err.message);
+        if (submitBtn) {
+          submitBtn.disabled = false;
+          submitBtn.textContent = label;
+        }
+      });
+    });
+  }
+
   if (dropzone && fileInput) {
     ['dragenter', 'dragover'].forEach(function (evt) {
       dropzone.addEventListener(evt, function (e) {
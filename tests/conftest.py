@@ -1,10 +1,12 @@
-"""Gemeinsame pytest-Fixtures (App, DB, eingeloggter Test-User)."""
+"""Gemeinsame pytest-Fixtures (App, DB, eingeloggter Test-User) und Query-Zähler."""
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from datetime import datetime
 
 import pytest
+from sqlalchemy import event as sa_event
 from werkzeug.security import generate_password_hash
 
 import backend.models  # noqa: F401 – alle Modelle fuer db.create_all registrieren
@@ -63,3 +65,19 @@ def logged_in_client(app, client):
         sess["_user_id"] = str(uid)
         sess["_fresh"] = True
     return client
+
+
+@contextmanager
+def count_queries():
+    """Zählt alle SQL-Statements, die im Block an die Engine gehen (App-Kontext nötig)."""
+    statements: list[str] = []
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.engine
+    sa_event.listen(engine, "before_cursor_execute", _before)
+    try:
+        yield statements
+    finally:
+        sa_event.remove(engine, "before_cursor_execute", _before)
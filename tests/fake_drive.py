@@ -0,0 +1,372 @@
+"""In-Memory-Fake fuer die Drive-v3-API (Teilmenge, die DriveStorageService nutzt).
+
+Abgedeckt: `files()` (list/get/get_media/create/update/delete), `permissions()`
+(create/list/delete) und `changes()` (getStartPageToken/list). `files().list`
+wertet die verwendeten Query-Formen aus (`'x' in parents`, `and`/`or`,
+Klammern, `trashed`, `name`, `mimeType`, `fullText contains`) und blaettert
+ueber einen numerischen `pageToken`.
+
+Jeder `execute()` zaehlt in `calls` (z. B. `calls["files.list"]`) und wartet
+optional `latency` Sekunden – fuer Tests (Call-Zaehlung) und fuer
+`scripts/benchmark_drive_storage.py` (Wall-Time bei realistischer Latenz).
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter
+
+GOOGLE_FOLDER_MIME = "application/vnd.google-apps.folder"
+
+
+def _http_error(status: int, reason: str = ""):
+    import httplib2
+    from googleapiclient.errors import HttpError
+
+    return HttpError(httplib2.Response({"status": status}), reason.encode("utf-8"))
+
+
+class FakeRequest:
+    """Lazy Request wie bei googleapiclient: Arbeit passiert erst in `execute()`."""
+
+    def __init__(self, drive: "FakeDrive", operation: str, handler):
+        self._drive = drive
+        self._operation = operation
+        self._handler = handler
+        self.headers: dict[str, str] = {}
+
+    def execute(self):
+        self._drive.calls[self._operation] += 1
+        if self._drive.latency:
+            time.sleep(self._drive.latency)
+        return self._handler(self)
+
+
+# ---------------------------------------------------------------------------
+# Query-Auswertung fuer files().list
+# ---------------------------------------------------------------------------
+
+_QUERY_TOKEN = re.compile(r"\s*(?:(\()|(\))|'((?:[^'\\]|\\.)*)'|(!=|=)|([A-Za-z]+))")
+
+
+def _tokenize(query: str) -> list[tuple[str, str]]:
+    tokens: list[tuple[str, str]] = []
+    pos = 0
+    query = query.strip()
+    while pos < len(query):
+        match = _QUERY_TOKEN.match(query, pos)
+        if not match:
+            raise ValueError(f"Fake-Drive versteht die Query nicht: {query!r}")
+        lparen, rparen, literal, op, word = match.groups()
+        if lparen:
+            tokens.append(("(", "("))
+        elif rparen:
+            tokens.append((")", ")"))
+        elif literal is not None:
+            tokens.append(("lit", re.sub(r"\\(.)", r"\1", literal)))
+        elif op:
+            tokens.append(("op", op))
+        else:
+            tokens.append(("word", word))
+        pos = match.end()
+    return tokens
+
+
+class _QueryParser:
+    """expr := conj ('or' conj)* ; conj := atom ('and' atom)* ; atom := '(' expr ')' | term"""
+
+    def __init__(self, query: str):
+        self._tokens = _tokenize(query)
+        self._pos = 0
+
+    def parse(self):
+        predicate = self._expr()
+        if self._pos != len(self._tokens):
+            raise ValueError("Fake-Drive: Rest der Query nicht verarbeitet.")
+        return predicate
+
+    def _peek(self, value: str | None = None):
+        if self._pos >= len(self._tokens):
+            return None
+        token = self._tokens[self._pos]
+        if value is not None and token[1] != value:
+            return None
+        return token
+
+    def _next(self):
+        token = self._tokens[self._pos]
+        self._pos += 1
+        return token
+
+    def _expr(self):
+        parts = [self._conj()]
+        while self._peek("or"):
+            self._next()
+            parts.append(self._conj())
+        return lambda item: any(part(item) for part in parts)
+
+    def _conj(self):
+        parts = [self._atom()]
+        while self._peek("and"):
+            self._next()
+            parts.append(self._atom())
+        return lambda item: all(part(item) for part in parts)
+
+    def _atom(self):
+        if self._peek("("):
+            self._next()
+            inner = self._expr()
+            self._next()  # ")"
+            return inner
+        kind, value = self._next()
+        if kind == "lit":
+            self._next()  # "in"
+            self._next()  # "parents"
+            return lambda item: value in (item.get("parents") or [])
+        field = value
+        kind, op = self._next()
+        if op == "contains":
+            needle = self._next()[1].lower()
+            return lambda item: needle in (item.get("name") or "").lower()
+        expected = self._next()[1]
+        if field == "trashed":
+            flag = expected == "true"
+            return lambda item: bool(item.get("trashed")) == flag
+        if op == "!=":
+            return lambda item: item.get(field) != expected
+        return lambda item: item.get(field) == expected
+
+
+# ---------------------------------------------------------------------------
+# Ressourcen
+# ---------------------------------------------------------------------------
+
+
+class _FakeFiles:
+    def __init__(self, drive: "FakeDrive"):
+        self._drive = drive
+
+    def list(self, q=None, pageSize=100, pageToken=None, **_kwargs):
+        drive = self._drive
+
+        def run(_request):
+            drive.list_calls.append(q)
+            predicate = _QueryParser(q).parse() if q else (lambda item: True)
+            hits = [it for it in drive.items if predicate(it)]
+            start = int(pageToken or 0)
+            result = {"files": hits[start:start + pageSize]}
+            if start + pageSize < len(hits):
+                result["nextPageToken"] = str(start + pageSize)
+            return result
+
+        return FakeRequest(drive, "files.list", run)
+
+    def get(self, fileId, **_kwargs):
+        drive = self._drive
+
+        def run(_request):
+            drive.get_calls.append(fileId)
+            return drive.item(fileId)
+
+        return FakeRequest(drive, "files.get", run)
+
+    def get_media(self, fileId, **_kwargs):
+        drive = self._drive
+
+        def run(request):
+            content = drive.item(fileId).get("content", b"")
+            byte_range = request.headers.get("Range")
+            if not byte_range:
+                return content
+            first, last = byte_range.removeprefix("bytes=").split("-")
+            drive.media_ranges.append((int(first), int(last)))
+            return content[int(first):int(last) + 1]
+
+        return FakeRequest(drive, "files.get_media", run)
+
+    def create(self, body, media_body=None, **_kwargs):
+        drive = self._drive
+
+        def run(_request):
+            content = b""
+            if media_body is not None:
+                content = media_body.getbytes(0, media_body.size())
+            item = drive.add(
+                name=body.get("name"),
+                parents=body.get("parents") or [drive.drive_id],
+                mimeType=body.get("mimeType") or getattr(media_body, "mimetype", lambda: None)(),
+                content=content,
+            )
+            return dict(item)
+
+        return FakeRequest(drive, "files.create", run)
+
+    def update(self, fileId, body=None, addParents=None, removeParents=None, **_kwargs):
+        drive = self._drive
+
+        def run(_request):
+            item = drive.item(fileId)
+            parents = [p for p in item.get("parents") or [] if p != removeParents]
+            if addParents:
+                parents.append(addParents)
+            item["parents"] = parents
+            item.update(body or {})
+            drive.record_change(fileId)
+            return dict(item)
+
+        return FakeRequest(drive, "files.update", run)
+
+    def delete(self, fileId, **_kwargs):
+        drive = self._drive
+
+        def run(_request):
+            drive.items.remove(drive.item(fileId))
+            drive._by_id.pop(fileId, None)
+            drive.record_change(fileId, removed=True)
+            return {}
+
+        return FakeRequest(drive, "files.delete", run)
+
+
+class _FakePermissions:
+    def __init__(self, drive: "FakeDrive"):
+        self._drive = drive
+
+    def create(self, fileId, body, **_kwargs):
+        drive = self._drive
+
+        def run(_request):
+            perms = drive.permissions_by_file.setdefault(fileId, [])
+            perm = dict(body, id=f"perm-{len(perms) + 1}")
+            perms.append(perm)
+            return perm
+
+        return FakeRequest(drive, "permissions.create", run)
+
+    def list(self, fileId, **_kwargs):
+        drive = self._drive
+        return FakeRequest(
+            drive,
+            "permissions.list",
+            lambda _request: {"permissions": list(drive.permissions_by_file.get(fileId, []))},
+        )
+
+    def delete(self, fileId, permissionId, **_kwargs):
+        drive = self._drive
+
+        def run(_request):
+            perms = drive.permissions_by_file.get(fileId, [])
+            drive.permissions_by_file[fileId] = [p for p in perms if p["id"] != permissionId]
+            return {}
+
+        return FakeRequest(drive, "permissions.delete", run)
+
+
+class _FakeChanges:
+    """Changes API: feste Seiten aus `pages` oder das Protokoll der Fake-Mutationen."""
+
+    def __init__(self, drive: "FakeDrive"):
+        self._drive = drive
+
+    def getStartPageToken(self, **_kwargs):
+        drive = self._drive
+        return FakeRequest(
+            drive,
+            "changes.getStartPageToken",
+            lambda _request: {"startPageToken": drive.start_token or str(len(drive.change_log) + 1)},
+        )
+
+    def list(self, pageToken, pageSize=1000, **_kwargs):
+        drive = self._drive
+
+        def run(_request):
+            drive.change_calls.append(pageToken)
+            if pageToken in drive.pages:
+                return drive.pages[pageToken]
+            start = int(pageToken) - 1
+            if start < 0 or start > len(drive.change_log):
+                raise _http_error(410, "invalid page token")
+            changes = drive.change_log[start:start + pageSize]
+            if start + pageSize < len(drive.change_log):
+                return {"changes": changes, "nextPageToken": str(start + pageSize + 1)}
+            return {"changes": changes, "newStartPageToken": str(len(drive.change_log) + 1)}
+
+        return FakeRequest(drive, "changes.list", run)
+
+
+class FakeDrive:
+    """Shared Drive im Speicher; `items` ist die (geordnete) Liste aller Eintraege."""
+
+    def __init__(self, items: list[dict] | None = None, *, drive_id: str = "root", latency: float = 0.0):
+        self.items: list[dict] = items if items is not None else []
+        self.drive_id = drive_id
+        self.latency = latency
+        self.calls: Counter[str] = Counter()
+        self.list_calls: list[str | None] = []
+        self.get_calls: list[str] = []
+        self.change_calls: list[str] = []
+        self.media_ranges: list[tuple[int, int]] = []
+        self.permissions_by_file: dict[str, list[dict]] = {}
+        # Feste Changes-Seiten (Token → Antwort); sonst das Mutationsprotokoll
+        self.pages: dict[str, dict] = {}
+        self.start_token: str | None = None
+        self.change_log: list[dict] = []
+        self._next_id = 0
+        self._by_id: dict[str, dict] = {}
+
+    # -- Ressourcen wie googleapiclient ------------------------------------
+
+    def files(self) -> _FakeFiles:
+        return _FakeFiles(self)
+
+    def permissions(self) -> _FakePermissions:
+        return _FakePermissions(self)
+
+    def changes(self) -> _FakeChanges:
+        return _FakeChanges(self)
+
+    # -- Helfer fuer Tests und Benchmarks ----------------------------------
+
+    @property
+    def api_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def reset_counters(self) -> None:
+        self.calls.clear()
+        self.list_calls.clear()
+        self.get_calls.clear()
+        self.change_calls.clear()
+        self.media_ranges.clear()
+
+    def item(self, file_id: str) -> dict:
+        item = self._by_id.get(file_id)
+        if item is None:
+            # Tests haengen auch direkt an `items` an: Index dann neu aufbauen
+            self._by_id = {it["id"]: it for it in self.items}
+            item = self._by_id.get(file_id)
+        if item is None:
+            raise _http_error(404, f"File not found: {file_id}")
+        return item
+
+    def add(self, *, name: str | None, parents: list[str], mimeType: str | None = None,
+            file_id: str | None = None, **extra) -> dict:
+        if file_id is None:
+            self._next_id += 1
+            file_id = f"fake-{self._next_id}"
+        item = {"id": file_id, "name": name, "mimeType": mimeType, "parents": list(parents), **extra}
+        if "content" in extra:
+            item["size"] = str(len(extra["content"]))
+        self.items.append(item)
+        self._by_id[file_id] = item
+        self.record_change(file_id)
+        return item
+
+    def add_folder(self, file_id: str, name: str, parent: str) -> dict:
+        return self.add(name=name, parents=[parent], mimeType=GOOGLE_FOLDER_MIME, file_id=file_id)
+
+    def record_change(self, file_id: str, *, removed: bool = False) -> None:
+        change = {"changeType": "file", "fileId": file_id, "removed": removed}
+        if not removed:
+            change["file"] = dict(self.item(file_id))
+        self.change_log.append(change)
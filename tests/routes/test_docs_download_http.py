@@ -0,0 +1,77 @@
+"""HTTP-Tests fuer den gestreamten Dokument-Download (/docs/file/<id>/download)."""
+
+import pytest
+
+from backend.extensions import db
+from backend.models.document import Document
+from backend.services import drive_storage
+from backend.services.drive_storage import DriveStorageService
+from tests.fake_drive import FakeDrive
+
+PAYLOAD = bytes(range(256)) * 40  # 10240 Bytes
+
+
+@pytest.fixture
+def download_setup(app, monkeypatch):
+    app.config["GOOGLE_DRIVE_ID"] = "root"
+    drive = FakeDrive()
+    drive.add(
+        file_id="file-1",
+        name="Protokoll Mai 2026 – Entwurf.pdf",
+        parents=["root"],
+        mimeType="application/pdf",
+        content=PAYLOAD,
+        md5Checksum="abc123",
+    )
+    monkeypatch.setattr(DriveStorageService, "_build_drive", classmethod(lambda cls: drive))
+    monkeypatch.setattr(drive_storage, "DOWNLOAD_CHUNK_BYTES", 4096)
+    with app.app_context():
+        doc = Document(drive_file_id="file-1", drive_parent_id="root")
+        db.session.add(doc)
+        db.session.commit()
+        return drive, doc.id
+
+
+def test_download_streams_in_chunks(logged_in_client, download_setup):
+    drive, doc_id = download_setup
+    resp = logged_in_client.get(f"/docs/file/{doc_id}/download")
+
+    assert resp.status_code == 200
+    assert resp.is_streamed
+    assert resp.data == PAYLOAD
+    assert resp.headers["Content-Length"] == str(len(PAYLOAD))
+    assert resp.headers["Accept-Ranges"] == "bytes"
+    assert "filename*=UTF-8''Protokoll" in resp.headers["Content-Disposition"]
+    assert drive.media_ranges == [(0, 4095), (4096, 8191), (8192, 10239)]
+
+
+def test_download_honours_range_requests(logged_in_client, download_setup):
+    drive, doc_id = download_setup
+    resp = logged_in_client.get(
+        f"/docs/file/{doc_id}/download", headers={"Range": "bytes=5000-5099"}
+    )
+    assert resp.status_code == 206
+    assert resp.data == PAYLOAD[5000:5100]
+    assert resp.headers["Content-Range"] == f"bytes 5000-5099/{len(PAYLOAD)}"
+    assert drive.media_ranges == [(5000, 5099)]
+
+    stale = logged_in_client.get(
+        f"/docs/file/{doc_id}/download",
+        headers={"Range": "bytes=0-9", "If-Range": '"anders"'},
+    )
+    assert stale.status_code == 200
+    assert stale.data == PAYLOAD
+
+    unsatisfiable = logged_in_client.get(
+        f"/docs/file/{doc_id}/download", headers={"Range": "bytes=20000-"}
+    )
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["Content-Range"] == f"bytes */{len(PAYLOAD)}"
+
+    # Mehrere Bereiche sind gueltig, werden aber nicht unterstuetzt: volle Datei statt 416
+    multi = logged_in_client.get(
+        f"/docs/file/{doc_id}/download", headers={"Range": "bytes=0-9,100-199"}
+    )
+    assert multi.status_code == 200
+    assert multi.data == PAYLOAD
+    assert "Content-Range" not in multi.headers
@@ -2,7 +2,13 @@
 
 from unittest.mock import patch
 
-from backend.services.drive_storage import DriveStorageService, FolderListing
+from backend.services.drive_storage import (
+    DriveStorageService,
+    FolderListing,
+    FolderMeta,
+    SearchHit,
+    SearchPage,
+)
 
 
 def test_docs_index_renders_with_event_dropdown(logged_in_client, app):
@@ -22,3 +28,54 @@ def test_docs_index_renders_with_event_dropdown(logged_in_client, app):
     assert "docs-browser" in html
     assert "Dokumente</h1>" in html
     assert "Cafe RueTest" in html
+
+
+def test_folder_children_api_revalidates_with_etag(logged_in_client, app):
+    """Folder-Picker: ETag nur aus den Unterordnern, 304 solange diese gleich bleiben."""
+    listing = FolderListing(
+        folder_id="vorstand",
+        subfolders=[FolderMeta(id="protokolle", name="Protokolle", direct_child_count=2)],
+        files=[],
+        etag='"v1"',
+    )
+    url = "/docs/api/folder/vorstand/children"
+    with patch.object(DriveStorageService, "list_folder", return_value=listing):
+        resp = logged_in_client.get(url)
+        assert resp.status_code == 200
+        etag = resp.headers["ETag"]
+        assert etag == listing.subfolders_etag
+        assert resp.get_json() == {"folders": [{"id": "protokolle", "name": "Protokolle"}]}
+
+        cached = logged_in_client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.data == b""
+
+        # Datei-Aenderungen (Listing-ETag, Kinderzahl) aendern die Antwort nicht
+        listing.etag = '"v2"'
+        listing.subfolders[0].direct_child_count = 3
+        assert logged_in_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+        listing.subfolders[0].name = "Protokolle 2026"
+        changed = logged_in_client.get(url, headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+
+
+def test_folder_search_renders_local_hits_with_pagination(logged_in_client, app):
+    app.config["GOOGLE_DRIVE_ID"] = "root"
+    hit = SearchHit(
+        drive_file_id="beleg", name="Beleg März.pdf", mime_type="application/pdf",
+        parent_id="belege", breadcrumb=[], web_view_link=None,
+    )
+    page = SearchPage(hits=[hit], total=30, page=1, per_page=25)
+    with patch.object(DriveStorageService, "search_files", return_value=page) as search, \
+            patch.object(DriveStorageService, "list_folder",
+                         return_value=FolderListing(folder_id="archiv", subfolders=[], files=[])), \
+            patch.object(DriveStorageService, "get_folder_breadcrumb", return_value=[]):
+        resp = logged_in_client.get("/docs/folder/archiv?q=beleg")
+    assert resp.status_code == 200
+    search.assert_called_once_with("beleg", scope_folder_id="archiv", page=1)
+    html = resp.get_data(as_text=True)
+    assert "Beleg März.pdf" in html
+    assert "Seite 1 von 2" in html
+    assert "/docs/folder/archiv?q=beleg&amp;page=2" in html
@@ -0,0 +1,132 @@
+"""HTTP-Tests fuer den Chunk-Upload (/docs/upload/session) gegen eine Fake-Resumable-Session."""
+
+import re
+
+import pytest
+
+from backend.models.audit_event import AuditAction, AuditEvent
+from backend.models.document import Document
+from backend.models.document_upload import DocumentUpload
+from backend.routes import docs as docs_routes
+from backend.services.drive_storage import UPLOAD_CHUNK_GRANULARITY, DriveStorageService
+
+SIZE = 2 * UPLOAD_CHUNK_GRANULARITY + 10
+PAYLOAD = bytes(i % 251 for i in range(SIZE))
+
+
+class _Response:
+    def __init__(self, status_code, headers=None, body=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body or {}
+        self.text = ""
+
+    def json(self):
+        return self._body
+
+
+class _FakeResumableHttp:
+    """Drive-Resumable-Protokoll: 308 + Range bis komplett, dann 200 + File."""
+
+    def __init__(self):
+        self.received = b""
+        self.started = []
+
+    def post(self, url, json=None, headers=None, **_kwargs):
+        self.started.append((json, headers))
+        return _Response(200, {"Location": "https://upload.example/session-1"})
+
+    def put(self, url, data=None, headers=None, **_kwargs):
+        first, last, total = re.match(
+            r"bytes (\*|\d+)-?(\d*)/(\d+)", headers["Content-Range"]
+        ).groups()
+        if first != "*" and int(first) == len(self.received):
+            self.received += data
+        if len(self.received) == int(total):
+            return _Response(200, body={"id": "drive-new", "parents": ["ordner"]})
+        return _Response(308, {"Range": f"bytes=0-{len(self.received) - 1}"})
+
+
+@pytest.fixture
+def fake_http(app, monkeypatch):
+    app.config["GOOGLE_DRIVE_ID"] = "root"
+    http = _FakeResumableHttp()
+    monkeypatch.setattr(DriveStorageService, "_authorized_http", classmethod(lambda cls: http))
+    monkeypatch.setattr(DriveStorageService, "_build_drive", classmethod(lambda cls: None))
+    monkeypatch.setattr(
+        DriveStorageService, "assert_is_folder_in_drive", classmethod(lambda cls, fid: None)
+    )
+    monkeypatch.setattr(
+        DriveStorageService,
+        "_resolve_filename_collision",
+        classmethod(lambda cls, drive, fid, name: name),
+    )
+    monkeypatch.setattr(docs_routes, "validate_csrf", lambda token: None)
+    return http
+
+
+def _start(client, **overrides):
+    body = {
+        "filename": "Scan.pdf",
+        "size": SIZE,
+        "mime_type": "application/pdf",
+        "title": "Scan Protokoll",
+        "drive_folder_id": "ordner",
+    }
+    body.update(overrides)
+    return client.post("/docs/upload/session", json=body)
+
+
+def _put(client, token, first, last):
+    return client.put(
+        f"/docs/upload/session/{token}",
+        data=PAYLOAD[first:last + 1],
+        headers={"Content-Range": f"bytes {first}-{last}/{SIZE}"},
+        content_type="application/octet-stream",
+    )
+
+
+def test_chunked_upload_resumes_after_lost_response(app, logged_in_client, fake_http):
+    resp = _start(logged_in_client)
+    assert resp.status_code == 201
+    token = resp.get_json()["token"]
+    assert fake_http.started[0][0]["name"] == "Scan Protokoll.pdf"
+
+    step = UPLOAD_CHUNK_GRANULARITY
+    first = _put(logged_in_client, token, 0, step - 1)
+    assert first.get_json() == {"done": False, "received": step}
+    # Doppelt gesendeter Chunk: Server nennt den erwarteten Offset
+    dup = _put(logged_in_client, token, 0, step - 1)
+    assert dup.status_code == 409
+    assert dup.get_json() == {"received": step}
+
+    # Zweiter Chunk kommt bei Drive an, die Antwort geht verloren
+    fake_http.received += PAYLOAD[step:2 * step]
+    status = logged_in_client.get(f"/docs/upload/session/{token}")
+    assert status.get_json() == {"done": False, "received": 2 * step}
+
+    done = _put(logged_in_client, token, 2 * step, SIZE - 1)
+    body = done.get_json()
+    assert body["done"] is True
+    assert body["redirect"].endswith("/docs/folder/ordner")
+    assert fake_http.received == PAYLOAD
+
+    with app.app_context():
+        doc = Document.query.one()
+        assert (doc.drive_file_id, doc.drive_parent_id) == ("drive-new", "ordner")
+        assert DocumentUpload.query.count() == 0
+        audit = AuditEvent.query.filter_by(action=AuditAction.DOCUMENT_UPLOADED).one()
+        assert audit.extra_json["chunked"] is True
+
+
+def test_chunked_upload_keeps_validation(logged_in_client, fake_http):
+    svg = _start(logged_in_client, filename="logo.svg", mime_type="image/svg+xml")
+    assert svg.status_code == 400
+    too_big = _start(logged_in_client, size=101 * 1024 * 1024)
+    assert too_big.status_code == 400
+    assert "zu gross" in too_big.get_json()["error"]
+
+    token = _start(logged_in_client).get_json()["token"]
+    odd = _put(logged_in_client, token, 0, 999)
+    assert odd.status_code == 400
+    assert fake_http.started and fake_http.received == b""
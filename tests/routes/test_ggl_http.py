@@ -0,0 +1,101 @@
+"""HTTP-Tests fuer /ggl/: Tabs rendern, Rangliste pro Saison nur einmal pro Request."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from flask import g
+
+from backend.extensions import db
+from backend.models.event import Event, EventType
+from backend.models.member import Member
+from backend.models.participation import Participation
+from backend.services.ggl_rules import GGLService
+from tests.conftest import count_queries
+
+
+def _add_past_season_event(app) -> None:
+    with app.app_context():
+        org = Member.query.first()
+        db.session.add(
+            Event(
+                organisator_id=org.id,
+                datum=datetime(2025, 3, 1, 19, 0, 0),
+                event_typ=EventType.MONATSESSEN,
+                season=2025,
+                restaurant="Vorjahr",
+                published=True,
+            )
+        )
+        db.session.commit()
+        for season_year in (2025, 2026):
+            GGLService.refresh_season_standings(season_year)
+        db.session.commit()
+
+
+def test_ggl_index_computes_each_season_ranking_once(app, logged_in_client):
+    _add_past_season_event(app)
+    with logged_in_client:
+        resp = logged_in_client.get("/ggl/?tab=tabelle&season=2026")
+        assert resp.status_code == 200
+        cache = g._ggl_request_cache
+        seasons = [s for s in GGLService.get_available_seasons() if s <= GGLService.get_current_season()]
+
+    assert cache.misses["ranking"] == len(seasons)
+    # Ausgewählte Saison: Tabelle + Performance-Kontext aus dem Cache
+    assert cache.hits["ranking"] >= 2
+    assert cache.misses["member_stats"] == len(seasons)
+
+
+def test_ggl_tabs_render(logged_in_client):
+    for tab in ("performance", "tabelle", "rennen"):
+        resp = logged_in_client.get(f"/ggl/?tab={tab}")
+        assert resp.status_code == 200
+
+
+def _add_guessing_members(app, count: int, offset: int) -> None:
+    with app.app_context():
+        ev = Event.query.filter_by(season=2026).first()
+        ev.rechnungsbetrag_rappen = 10000
+        for i in range(offset, offset + count):
+            m = Member(
+                vorname=f"Spieler{i}",
+                nachname="GGL",
+                email=f"spieler{i}-ggl@example.test",
+                passwort_hash="x",
+            )
+            db.session.add(m)
+            db.session.flush()
+            db.session.add(
+                Participation(
+                    member_id=m.id,
+                    event_id=ev.id,
+                    teilnahme=True,
+                    guess_bill_amount_rappen=10000 + 10 * (i + 1),
+                    diff_amount_rappen=10 * (i + 1),
+                )
+            )
+        db.session.commit()
+        GGLService.calculate_event_points(ev.id)
+
+
+def _count_page_queries(app, client, url: str) -> int:
+    # Prozessweite Caches (z. B. Bereinigungs-Fortschritt) vorwärmen
+    assert client.get(url).status_code == 200
+    with app.app_context(), count_queries() as statements:
+        assert client.get(url).status_code == 200
+    return len(statements)
+
+
+def test_ggl_page_query_count_flat_in_member_count(app, logged_in_client):
+    _add_guessing_members(app, 3, 0)
+    few = {
+        tab: _count_page_queries(app, logged_in_client, f"/ggl/?tab={tab}")
+        for tab in ("tabelle", "rennen")
+    }
+    _add_guessing_members(app, 9, 3)
+    many = {
+        tab: _count_page_queries(app, logged_in_client, f"/ggl/?tab={tab}")
+        for tab in ("tabelle", "rennen")
+    }
+    assert many == few
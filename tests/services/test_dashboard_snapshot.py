@@ -0,0 +1,104 @@
+"""Tests für DashboardSnapshotService – Snapshot-Cache pro Mitglied und Invalidierung."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from backend.extensions import db
+from backend.models.event import Event, EventType
+from backend.models.member import Member
+from backend.models.participation import Participation
+from backend.services.dashboard_snapshot import DashboardSnapshotService, _LocalSnapshotBackend
+from backend.services.ggl_rules import GGLService
+
+
+def _count_ranking_calls(monkeypatch) -> list:
+    calls = []
+    original = GGLService.get_season_ranking
+
+    def _counting(season_year):
+        calls.append(season_year)
+        return original(season_year)
+
+    monkeypatch.setattr(GGLService, "get_season_ranking", staticmethod(_counting))
+    return calls
+
+
+def test_warm_dashboard_skips_ranking(app, logged_in_client, monkeypatch):
+    calls = _count_ranking_calls(monkeypatch)
+
+    assert logged_in_client.get("/dashboard/").status_code == 200
+    assert len(calls) == 1
+    assert logged_in_client.get("/dashboard/").status_code == 200
+    assert len(calls) == 1
+
+
+def test_ggl_write_route_invalidates_all_snapshots_after_commit(app, logged_in_client, monkeypatch):
+    calls = _count_ranking_calls(monkeypatch)
+    assert logged_in_client.get("/dashboard/").status_code == 200
+
+    with app.app_context():
+        ev = Event.query.one()
+        # Der Service selbst invalidiert nicht (das übernimmt der Aufrufer nach dem Commit)
+        GGLService.refresh_season_standings(ev.season)
+        db.session.commit()
+        event_id = ev.id
+
+    assert logged_in_client.get("/dashboard/").status_code == 200
+    assert len(calls) == 1
+
+    assert logged_in_client.post(f"/billbro/{event_id}/reset_bill").status_code == 302
+    assert logged_in_client.get("/dashboard/").status_code == 200
+    assert len(calls) == 2
+
+
+def test_snapshot_reflects_member_writes_after_invalidation(app):
+    with app.app_context():
+        member = Member(vorname="Dash", nachname="Board", email="dash@example.test", passwort_hash="x")
+        db.session.add(member)
+        db.session.flush()
+        ev = Event(
+            organisator_id=member.id,
+            datum=datetime(2024, 6, 1, 19, 0, 0),
+            event_typ=EventType.MONATSESSEN,
+            season=2024,
+            published=True,
+        )
+        db.session.add(ev)
+        db.session.commit()
+
+        snapshot = DashboardSnapshotService.get_snapshot(member.id)
+        assert snapshot["latest_bill_event_id"] is None
+
+        db.session.add(
+            Participation(member_id=member.id, event_id=ev.id, teilnahme=True, calculated_share_rappen=4500)
+        )
+        db.session.commit()
+        assert DashboardSnapshotService.get_snapshot(member.id) == snapshot
+
+        DashboardSnapshotService.invalidate_member(member.id)
+        snapshot = DashboardSnapshotService.get_snapshot(member.id)
+        assert snapshot["latest_bill_event_id"] == ev.id
+
+        context = DashboardSnapshotService.hydrate(snapshot)
+        assert context["latest_bill_event"].id == ev.id
+        assert context["latest_bill_participation"].calculated_share_rappen == 4500
+
+
+def test_local_backend_evicts_least_recently_used():
+    backend = _LocalSnapshotBackend(maxsize=2)
+    backend.set("a", "1", ttl=60)
+    backend.set("b", "2", ttl=60)
+    assert backend.get("a") == "1"
+    backend.set("c", "3", ttl=60)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == "1"
+    assert backend.get("c") == "3"
+
+    backend.set("d", "4", ttl=0)
+    assert backend.get("d") is None
+
+    backend.bump_generation()
+    assert backend.generation() == 1
+    assert backend.get("a") is None
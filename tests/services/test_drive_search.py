@@ -0,0 +1,98 @@
+"""Tests fuer den lokalen Dokumenten-Suchindex (FTS5 in SQLite, FakeDrive)."""
+
+import pytest
+
+from backend.extensions import db
+from backend.models.document_search_entry import DocumentSearchEntry
+from backend.models.member import Member
+from backend.services.drive_search import DriveSearchIndex, extract_text
+from backend.services.drive_storage import DriveStorageService, FolderRef
+from tests.fake_drive import FakeDrive
+from tests.services.test_drive_storage import _file, _folder
+
+
+@pytest.fixture
+def indexed_drive(app, monkeypatch):
+    """root → archiv → 2023 → belege, root → vorstand; per Voll-Re-Sync indexiert."""
+    app.config["GOOGLE_DRIVE_ID"] = "root"
+    drive = FakeDrive(
+        [
+            _file("beleg-1", "belege"),
+            _file("beleg-2", "belege"),
+            dict(_file("kasse", "2023"), name="Kassenbericht Übersicht.pdf"),
+            dict(_file("protokoll", "vorstand"), name="Protokoll GV.pdf"),
+            dict(_file("protokoll-alt", "2023"), name="Protokoll GV 2023.pdf"),
+            _folder("belege", "2023"),
+            _folder("2023", "archiv"),
+            _folder("archiv", "root"),
+            _folder("vorstand", "root"),
+        ]
+    )
+    monkeypatch.setattr(DriveStorageService, "_build_drive", classmethod(lambda cls: drive))
+    with app.app_context():
+        actor = Member(vorname="Ad", nachname="Min", email="drive-admin@example.test", passwort_hash="x")
+        db.session.add(actor)
+        db.session.commit()
+        DriveStorageService.admin_full_resync(actor)
+        drive.reset_counters()
+        yield drive
+
+
+def test_resync_fills_index_with_folder_paths(app, indexed_drive) -> None:
+    with app.app_context():
+        entry = DocumentSearchEntry.query.filter_by(drive_file_id="beleg-1").one()
+        # Ordner kommen im Listing erst nach den Dateien: Pfade setzt refresh_paths
+        assert entry.folder_path == "Archiv / 2023 / Belege"
+        assert entry.folder_ids == "/archiv/2023/belege/"
+
+        page = DriveStorageService.search_files("belege")
+        assert page.total == 2
+        assert page.hits[0].breadcrumb == [
+            FolderRef(id="archiv", name="Archiv"),
+            FolderRef(id="2023", name="2023"),
+            FolderRef(id="belege", name="Belege"),
+        ]
+        # Praefix + Diakritika: "uebers" findet "Übersicht"
+        assert [h.drive_file_id for h in DriveStorageService.search_files("kassen ubers").hits] == ["kasse"]
+        assert indexed_drive.list_calls == [] and indexed_drive.get_calls == []
+
+
+def test_scoped_search_filters_in_query_and_pages(app, indexed_drive) -> None:
+    with app.app_context():
+        unscoped = DriveStorageService.search_files("protokoll")
+        scoped = DriveStorageService.search_files("protokoll", scope_folder_id="archiv")
+        assert unscoped.total == 2
+        assert [h.drive_file_id for h in scoped.hits] == ["protokoll-alt"]
+
+        first = DriveStorageService.search_files("pdf", per_page=2)
+        second = DriveStorageService.search_files("pdf", page=2, per_page=2)
+        third = DriveStorageService.search_files("pdf", page=3, per_page=2)
+        assert (first.total, first.pages) == (5, 3)
+        ids = [h.drive_file_id for p in (first, second, third) for h in p.hits]
+        assert sorted(ids) == ["beleg-1", "beleg-2", "kasse", "protokoll", "protokoll-alt"]
+
+
+def test_index_follows_rename_and_extracted_text(app, indexed_drive) -> None:
+    with app.app_context():
+        indexed_drive.pages = {
+            "1": {
+                "newStartPageToken": "2",
+                "changes": [
+                    {"fileId": "vorstand", "file": dict(_folder("vorstand", "root"), name="Leitung")},
+                    {"fileId": "beleg-2", "removed": True},
+                ],
+            }
+        }
+        actor = Member.query.one()
+        DriveStorageService.admin_incremental_sync(actor)
+
+        assert DriveStorageService.search_files("leitung").hits[0].drive_file_id == "protokoll"
+        assert DriveStorageService.search_files("vorstand").total == 0
+        assert DocumentSearchEntry.query.filter_by(drive_file_id="beleg-2").count() == 0
+
+        body = extract_text("Traktanden:\n  Jahresrechnung   Budget".encode(), "text/plain")
+        assert body == "Traktanden: Jahresrechnung Budget"
+        assert extract_text(b"<svg/>", "image/svg+xml") == ""
+        DriveSearchIndex.upsert("protokoll", parent_id="vorstand", chain=[], body_text=body)
+        db.session.commit()
+        assert [h.drive_file_id for h in DriveStorageService.search_files("jahresrech").hits] == ["protokoll"]
@@ -5,15 +5,33 @@ Schwerpunkte: Filename-Sanitization (Capability 7.4) und SVG-Sanitization
 
 Tests die einen echten Drive-Zugriff brauchen (Upload, Move, Permissions)
 sind hier bewusst nicht enthalten; sie laufen manuell gegen ein Test-Drive.
+Listing- und Sync-Tests laufen gegen `tests.fake_drive.FakeDrive` und zaehlen API-Calls.
 """
 
+import gc
+import io
+import threading
+from datetime import datetime, timedelta
+
 import pytest
 
+from backend.extensions import db
+from backend.models.audit_event import AuditAction, AuditEvent
+from backend.models.document import Document
+from backend.models.drive_folder import DriveFolder
+from backend.models.drive_sync_state import DriveSyncState
+from backend.models.member import Member
+from backend.services import drive_storage
 from backend.services.drive_storage import (
+    GOOGLE_FOLDER_MIME,
     DriveSanitizationError,
+    DriveStorageService,
+    FolderRef,
     sanitize_drive_filename,
     sanitize_svg_bytes,
 )
+from tests.conftest import count_queries
+from tests.fake_drive import FakeDrive
 
 
 # ---------------------------------------------------------------------------
@@ -178,3 +196,362 @@ class TestSanitizeSvgBytes:
         )
         with pytest.raises(DriveSanitizationError):
             sanitize_svg_bytes(attack)
+
+
+# ---------------------------------------------------------------------------
+# Listing (FakeDrive)
+# ---------------------------------------------------------------------------
+
+
+def _tree(subfolder_count: int) -> list[dict]:
+    items = []
+    for i in range(subfolder_count):
+        fid = f"sub{i}"
+        items.append(
+            {"id": fid, "name": f"Ordner {i}", "mimeType": GOOGLE_FOLDER_MIME, "parents": ["root"]}
+        )
+        items.extend(
+            {"id": f"{fid}-f{j}", "name": f"f{j}.pdf", "mimeType": "application/pdf", "parents": [fid]}
+            for j in range(i % 3)
+        )
+    items.append({"id": "top.pdf", "name": "Top.pdf", "mimeType": "application/pdf", "parents": ["root"]})
+    return items
+
+
+@pytest.mark.parametrize("subfolder_count", [3, 30])
+def test_list_folder_counts_children_in_bulk(app, monkeypatch, subfolder_count) -> None:
+    app.config["GOOGLE_DRIVE_ID"] = "root"
+    stub = FakeDrive(_tree(subfolder_count))
+    monkeypatch.setattr(DriveStorageService, "_build_drive", classmethod(lambda cls: stub))
+
+    with app.app_context():
+        listing = DriveStorageService.list_folder("root")
+
+    counts = {fm.id: fm.direct_child_count for fm in listing.subfolders}
+    assert counts == {f"sub{i}": i % 3 for i in range(subfolder_count)}
+    assert [fr.drive_file_id for fr in listing.files] == ["top.pdf"]
+    # Ordner-Listing + eine Zaehl-Query pro Block, unabhaengig von der Ordnerzahl
+    assert len(stub.list_calls) == 2
+
+
+def test_bulk_child_count_chunks_and_pages(app, monkeypatch) -> None:
+    monkeypatch.setattr(drive_storage, "COUNT_PARENTS_PER_QUERY", 2)
+    items = [{"id": f"c{j}", "parents": ["a"]} for j in range(1500)]
+    items.append({"id": "x", "parents": ["c"]})
+    stub = FakeDrive(items)
+
+    counts = DriveStorageService._count_children_bulk(stub, ["a", "b", "c"], "root")
+
+    assert counts == {"a": 1500, "b": 0, "c": 1}
+    # Block (a, b) braucht zwei Seiten, Block (c) eine
+    assert len(stub.list_calls) == 3
+
+
+# ---------------------------------------------------------------------------
+# Drive-Client-Pool
+# ---------------------------------------------------------------------------
+
+
+class _StubCredentials:
+    def __init__(self):
+        self.valid = False
+        self.refreshes = 0
+
+    def refresh(self, _request):
+        self.refreshes += 1
+        self.valid = True
+
+
+def test_drive_client_built_once_per_thread(app, monkeypatch) -> None:
+    app.config["GOOGLE_DRIVE_ID"] = "root"
+    creds = _StubCredentials()
+    loads: list[int] = []
+    builds: list[FakeDrive] = []
+
+    def fake_build(*_args, credentials, **_kwargs):
+        assert credentials is creds and creds.valid
+        builds.append(FakeDrive(_tree(3)))
+        return builds[-1]
+
+    monkeypatch.setattr(
+        DriveStorageService, "_load_credentials", staticmethod(lambda: loads.append(1) or creds)
+    )
+    monkeypatch.setattr("googleapiclient.discovery.build", fake_build)
+
+    with app.app_context():
+        for folder_id in ("root", "sub0", "sub1"):
+            DriveStorageService.list_folder(folder_id)
+        assert DriveStorageService._build_drive() is builds[0]
+        assert (len(builds), len(loads), creds.refreshes) == (1, 1, 1)
+
+        # Abgelaufenes Token: Refresh, aber kein neuer Client
+        creds.valid = False
+        DriveStorageService._build_drive()
+        assert (len(builds), creds.refreshes) == (1, 2)
+
+        pool = DriveStorageService._client_pool()
+        other = threading.Thread(target=pool.drive)
+        other.start()
+        other.join()
+        assert len(builds) == 2
+        # Client des beendeten Threads wird vom Pool nicht festgehalten
+        del other
+        builds[1] = None
+        gc.collect()
+        assert list(pool._open) == [builds[0]]
+
+        DriveStorageService.close_drive_clients()
+        DriveStorageService._build_drive()
+        assert (len(builds), len(loads)) == (3, 2)
+
+
+def test_client_built_during_close_is_not_registered(app) -> None:
+    pool = drive_storage.DriveClientPool(lambda: type("Creds", (), {"valid": True})())
+    built = []
+
+    def racing_factory(_credentials):
+        client = FakeDrive([])
+        built.append(client)
+        if len(built) == 1:
+            pool.close()  # close() laeuft waehrend des ersten Aufbaus
+        return client
+
+    client = pool._thread_client("drive", racing_factory)
+    assert client is built[1]
+    assert list(pool._open) == [built[1]]
+    assert pool._thread_client("drive", racing_factory) is client
+
+
+# ---------------------------------------------------------------------------
+# Lokaler Ordner-Baum (drive_folders)
+# ---------------------------------------------------------------------------
+
+
+def _folder(fid: str, parent: str) -> dict:
+    return {"id": fid, "name": fid.title(), "mimeType": GOOGLE_FOLDER_MIME, "parents": [parent]}
+
+
+@pytest.fixture
+def archive_drive(app, monkeypatch):
+    """root → archiv → 2023 → belege, plus root → vorstand."""
+    app.config["GOOGLE_DRIVE_ID"] = "root"
+    app.config["DRIVE_ARCHIVE_FOLDER_ID"] = "archiv"
+    stub = FakeDrive(
+        [
+            _folder("archiv", "root"),
+            _folder("2023", "archiv"),
+            _folder("belege", "2023"),
+            _folder("vorstand", "root"),
+        ]
+    )
+    monkeypatch.setattr(DriveStorageService, "_build_drive", classmethod(lambda cls: stub))
+    return stub
+
+
+def test_breadcrumb_answered_from_local_tree(app, archive_drive) -> None:
+    with app.app_context():
+        crumbs = DriveStorageService.get_folder_breadcrumb("belege")
+        assert crumbs == [
+            FolderRef(id="archiv", name="Archiv"),
+            FolderRef(id="2023", name="2023"),
+            FolderRef(id="belege", name="Belege"),
+        ]
+        assert archive_drive.get_calls == ["belege", "2023", "archiv"]
+        assert DriveFolder.query.count() == 3
+
+        archive_drive.get_calls.clear()
+        assert DriveStorageService.get_folder_breadcrumb("belege") == crumbs
+        assert DriveStorageService._folder_reachable_from_root(None, "belege", "root")
+        assert archive_drive.get_calls == []
+
+        # Abgelaufene Knoten werden aus Drive nachgeladen
+        app.config["DRIVE_FOLDER_TREE_TTL_SECONDS"] = 0
+        DriveStorageService.get_folder_breadcrumb("2023")
+        assert archive_drive.get_calls == ["2023", "archiv"]
+
+
+def test_read_paths_do_not_commit_caller_work(app, archive_drive) -> None:
+    with app.app_context():
+        # Offene Arbeit des Aufrufers (z. B. Upload in Arbeit) darf nicht mitcommittet werden
+        db.session.add(Document(drive_file_id="pending.pdf", drive_parent_id="belege"))
+        DriveStorageService.list_folder("root")
+        DriveStorageService.get_folder_breadcrumb("belege")
+        assert DriveFolder.query.count() == 4
+        db.session.rollback()
+
+        assert Document.query.filter_by(drive_file_id="pending.pdf").count() == 0
+        assert DriveFolder.query.count() == 0
+
+
+def test_archive_check_uses_folders_seen_while_listing(app, archive_drive) -> None:
+    with app.app_context():
+        db.session.add_all(
+            [
+                Document(drive_file_id="beleg.pdf", drive_parent_id="belege"),
+                Document(drive_file_id="protokoll.pdf", drive_parent_id="vorstand"),
+            ]
+        )
+        db.session.commit()
+        for folder_id in ("root", "archiv", "2023"):
+            DriveStorageService.list_folder(folder_id)
+
+        beleg = Document.query.filter_by(drive_file_id="beleg.pdf").one()
+        protokoll = Document.query.filter_by(drive_file_id="protokoll.pdf").one()
+        assert DriveStorageService.document_is_under_archive(beleg)
+        assert not DriveStorageService.document_is_under_archive(protokoll)
+        assert archive_drive.get_calls == []
+
+
+def test_folder_listing_cached_until_mutation(app, archive_drive) -> None:
+    archive_drive.items += [_file("a", "vorstand"), _file("b", "2023")]
+    with app.app_context():
+        actor = Member(vorname="Ad", nachname="Min", email="drive-admin@example.test", passwort_hash="x")
+        doc = Document(drive_file_id="a", drive_parent_id="vorstand")
+        db.session.add_all([actor, doc])
+        db.session.commit()
+        folders = ("root", "archiv", "2023", "vorstand")
+        first = {fid: DriveStorageService.list_folder(fid) for fid in folders}
+
+        archive_drive.list_calls.clear()
+        again = {fid: DriveStorageService.list_folder(fid) for fid in folders}
+        assert archive_drive.list_calls == []
+        assert {fid: listing.etag for fid, listing in again.items()} == {
+            fid: listing.etag for fid, listing in first.items()
+        }
+
+        DriveStorageService.move_document(doc, "archiv", actor)
+        archive_drive.list_calls.clear()
+        after = {fid: DriveStorageService.list_folder(fid) for fid in folders}
+
+        # Quelle, Ziel und deren Parent (Kachel-Counts) neu, 2023 bleibt im Cache:
+        # root und archiv je Listing + Zaehl-Query, vorstand ohne Unterordner
+        assert len(archive_drive.list_calls) == 5
+        assert after["2023"].etag == first["2023"].etag
+        assert after["vorstand"].files == []
+        assert [f.drive_file_id for f in after["archiv"].files] == ["a"]
+        assert after["archiv"].files[0].document_under_archive
+        assert after["root"].etag != first["root"].etag
+
+        app.config["DRIVE_FOLDER_LISTING_TTL_SECONDS"] = 0
+        DriveStorageService.invalidate_folder_listings()
+        archive_drive.list_calls.clear()
+        DriveStorageService.list_folder("2023")
+        DriveStorageService.list_folder("2023")
+        assert len(archive_drive.list_calls) == 4  # TTL 0: kein Cache
+
+
+# ---------------------------------------------------------------------------
+# Inkrementeller Sync (Changes API)
+# ---------------------------------------------------------------------------
+
+
+def _file(fid: str, parent: str) -> dict:
+    return {"id": fid, "name": f"{fid}.pdf", "mimeType": "application/pdf", "parents": [parent]}
+
+
+def test_incremental_sync_applies_only_changes(app, archive_drive) -> None:
+    archive_drive.items += [_file("a", "vorstand"), _file("b", "vorstand"), _file("c", "2023")]
+    with app.app_context():
+        actor = Member(vorname="Ad", nachname="Min", email="drive-admin@example.test", passwort_hash="x")
+        db.session.add(actor)
+        db.session.commit()
+
+        # Ohne Token: Voll-Re-Sync, danach ist der Start-Token gespeichert
+        first = DriveStorageService.admin_incremental_sync(actor)
+        assert (first.mode, first.imported) == ("full", 3)
+        assert DriveSyncState.query.one().start_page_token == "1"
+
+        archive_drive.list_calls.clear()
+        archive_drive.pages = {
+            "1": {
+                "nextPageToken": "2",
+                "changes": [
+                    {"fileId": "d", "file": _file("d", "archiv")},
+                    {"fileId": "a", "file": _file("a", "archiv")},
+                ],
+            },
+            "2": {
+                "newStartPageToken": "3",
+                "changes": [
+                    {"fileId": "b", "file": dict(_file("b", "vorstand"), trashed=True)},
+                    {"fileId": "c", "removed": True},
+                    {"fileId": "belege", "removed": True},
+                ],
+            },
+        }
+        report = DriveStorageService.admin_incremental_sync(actor)
+
+        assert report.mode == "incremental"
+        assert (report.imported, report.parent_updates, report.orphans_removed) == (1, 1, 2)
+        assert archive_drive.change_calls == ["1", "2"]
+        assert archive_drive.list_calls == []
+        assert DriveSyncState.query.one().start_page_token == "3"
+        docs = {d.drive_file_id: d.drive_parent_id for d in Document.query.all()}
+        assert docs == {"a": "archiv", "d": "archiv"}
+        assert DriveFolder.query.filter_by(drive_folder_id="belege").count() == 0
+
+
+def test_fake_drive_round_trip_upload_permissions_changes(app, archive_drive) -> None:
+    """Upload, Membership und Changes-Protokoll laufen komplett gegen den Fake."""
+    with app.app_context():
+        member = Member(vorname="Ad", nachname="Min", email="drive-admin@example.test",
+                        passwort_hash="x", google_email="ad@example.test", google_email_verified=True)
+        db.session.add(member)
+        db.session.commit()
+        DriveStorageService.admin_full_resync(member)
+
+        doc = DriveStorageService.upload_document(
+            io.BytesIO(b"Traktanden GV"), "Traktanden", "vorstand", member,
+            original_filename="t.txt", mime_type="text/plain",
+        )
+        assert archive_drive.item(doc.drive_file_id)["content"] == b"Traktanden GV"
+        assert DriveStorageService.search_files("traktanden").total == 1
+
+        DriveStorageService.invite_member_to_drive(member)
+        assert archive_drive.permissions_by_file["root"][0]["emailAddress"] == "ad@example.test"
+        DriveStorageService.remove_member_from_drive(member)
+        assert archive_drive.permissions_by_file["root"] == []
+
+        # Direkt in Drive verschoben: der inkrementelle Sync liest es aus dem Protokoll
+        archive_drive.files().update(
+            fileId=doc.drive_file_id, addParents="archiv", removeParents="vorstand"
+        ).execute()
+        archive_drive.reset_counters()
+        report = DriveStorageService.admin_incremental_sync(member)
+        assert report.parent_updates == 1
+        assert db.session.get(Document, doc.id).drive_parent_id == "archiv"
+        assert archive_drive.calls == {"changes.list": 1}
+
+
+# ---------------------------------------------------------------------------
+# Voll-Re-Sync (mengenbasierter Abgleich)
+# ---------------------------------------------------------------------------
+
+
+def test_full_resync_reconciles_per_page(app, archive_drive) -> None:
+    archive_drive.items += [_file(f"f{i}", "vorstand") for i in range(2500)]
+    with app.app_context():
+        actor = Member(vorname="Ad", nachname="Min", email="drive-admin@example.test", passwort_hash="x")
+        yesterday = datetime.utcnow() - timedelta(days=1)
+        db.session.add_all(
+            [
+                actor,
+                Document(drive_file_id="f1", drive_parent_id="vorstand", last_seen_at=yesterday),
+                Document(drive_file_id="f2", drive_parent_id="archiv", last_seen_at=yesterday),
+                Document(drive_file_id="weg", drive_parent_id="vorstand", last_seen_at=yesterday),
+            ]
+        )
+        db.session.commit()
+
+        with count_queries() as statements:
+            report = DriveStorageService.admin_full_resync(actor)
+
+        assert (report.files_seen, report.imported) == (2500, 2498)
+        assert (report.parent_updates, report.orphans_removed) == (1, 1)
+        assert Document.query.count() == 2500
+        assert db.session.get(Document, 2).drive_parent_id == "vorstand"
+        assert Document.query.filter(Document.last_seen_at <= yesterday).count() == 0
+        imported = AuditEvent.query.filter_by(action=AuditAction.DOCUMENT_AUTO_IMPORTED).count()
+        assert imported == 2498
+        # Drei Drive-Seiten: Statements pro Seite statt pro Datei
+        assert len(statements) < 40
@@ -0,0 +1,314 @@
+"""Tests für GGLService – Saison-Rangliste (Aggregat, Tie-Ranking, Query-Anzahl)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+import backend.models  # noqa: F401
+from backend.extensions import db
+from backend.models.event import Event, EventType
+from backend.models.ggl_season_standing import GGLSeasonStanding
+from backend.models.member import Member, Role
+from backend.models.participation import Participation
+from backend.services.ggl_rules import GGLService
+from tests.conftest import count_queries
+
+
+SEASON = 2025
+
+
+def _member(vorname: str, *, is_active: bool = True) -> Member:
+    m = Member(
+        vorname=vorname,
+        nachname="GGL",
+        email=f"{vorname.lower()}-ggl@example.test",
+        passwort_hash=generate_password_hash("TestPasswortMind12"),
+        is_active=is_active,
+    )
+    db.session.add(m)
+    db.session.flush()
+    return m
+
+
+def _event(org: Member, month: int, *, season: int = SEASON, bill: int = 10000) -> Event:
+    ev = Event(
+        organisator_id=org.id,
+        datum=datetime(season, month, 1, 19, 0, 0),
+        event_typ=EventType.MONATSESSEN,
+        season=season,
+        restaurant=f"Testlokal {month}",
+        published=True,
+        rechnungsbetrag_rappen=bill,
+    )
+    db.session.add(ev)
+    db.session.flush()
+    return ev
+
+
+def _guess(member: Member, ev: Event, guess: int, *, teilnahme: bool = True) -> Participation:
+    p = Participation(
+        member_id=member.id,
+        event_id=ev.id,
+        teilnahme=teilnahme,
+        guess_bill_amount_rappen=guess,
+        diff_amount_rappen=abs(guess - ev.rechnungsbetrag_rappen),
+    )
+    db.session.add(p)
+    db.session.flush()
+    return p
+
+
+@pytest.fixture
+def ggl_season(app):
+    """Drei Events mit Punkten, ein Gleichstand, ein inaktives Mitglied, ein Event anderer Saison."""
+    with app.app_context():
+        anna = _member("Anna")
+        ben = _member("Ben")
+        cleo = _member("Cleo")
+        dora = _member("Dora")  # keine Teilnahme
+        ernst = _member("Ernst", is_active=False)
+
+        ev1 = _event(anna, 1)
+        _guess(anna, ev1, 10100)
+        _guess(ben, ev1, 9800)
+        _guess(cleo, ev1, 10500)
+        _guess(ernst, ev1, 10050)
+
+        ev2 = _event(ben, 2)
+        _guess(anna, ev2, 9900)
+        _guess(ben, ev2, 10100)  # gleiche Differenz wie Anna
+        _guess(cleo, ev2, 12000)
+
+        ev3 = _event(cleo, 3)
+        _guess(cleo, ev3, 10020)
+        _guess(ben, ev3, 10300)
+        _guess(anna, ev3, 8000, teilnahme=False)
+
+        other = _event(anna, 4, season=SEASON + 1)
+        _guess(dora, other, 10000)
+
+        db.session.commit()
+        for ev in (ev1, ev2, ev3, other):
+            GGLService.calculate_event_points(ev.id)
+
+        # Schätzung ohne ausgewertete Punkte: zählt nur in Ø-Differenz.
+        ev4 = _event(anna, 5)
+        _guess(dora, ev4, 10400)
+        GGLService.refresh_season_standings(SEASON)
+        db.session.commit()
+
+        yield {
+            "anna": anna.id,
+            "ben": ben.id,
+            "cleo": cleo.id,
+            "dora": dora.id,
+            "ernst": ernst.id,
+        }
+
+
+def test_season_ranking_aggregates_and_tie_ranks(app, ggl_season):
+    ids = ggl_season
+    with app.app_context():
+        ranking = GGLService.get_season_ranking(SEASON)
+
+    by_id = {row["member_id"]: row for row in ranking}
+    assert ids["ernst"] not in by_id
+
+    # ev1: Ernst 4, Anna 3, Ben 2, Cleo 1 | ev2: Anna/Ben 2.5, Cleo 1 | ev3: Cleo 2, Ben 1
+    assert by_id[ids["anna"]]["total_points"] == 5.5
+    assert by_id[ids["ben"]]["total_points"] == 5.5
+    assert by_id[ids["cleo"]]["total_points"] == 4
+    assert by_id[ids["anna"]]["events_ranked"] == 2
+    assert by_id[ids["ben"]]["participation_count"] == 3
+    assert by_id[ids["anna"]]["avg_diff_rappen"] == 100
+    assert by_id[ids["ben"]]["avg_diff_rappen"] == 200
+
+    dora = by_id[ids["dora"]]
+    assert dora["total_points"] == 0
+    assert dora["participation_count"] == 0
+    assert dora["avg_points"] == 0
+    assert dora["avg_diff_rappen"] == 400
+
+    assert [row["member_id"] for row in ranking] == [
+        ids["anna"], ids["ben"], ids["cleo"], ids["dora"],
+    ]
+    assert [row["rank"] for row in ranking] == [1, 2, 3, 4]
+
+
+def test_season_ranking_equal_key_shares_rank(app, ggl_season):
+    ids = ggl_season
+    with app.app_context():
+        ev = Event.query.filter_by(season=SEASON, restaurant="Testlokal 1").one()
+        p = Participation.query.filter_by(event_id=ev.id, member_id=ids["ben"]).one()
+        p.points = 0.5
+        GGLService.refresh_season_standings(SEASON)
+        db.session.commit()
+        ranking = GGLService.get_season_ranking(SEASON)
+
+    # Ben und Cleo: je 4 Punkte aus 3 Events – gleicher Schlüssel, gleicher Rang.
+    assert [r["member_id"] for r in ranking[1:3]] == [ids["ben"], ids["cleo"]]
+    assert [r["rank"] for r in ranking] == [1, 2, 2, 4]
+
+
+def test_season_ranking_query_count_independent_of_events(app, ggl_season):
+    with app.app_context():
+        with count_queries() as before:
+            GGLService.get_season_ranking(SEASON)
+
+        org = Member.query.filter_by(vorname="Anna").one()
+        for month in range(6, 12):
+            _event(org, month)
+        db.session.commit()
+
+        with count_queries() as after:
+            GGLService.get_season_ranking(SEASON)
+
+    assert len(before) == 1
+    assert len(after) == len(before)
+
+
+def test_calculate_event_points_materializes_season(app, ggl_season):
+    ids = ggl_season
+    with app.app_context():
+        standings = {
+            s.member_id: s for s in GGLSeasonStanding.query.filter_by(season=SEASON).all()
+        }
+        # Ernst ist inaktiv, wird aber gespeichert; Dora hat nur eine Schätzung ohne Punkte.
+        assert set(standings) == {ids["anna"], ids["ben"], ids["cleo"], ids["dora"], ids["ernst"]}
+        assert standings[ids["anna"]].total_points == 5.5
+        assert standings[ids["dora"]].guesses_count == 1
+        assert standings[ids["dora"]].events_ranked == 0
+        assert standings[ids["ernst"]].rank is None
+        assert GGLSeasonStanding.query.filter_by(season=SEASON + 1).count() == 1
+        assert GGLService.verify_season_standings(SEASON) == []
+
+
+def test_stored_ranking_matches_live_computation(app, ggl_season):
+    ids = ggl_season
+    with app.app_context():
+        assert GGLService.get_season_ranking(SEASON) == GGLService._compute_season_ranking(SEASON)
+
+        member = db.session.get(Member, ids["ben"])
+        member.is_active = False
+        db.session.commit()
+        # Deaktivierung ändert die Tabelle ohne Refresh (Rang wird beim Lesen gesetzt).
+        assert GGLService.get_season_ranking(SEASON) == GGLService._compute_season_ranking(SEASON)
+
+        ernst = db.session.get(Member, ids["ernst"])
+        ernst.is_active = True
+        db.session.commit()
+        assert GGLService.get_season_ranking(SEASON) == GGLService._compute_season_ranking(SEASON)
+
+
+def test_member_season_stats_from_standings(app, ggl_season):
+    ids = ggl_season
+    with app.app_context():
+        stats = GGLService.get_member_season_stats(ids["ben"], SEASON)
+        live = GGLService._compute_member_season_stats(ids["ben"], SEASON)
+        assert stats == live
+        assert stats["total_points"] == 5.5
+        assert stats["participation_count"] == 3
+
+        dora = GGLService.get_member_season_stats(ids["dora"], SEASON)
+        assert dora == GGLService._compute_member_season_stats(ids["dora"], SEASON)
+
+
+def test_season_without_standings_is_read_only(app, ggl_season):
+    ids = ggl_season
+    with app.app_context():
+        with count_queries() as statements:
+            ranking = GGLService.get_season_ranking(SEASON + 5)
+
+        assert len(statements) == 1
+        assert statements[0].lstrip().upper().startswith("SELECT")
+        assert {r["member_id"] for r in ranking} == {ids["anna"], ids["ben"], ids["cleo"], ids["dora"]}
+        assert all(r["total_points"] == 0 and r["rank"] == 1 for r in ranking)
+        assert GGLSeasonStanding.query.filter_by(season=SEASON + 5).count() == 0
+
+
+def test_verify_reports_stale_standings(app, ggl_season):
+    ids = ggl_season
+    with app.app_context():
+        standing = GGLSeasonStanding.query.filter_by(member_id=ids["cleo"], season=SEASON).one()
+        standing.avg_diff_rappen = 1
+        db.session.commit()
+        problems = GGLService.verify_season_standings(SEASON)
+        assert len(problems) == 1
+        assert f"Mitglied {ids['cleo']}" in problems[0]
+
+
+def test_reset_bill_route_refreshes_season(app, logged_in_client):
+    with app.app_context():
+        ev = Event.query.one()
+        org = db.session.get(Member, ev.organisator_id)
+        ev.rechnungsbetrag_rappen = 10000
+        _guess(org, ev, 10200)
+        db.session.commit()
+        GGLService.calculate_event_points(ev.id)
+        standing = GGLSeasonStanding.query.filter_by(member_id=org.id, season=ev.season).one()
+        assert standing.avg_diff_rappen == 200
+        event_id = ev.id
+
+    resp = logged_in_client.post(f"/billbro/{event_id}/reset_bill")
+    assert resp.status_code == 302
+
+    with app.app_context():
+        ev = db.session.get(Event, event_id)
+        standing = GGLSeasonStanding.query.filter_by(member_id=ev.organisator_id, season=ev.season).one()
+        assert standing.avg_diff_rappen == 0
+        assert GGLService.verify_season_standings(ev.season) == []
+
+
+def test_delete_event_route_refreshes_season(app, logged_in_client):
+    with app.app_context():
+        ev = Event.query.one()
+        org = db.session.get(Member, ev.organisator_id)
+        org.role = Role.ADMIN
+        ev.datum = datetime.utcnow()
+        ev.rechnungsbetrag_rappen = 10000
+        _guess(org, ev, 10200)
+        db.session.commit()
+        GGLService.calculate_event_points(ev.id)
+        assert GGLSeasonStanding.query.filter_by(member_id=org.id, season=ev.season).count() == 1
+        event_id, season_year = ev.id, ev.season
+
+    resp = logged_in_client.post(f"/events/{event_id}/delete")
+    assert resp.status_code == 302
+
+    with app.app_context():
+        assert db.session.get(Event, event_id) is None
+        assert GGLSeasonStanding.query.filter_by(season=season_year).count() == 0
+        assert GGLService.verify_season_standings(season_year) == []
+
+
+def test_season_progression_cumulates_and_ranks(app, ggl_season):
+    ids = ggl_season
+    with app.app_context():
+        data = GGLService.get_season_progression_data(SEASON)
+
+    # ev4 hat keine Punkte und erscheint nicht im Rennen
+    assert [ev.restaurant for ev in data["events"]] == ["Testlokal 1", "Testlokal 2", "Testlokal 3"]
+    prog = data["progression_data"]
+    assert ids["dora"] not in prog
+    assert ids["ernst"] in prog  # Verlauf zeigt auch inaktive Mitglieder mit Punkten
+
+    anna = prog[ids["anna"]]
+    assert anna["cumulative_points"] == [3, 5.5, 5.5]
+    assert anna["ranks"] == [2, 1, None]
+    assert anna["cumulative_signed_diff_rappen"] == [100, 0, 0]
+    assert anna["cumulative_abs_diff_rappen"] == [100, 200, 200]
+
+    ben = prog[ids["ben"]]
+    assert ben["cumulative_points"] == [2, 4.5, 5.5]
+    assert ben["ranks"] == [3, 1, 2]
+    assert ben["member"]["id"] == ids["ben"]
+
+
+def test_season_progression_query_count_independent_of_events(app, ggl_season):
+    with app.app_context():
+        with count_queries() as statements:
+            GGLService.get_season_progression_data(SEASON)
+    assert len(statements) == 2
@@ -0,0 +1,222 @@
+"""Tests für die Monatsessen-Statistik – Snapshot, Filter, Neuaufbau bei Änderungen."""
+
+from __future__ import annotations
+
+import threading
+from datetime import date, datetime
+
+import pytest
+
+import backend.models  # noqa: F401
+from backend.extensions import db
+from backend.models.event import Event, EventType
+from backend.models.member import Member
+from backend.models.participation import Esstyp, Participation
+from backend.models.rating import EventRating
+from backend.services import monatsessen_stats
+from backend.services.monatsessen_stats import (
+    RestaurantLabelIndex,
+    get_landing_restaurant_table,
+    get_monatsessen_statistics,
+    get_public_hitlist_index,
+)
+from tests.conftest import count_queries
+
+NOW = datetime(2026, 10, 17, 12, 0, 0)
+
+
+def _member(vorname: str, **kwargs) -> Member:
+    m = Member(vorname=vorname, nachname="Stats", email=f"{vorname.lower()}-stats@example.test",
+               passwort_hash="x", **kwargs)
+    db.session.add(m)
+    db.session.flush()
+    return m
+
+
+def _event(org: Member, datum: datetime, restaurant: str, **kwargs) -> Event:
+    ev = Event(
+        organisator_id=org.id,
+        datum=datum,
+        event_typ=EventType.MONATSESSEN,
+        season=datum.year,
+        restaurant=restaurant,
+        published=True,
+        **kwargs,
+    )
+    db.session.add(ev)
+    db.session.flush()
+    return ev
+
+
+def _attend(member: Member, ev: Event, share: int | None, esstyp: Esstyp | None = None) -> None:
+    db.session.add(
+        Participation(member_id=member.id, event_id=ev.id, teilnahme=True,
+                      calculated_share_rappen=share, esstyp=esstyp)
+    )
+
+
+@pytest.fixture
+def stats_data(app):
+    with app.app_context():
+        anna = _member("Anna")
+        ben = _member("Ben", beitritt=date(2025, 6, 1))
+        _member("Cleo", is_active=False)
+
+        ev1 = _event(anna, datetime(2025, 3, 14, 19), "Alpha", kueche="Thai",
+                     rechnungsbetrag_rappen=20000, trinkgeld_rappen=1000)
+        _attend(anna, ev1, 6000, Esstyp.ALLIN)
+        ev2 = _event(ben, datetime(2025, 9, 12, 19), "Beta", kueche="Thai")
+        _attend(anna, ev2, 4000, Esstyp.NORMAL)
+        _attend(ben, ev2, 5000, Esstyp.SPARSAM)
+        db.session.add(EventRating(event_id=ev2.id, participant_id=anna.id,
+                                   food_rating=5, drinks_rating=4, service_rating=3))
+        ev3 = _event(anna, datetime(2026, 2, 13, 19), "Alpha", kueche="Ital")
+        db.session.add(Participation(member_id=ben.id, event_id=ev3.id, teilnahme=False))
+        _event(anna, datetime(2026, 11, 13, 19), "Zukunft")
+        db.session.commit()
+        yield {"anna": anna.id, "ben": ben.id}
+
+
+def test_statistics_all_seasons(app, stats_data):
+    with app.app_context():
+        stats = get_monatsessen_statistics(
+            now=NOW, season_year=None, organizer_id=None, current_member_id=stats_data["anna"],
+        )
+
+    assert stats["count_past_monatsessen"] == 3
+    assert stats["count_billbro_monatsessen"] == 2
+    # ev1: Anna 1/1, ev2: 2/2, ev3: 0/2 → Ø 66.7 %
+    assert stats["avg_ms_participation_pct"] == 67
+    assert stats["avg_share_chf"] == 50
+    assert stats["user_confirmed"] == 2
+    assert stats["user_eligible_count"] == 3
+    assert stats["user_esstyp_allin"] == 1
+    assert stats["user_esstyp_normal"] == 1
+    assert stats["top_kueche"] == "Thai"
+    assert stats["record_expensive"]["restaurant"] == "Alpha"
+    assert stats["record_max_tip"] == {"chf": 10.0, "restaurant": "Alpha", "overall_avg": None}
+    charts = stats["charts_json"]
+    assert charts["memberParticipation"]["values"] == [66.7, 50.0]
+    assert charts["restaurantRatings"][0]["restaurant"] == "Beta"
+    assert charts["kitchens"] == {"labels": ["Thai", "Ital"], "values": [2, 1]}
+
+
+def test_statistics_filters_use_snapshot(app, stats_data):
+    with app.app_context():
+        get_monatsessen_statistics(now=NOW, season_year=None, organizer_id=None,
+                                   current_member_id=stats_data["anna"])
+        with count_queries() as statements:
+            season = get_monatsessen_statistics(
+                now=NOW, season_year=2025, organizer_id=None, current_member_id=stats_data["ben"],
+            )
+            by_org = get_monatsessen_statistics(
+                now=NOW, season_year=None, organizer_id=stats_data["ben"],
+                current_member_id=stats_data["anna"],
+            )
+            empty = get_monatsessen_statistics(
+                now=NOW, season_year=2024, organizer_id=None, current_member_id=stats_data["anna"],
+            )
+
+    # Nur die Fingerprint-Query pro Aufruf
+    assert len(statements) == 3
+    assert season["count_past_monatsessen"] == 2
+    assert season["user_eligible_count"] == 1  # Ben ist erst ab Juni 2025 dabei
+    assert season["user_esstyp_sparsam"] == 1
+    assert by_org["count_past_monatsessen"] == 1
+    assert by_org["avg_share_chf"] == 45
+    assert empty is None
+
+
+def test_snapshot_rebuilds_after_rating_change(app, stats_data):
+    with app.app_context():
+        before = get_monatsessen_statistics(now=NOW, season_year=None, organizer_id=None,
+                                            current_member_id=stats_data["anna"])
+        assert before["record_best_rated"] is None
+
+        ev3 = Event.query.filter_by(season=2026, restaurant="Alpha").one()
+        db.session.add(EventRating(event_id=ev3.id, participant_id=stats_data["anna"],
+                                   food_rating=2, drinks_rating=2, service_rating=2))
+        db.session.commit()
+
+        after = get_monatsessen_statistics(now=NOW, season_year=None, organizer_id=None,
+                                           current_member_id=stats_data["anna"])
+
+    assert after["record_best_rated"] == {"restaurant": "Beta", "overall_avg": 4.0}
+    assert after["record_worst_rated"] == {"restaurant": "Alpha", "overall_avg": 2.0}
+
+
+def test_public_hitlist_served_from_index(app, stats_data):
+    with app.app_context():
+        rows, total, pages, page, baseline = get_landing_restaurant_table(NOW, per_page=1)
+        assert [r["restaurant"] for r in rows] == ["Beta"]
+        assert (total, pages, page, baseline) == (2, 2, 1, 2)
+
+        with count_queries() as statements:
+            rows, total, _, _, baseline = get_landing_restaurant_table(NOW, query="alp", sort="name")
+        assert statements == []
+        assert [r["restaurant"] for r in rows] == ["Alpha"]
+        assert "_latest_datum" not in rows[0]
+        assert (total, baseline) == (1, 2)
+
+
+class _JoinedThread(threading.Thread):
+    """Echter Hintergrund-Thread, auf den start() wartet (deterministisch im Test)."""
+
+    def start(self):
+        super().start()
+        self.join()
+
+
+def test_public_hitlist_stale_while_revalidate(app, stats_data, monkeypatch):
+    monkeypatch.setattr(monatsessen_stats.threading, "Thread", _JoinedThread)
+    with app.app_context():
+        get_public_hitlist_index(NOW)
+        anna = db.session.get(Member, stats_data["anna"])
+        _event(anna, datetime(2026, 3, 13, 19), "Gamma")
+        db.session.commit()
+
+        app.config["PUBLIC_HITLIST_FRESH_SECONDS"] = 0
+        stale = get_public_hitlist_index(NOW)
+        assert "Gamma" not in {r["restaurant"] for r in stale["rows"]}
+
+        # Neuaufbau lief im Hintergrund-Thread – der nächste Aufruf sieht ihn.
+        app.config["PUBLIC_HITLIST_FRESH_SECONDS"] = 300
+        fresh = get_public_hitlist_index(NOW)
+        assert "Gamma" in {r["restaurant"] for r in fresh["rows"]}
+
+        # Zu alt für stale-while-revalidate: synchron neu bauen
+        app.config["PUBLIC_HITLIST_FRESH_SECONDS"] = 0
+        app.config["PUBLIC_HITLIST_MAX_STALE_SECONDS"] = 0
+        assert get_public_hitlist_index(NOW) is not fresh
+
+
+def test_restaurants_page_renders_search(client, app, stats_data):
+    resp = client.get("/restaurants?q=beta")
+    assert resp.status_code == 200
+    assert b"Beta" in resp.data
+
+
+def test_restaurant_label_index_groups_in_one_pass():
+    def ev(eid, day, restaurant=None, place_name=None, **kwargs):
+        e = Event(datum=datetime(2025, 1, day, 19), restaurant=restaurant, place_name=place_name, **kwargs)
+        e.id = eid
+        return e
+
+    events = [
+        ev(1, 1, "Alpha", website="https://alt.example", kueche="Thai"),
+        ev(2, 5, "Alpha", kueche=" ", place_address="Gasse 1"),
+        ev(3, 5, "Alpha", website="https://tie.example", kueche="Ital"),
+        ev(4, 3, place_name="Beta Ort", place_website="https://beta.example"),
+        ev(5, 4, "  "),
+    ]
+    index = RestaurantLabelIndex(events)
+
+    assert index.sorted_labels() == ["Alpha", "Beta Ort", "—"]
+    assert index.label_by_event_id[4] == "Beta Ort"
+    alpha = index.groups["Alpha"]
+    # Gleiches Datum: erstes Event der Eingabe gilt als neuestes
+    assert [e.id for e in alpha.events] == [2, 3, 1]
+    assert alpha.latest.id == 2
+    assert alpha.homepage == "https://tie.example"
+    assert (alpha.kueche, alpha.adresse) == (None, "Gasse 1")
+    assert index.groups["Beta Ort"].homepage == "https://beta.example"
@@ -0,0 +1,362 @@
+"""Tests fuer den Versand-Pfad von PushNotificationService (ohne echten Push-Service)."""
+
+import base64
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event as sa_event
+
+from backend.extensions import db
+from backend.models.event import Event, EventType
+from backend.models.member import Member
+from backend.models.participation import Participation
+from backend.models.push_subscription import PushSubscription
+from backend.models.rating import EventRating
+from backend.services import push_fanout, push_notifications, vapid_service
+from backend.models.push_delivery_stat import PushDeliveryStat
+from backend.models.push_outbox import PushOutboxMessage, PushOutboxStatus
+from backend.services.push_metrics import PushMetrics, percentile
+from backend.services.push_notifications import PushNotificationService
+from backend.services.push_outbox import PushOutboxService
+from backend.services.vapid_service import VAPIDService
+
+
+def _subscription(endpoint: str) -> dict:
+    return {"endpoint": endpoint, "keys": {"p256dh": "p256dh", "auth": "auth"}}
+
+
+def _jwt_claims(authorization: str) -> dict:
+    token = authorization.split("t=", 1)[1].split(",", 1)[0]
+    claims = token.split(".")[1]
+    return json.loads(base64.urlsafe_b64decode(claims + "=" * (-len(claims) % 4)))
+
+
+@pytest.fixture
+def vapid_keys(monkeypatch):
+    keys = VAPIDService.generate_vapid_keys()
+    monkeypatch.setenv("VAPID_PRIVATE_KEY", keys["private_key"])
+    VAPIDService.reset_signer()
+    yield keys
+    VAPIDService.reset_signer()
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    calls = []
+    monkeypatch.setattr(push_notifications, "webpush", lambda **kwargs: calls.append(kwargs))
+    return calls
+
+
+def test_signer_loaded_once_and_headers_cached_per_audience(vapid_keys, sent, monkeypatch) -> None:
+    key_loads = []
+    original = VAPIDService.get_vapid_private_key
+    monkeypatch.setattr(
+        VAPIDService, "get_vapid_private_key", staticmethod(lambda: key_loads.append(1) or original())
+    )
+    endpoints = [
+        "https://fcm.googleapis.com/fcm/send/a",
+        "https://fcm.googleapis.com/fcm/send/b",
+        "https://updates.push.services.mozilla.com/wpush/v2/c",
+        "https://web.push.apple.com/d",
+    ]
+    for endpoint in endpoints:
+        assert PushNotificationService.send_push_notification(_subscription(endpoint), {"title": "x"})
+
+    assert len(key_loads) == 1
+    auth = [call["headers"]["Authorization"] for call in sent]
+    assert auth[0] == auth[1]
+    assert len(set(auth)) == 3
+    assert [_jwt_claims(a)["aud"] for a in auth[1:]] == [
+        "https://fcm.googleapis.com",
+        "https://updates.push.services.mozilla.com",
+        "https://web.push.apple.com",
+    ]
+    assert "vapid_private_key" not in sent[0]
+
+
+def test_cached_header_renewed_shortly_before_expiry(vapid_keys, monkeypatch) -> None:
+    now = [1_000_000]
+    monkeypatch.setattr(vapid_service.time, "time", lambda: now[0])
+    signer = VAPIDService.get_signer()
+
+    first = signer.headers_for("https://fcm.googleapis.com")
+    assert _jwt_claims(first["Authorization"])["exp"] == now[0] + signer.lifetime_seconds
+
+    now[0] += signer.lifetime_seconds - signer.renew_margin_seconds - 1
+    assert signer.headers_for("https://fcm.googleapis.com") == first
+
+    now[0] += 2
+    renewed = signer.headers_for("https://fcm.googleapis.com")
+    assert renewed != first
+    assert _jwt_claims(renewed["Authorization"])["exp"] == now[0] + signer.lifetime_seconds
+
+
+class _Response:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+    def json(self):
+        return {}
+
+
+def _seed_reminder_audience(device_endpoints: list[str]) -> int:
+    """Event in einer Woche plus ein Mitglied pro Geraet, niemand hat geantwortet."""
+    members = []
+    for i, _endpoint in enumerate(device_endpoints):
+        members.append(Member(vorname=f"M{i}", nachname="Push", email=f"push-{i}@example.test", passwort_hash="x"))
+    db.session.add_all(members)
+    db.session.flush()
+    db.session.add_all(
+        PushSubscription(member_id=m.id, endpoint=endpoint, p256dh_key="p256dh", auth_key="auth")
+        for m, endpoint in zip(members, device_endpoints)
+    )
+    event = Event(
+        organisator_id=members[0].id,
+        datum=datetime.utcnow() + timedelta(days=7),
+        event_typ=EventType.MONATSESSEN,
+        season=2026,
+        restaurant="Cafe Fanout",
+    )
+    db.session.add(event)
+    db.session.commit()
+    return event.id
+
+
+def test_reminder_fan_out_is_concurrent_and_pools_per_origin(app, vapid_keys, monkeypatch) -> None:
+    endpoints = (
+        [f"https://fcm.googleapis.com/fcm/send/{i}" for i in range(12)]
+        + [f"https://updates.push.services.mozilla.com/wpush/v2/{i}" for i in range(6)]
+        + ["https://web.push.apple.com/gone"]
+    )
+    calls = []
+    lock = threading.Lock()
+
+    def fake_webpush(subscription_info, requests_session=None, **_kwargs):
+        time.sleep(0.05)
+        with lock:
+            calls.append((subscription_info["endpoint"], requests_session, threading.get_ident()))
+        if subscription_info["endpoint"].endswith("/gone"):
+            raise push_notifications.WebPushException("gone", response=_Response(410))
+        return _Response(201)
+
+    monkeypatch.setattr(push_notifications, "webpush", fake_webpush)
+    push_fanout.close_sessions()
+    with app.app_context():
+        event_id = _seed_reminder_audience(endpoints)
+        result = PushNotificationService.send_participation_reminder_to_members(event_id)
+        assert result["queued_count"] == 19 and calls == []
+
+        started = time.perf_counter()
+        delivery = PushOutboxService.drain()
+        elapsed = time.perf_counter() - started
+
+        assert (delivery["sent"], delivery["expired"]) == (18, 1)
+        # 19 x 50 ms seriell ≈ 1 s; parallel nur wenige Runden
+        assert elapsed < 0.5
+        assert len({thread for _e, _s, thread in calls}) > 1
+        sessions = {push_fanout.origin_of(e): s for e, s, _t in calls}
+        assert len(set(map(id, sessions.values()))) == 3
+        assert all(s is sessions[push_fanout.origin_of(e)] for e, s, _t in calls)
+
+        gone = PushSubscription.query.filter(PushSubscription.endpoint.like("%/gone")).one()
+        assert gone.is_active is False
+        assert PushSubscription.query.filter(PushSubscription.last_used_at.isnot(None)).count() == 18
+    push_fanout.close_sessions()
+
+
+def test_outbox_retries_transient_failures_with_backoff(app, vapid_keys, monkeypatch) -> None:
+    statuses = {"flaky": [503, 201], "broken": [400], "down": [503] * 10}
+
+    def fake_webpush(subscription_info, **_kwargs):
+        status = statuses[subscription_info["endpoint"].rsplit("/", 1)[1]].pop(0)
+        if status > 202:
+            raise push_notifications.WebPushException("nope", response=_Response(status))
+        return _Response(status)
+
+    monkeypatch.setattr(push_notifications, "webpush", fake_webpush)
+    app.config["PUSH_OUTBOX_MAX_ATTEMPTS"] = 2
+    with app.app_context():
+        _seed_reminder_audience([f"https://push.example.test/{name}" for name in statuses])
+        PushOutboxService.enqueue(PushSubscription.query.all(), {"title": "x", "data": {"type": "test"}})
+
+        assert PushOutboxService.drain() == {"claimed": 3, "sent": 0, "retry": 2, "expired": 0, "failed": 1}
+        # Backoff: vor Ablauf ist nichts faellig
+        assert PushOutboxService.drain()["claimed"] == 0
+
+        PushOutboxMessage.query.update({"next_attempt_at": datetime.utcnow() - timedelta(seconds=1)})
+        db.session.commit()
+        assert PushOutboxService.drain() == {"claimed": 2, "sent": 1, "retry": 0, "expired": 0, "failed": 1}
+
+        by_endpoint = {m.subscription.endpoint.rsplit("/", 1)[1]: m for m in PushOutboxMessage.query}
+        assert by_endpoint["flaky"].status == PushOutboxStatus.SENT
+        assert (by_endpoint["down"].status, by_endpoint["down"].attempts) == (PushOutboxStatus.FAILED, 2)
+        assert by_endpoint["broken"].last_status_code == 400
+        assert by_endpoint["flaky"].kind == "test"
+
+
+def test_inprocess_worker_starts_on_first_request(app, client, monkeypatch) -> None:
+    started = []
+    monkeypatch.setattr(PushOutboxService, "start_worker_thread", staticmethod(started.append))
+
+    assert client.get("/health").status_code == 200
+    assert started == []
+
+    # Nach Deploy/Restart: ohne neues Einreihen stellt der Worker liegengebliebene Zeilen zu
+    app.config["PUSH_OUTBOX_INPROCESS_WORKER"] = True
+    assert client.get("/health").status_code == 200
+    assert started == [app]
+
+
+def _seed_participants(count: int, datum: datetime, tag: str) -> tuple[int, list[int]]:
+    """Event mit `count` zusagenden Mitgliedern, je ein Geraet."""
+    members = [
+        Member(vorname=f"{tag}{i}", nachname="Bulk", email=f"{tag}-{i}@example.test", passwort_hash="x")
+        for i in range(count)
+    ]
+    db.session.add_all(members)
+    db.session.flush()
+    event = Event(organisator_id=members[0].id, datum=datum, event_typ=EventType.MONATSESSEN, season=2026)
+    db.session.add(event)
+    db.session.flush()
+    db.session.add_all(
+        PushSubscription(member_id=m.id, endpoint=f"https://fcm.googleapis.com/fcm/send/{tag}-{m.id}",
+                         p256dh_key="p256dh", auth_key="auth")
+        for m in members
+    )
+    db.session.add_all(Participation(member_id=m.id, event_id=event.id, teilnahme=True) for m in members)
+    db.session.commit()
+    return event.id, [m.id for m in members]
+
+
+def test_reminder_runs_use_constant_db_round_trips(app, vapid_keys, monkeypatch) -> None:
+    monkeypatch.setattr(push_notifications, "webpush", lambda **_kwargs: _Response(201))
+    statements = []
+    listener = lambda *args: statements.append(1)  # noqa: E731
+    week_ahead = datetime.utcnow() + timedelta(days=3)
+    yesterday = datetime.utcnow() - timedelta(days=1)
+    # Metriken bei jedem Lauf schreiben, sonst haengt die Statement-Zahl vom Intervall ab
+    app.config["PUSH_METRICS_FLUSH_SECONDS"] = 0
+    PushMetrics.reset()
+
+    def run(send, event_id) -> tuple[dict, int]:
+        statements.clear()
+        sa_event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            result = send(event_id)
+            PushOutboxService.drain()
+        finally:
+            sa_event.remove(db.engine, "before_cursor_execute", listener)
+        return result, len(statements)
+
+    with app.app_context():
+        small_week, _ = _seed_participants(2, week_ahead, "ws")
+        large_week, _ = _seed_participants(8, week_ahead, "wl")
+        small_rating, _ = _seed_participants(2, yesterday, "rs")
+        large_rating, rated = _seed_participants(8, yesterday, "rl")
+        db.session.add(EventRating(event_id=large_rating, participant_id=rated[0],
+                                   food_rating=5, drinks_rating=5, service_rating=5))
+        db.session.commit()
+
+        week = PushNotificationService.send_event_week_reminder_to_participants
+        rating = PushNotificationService.send_rating_reminder_to_participants
+        small_result, small_statements = run(week, small_week)
+        large_result, large_statements = run(week, large_week)
+        assert (small_result["queued_count"], large_result["queued_count"]) == (2, 8)
+        assert small_statements == large_statements
+
+        small_result, small_statements = run(rating, small_rating)
+        large_result, large_statements = run(rating, large_rating)
+        assert (small_result["queued_count"], large_result["queued_count"]) == (2, 7)
+        assert small_statements == large_statements
+
+        assert PushSubscription.query.filter(PushSubscription.last_used_at.isnot(None)).count() == 19
+
+
+def test_percentile_interpolates_within_histogram_buckets() -> None:
+    # 10 Sends bis 25 ms, 10 bis 50 ms, 1 Ueberlauf
+    buckets = [10, 10, 0, 0, 0, 0, 0, 0, 0, 0, 1]
+    assert percentile(buckets, 0.5) == pytest.approx(25 + 25 * 0.5 / 10, abs=0.1)
+    assert percentile(buckets, 0.95) == pytest.approx(25 + 25 * 9.95 / 10, abs=0.1)
+    assert percentile(buckets, 1.0) == 12800.0
+    assert percentile([0] * 11, 0.5) is None
+
+
+def test_delivery_metrics_and_failing_endpoints_deactivated(app, client, vapid_keys, monkeypatch) -> None:
+    latencies = {"fcm.googleapis.com": 0.03, "push.example.test": 0.0}
+
+    def fake_webpush(subscription_info, **_kwargs):
+        endpoint = subscription_info["endpoint"]
+        time.sleep(latencies[push_fanout.origin_of(endpoint).removeprefix("https://")])
+        if endpoint.endswith("/broken"):
+            raise push_notifications.WebPushException("bad", response=_Response(400))
+        return _Response(201)
+
+    monkeypatch.setattr(push_notifications, "webpush", fake_webpush)
+    app.config.update(PUSH_MAX_CONSECUTIVE_FAILURES=2, PUSH_METRICS_FLUSH_SECONDS=3600,
+                      CRON_AUTH_TOKEN="metrics-token")
+    PushMetrics.reset()
+    with app.app_context():
+        _seed_reminder_audience(["https://fcm.googleapis.com/fcm/send/ok", "https://push.example.test/broken"])
+        payload = {"title": "x", "data": {"type": "test"}}
+
+        PushOutboxService.enqueue(PushSubscription.query.all(), payload)
+        assert PushOutboxService.drain()["failed"] == 1
+        broken = PushSubscription.query.filter(PushSubscription.endpoint.like("%/broken")).one()
+        assert (broken.is_active, broken.consecutive_failures) == (True, 1)
+        # Noch nichts geschrieben (Intervall), Auswertung sieht die Werte trotzdem
+        assert PushDeliveryStat.query.count() == 0
+        assert PushMetrics.summary()["https://push.example.test"]["errors"] == 1
+
+        PushMetrics.flush()
+        PushOutboxService.enqueue(PushSubscription.query.all(), payload)
+        PushOutboxService.drain()
+        db.session.refresh(broken)
+        assert (broken.is_active, broken.consecutive_failures) == (False, 2)
+        ok = PushSubscription.query.filter(PushSubscription.endpoint.like("%/ok")).one()
+        assert (ok.is_active, ok.consecutive_failures) == (True, 0)
+
+        # Deaktivierte Endpoints bekommen nichts mehr
+        assert PushOutboxService.enqueue(PushNotificationService._active_subscriptions(), payload) == 1
+        PushMetrics.flush()
+        assert PushDeliveryStat.query.count() == 4
+
+    assert client.get("/cron/push-metrics").status_code == 401
+    response = client.get("/cron/push-metrics", headers={"X-Cron-Auth": "metrics-token"})
+    assert response.status_code == 200
+    data = response.get_json()
+    fcm = data["origins"]["https://fcm.googleapis.com"]
+    broken_origin = data["origins"]["https://push.example.test"]
+    assert (fcm["sends"], fcm["errors"], fcm["error_rate"]) == (2, 0, 0.0)
+    assert 25 <= fcm["latency_p50_ms"] <= fcm["latency_p95_ms"] <= 100
+    assert (broken_origin["sends"], broken_origin["error_rate"]) == (2, 1.0)
+    assert broken_origin["status_counts"] == {"400": 2}
+    assert data["subscriptions"]["active"] == 1
+    PushMetrics.reset()
+
+
+def test_sync_delivery_counts_only_final_failures(app, vapid_keys, monkeypatch) -> None:
+    statuses = {"down": 503, "slow": 429, "offline": None, "missing": 404, "broken": 400}
+
+    def fake_webpush(subscription_info, **_kwargs):
+        status = statuses[subscription_info["endpoint"].rsplit("/", 1)[1]]
+        if status is None:
+            raise ConnectionError("offline")
+        raise push_notifications.WebPushException("nope", response=_Response(status))
+
+    monkeypatch.setattr(push_notifications, "webpush", fake_webpush)
+    app.config["PUSH_MAX_CONSECUTIVE_FAILURES"] = 1
+    with app.app_context():
+        _seed_reminder_audience([f"https://push.example.test/{name}" for name in statuses])
+        result = PushNotificationService._deliver_to_subscriptions(PushSubscription.query.all(), {"title": "x"})
+
+        by_endpoint = {s.endpoint.rsplit("/", 1)[1]: s for s in PushSubscription.query}
+        # 404 gilt als abgelaufen, 400 als endgültiger Fehler; transiente Fehler zählen nicht
+        assert result["deactivated"] == 2
+        assert {name for name, s in by_endpoint.items() if not s.is_active} == {"missing", "broken"}
+        assert {name: s.consecutive_failures for name, s in by_endpoint.items()} == {
+            "down": 0, "slow": 0, "offline": 0, "missing": 0, "broken": 1,
+        }
+
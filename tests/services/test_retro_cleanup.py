@@ -0,0 +1,166 @@
+"""Tests für RetroCleanupService – Fortschritt aus einer Query, Cache pro Mitglied."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+import backend.models  # noqa: F401
+from backend.extensions import db
+from backend.models.event import Event, EventType
+from backend.models.member import Member
+from backend.models.participation import Participation
+from backend.models.rating import EventRating
+from backend.services.retro_cleanup import RetroCleanupService
+from tests.conftest import count_queries
+
+
+def _event(org: Member, days_ago: int, **kwargs) -> Event:
+    ev = Event(
+        organisator_id=org.id,
+        datum=datetime.utcnow() - timedelta(days=days_ago),
+        event_typ=EventType.MONATSESSEN,
+        season=datetime.utcnow().year,
+        restaurant=kwargs.pop("restaurant", f"Lokal -{days_ago}"),
+        published=kwargs.pop("published", True),
+        **kwargs,
+    )
+    db.session.add(ev)
+    db.session.flush()
+    return ev
+
+
+def _respond(member: Member, ev: Event, teilnahme: bool) -> None:
+    db.session.add(
+        Participation(
+            member_id=member.id,
+            event_id=ev.id,
+            teilnahme=teilnahme,
+            responded_at=datetime.utcnow(),
+        )
+    )
+
+
+def _rate(member: Member, ev: Event) -> None:
+    db.session.add(
+        EventRating(
+            event_id=ev.id,
+            participant_id=member.id,
+            food_rating=4,
+            drinks_rating=4,
+            service_rating=4,
+        )
+    )
+
+
+@pytest.fixture
+def cleanup_member(app):
+    """Mitglied mit vergangenen Events in allen Bereinigungszuständen."""
+    with app.app_context():
+        member = Member(
+            vorname="Rita",
+            nachname="Retro",
+            email="rita-retro@example.test",
+            passwort_hash=generate_password_hash("TestPasswortMind12"),
+            beitritt=date.today() - timedelta(days=400),
+        )
+        db.session.add(member)
+        db.session.flush()
+
+        _event(member, 10, restaurant="Offen ohne Antwort")
+        _respond(member, _event(member, 20, restaurant="Zusage ohne Bewertung"), True)
+        done = _event(member, 30, restaurant="Zusage bewertet")
+        _respond(member, done, True)
+        _rate(member, done)
+        _respond(member, _event(member, 40, restaurant="Absage"), False)
+        _respond(member, _event(member, 50, restaurant="Ohne Bewertungen", allow_ratings=False), True)
+        _event(member, 60, restaurant="Nicht veröffentlicht", published=False)
+        _event(member, 800, restaurant="Vor Beitritt")
+        _event(member, -5, restaurant="Zukunft")
+        db.session.commit()
+        yield member.id
+
+
+def test_progress_and_open_events(app, cleanup_member):
+    with app.app_context():
+        progress = RetroCleanupService.get_progress(cleanup_member)
+        open_events = RetroCleanupService.list_open_cleanup_events(cleanup_member)
+
+    assert progress == {"total": 5, "completed": 3, "pending": 2}
+    assert [ev.restaurant for ev in open_events] == ["Offen ohne Antwort", "Zusage ohne Bewertung"]
+
+
+def test_progress_query_count_independent_of_history(app, cleanup_member):
+    with app.app_context():
+        with count_queries() as before:
+            RetroCleanupService._compute_progress(cleanup_member)
+
+        member = db.session.get(Member, cleanup_member)
+        for days_ago in range(70, 130, 5):
+            _respond(member, _event(member, days_ago), True)
+        db.session.commit()
+
+        with count_queries() as after:
+            progress = RetroCleanupService._compute_progress(cleanup_member)
+
+    assert progress["total"] == 17
+    assert len(after) == len(before) <= 2
+
+
+def test_progress_cached_until_invalidated(app, cleanup_member):
+    with app.app_context():
+        RetroCleanupService.get_progress(cleanup_member)
+        with count_queries() as statements:
+            cached = RetroCleanupService.get_progress(cleanup_member)
+        assert statements == []
+
+        ev = Event.query.filter_by(restaurant="Zusage ohne Bewertung").one()
+        _rate(db.session.get(Member, cleanup_member), ev)
+        db.session.commit()
+        assert RetroCleanupService.get_progress(cleanup_member) == cached
+
+        RetroCleanupService.invalidate_member(cleanup_member)
+        assert RetroCleanupService.get_progress(cleanup_member)["pending"] == 1
+
+
+def test_rating_and_rsvp_routes_invalidate_progress(app, logged_in_client):
+    with app.app_context():
+        member = Member.query.filter_by(email="docs-smoke@example.test").one()
+        member_id = member.id
+        ev = _event(member, 3, restaurant="Route")
+        _respond(member, ev, True)
+        _rate(member, ev)
+        db.session.commit()
+        event_id = ev.id
+
+    assert logged_in_client.get("/events/cleanup").status_code == 200
+    with app.app_context():
+        pending = RetroCleanupService.get_progress(member_id)["pending"]
+
+    resp = logged_in_client.post(f"/ratings/event/{event_id}/rating/delete")
+    assert resp.status_code == 302
+    with app.app_context():
+        assert RetroCleanupService.get_progress(member_id)["pending"] == pending + 1
+
+    resp = logged_in_client.post(f"/events/{event_id}/cleanup/rsvp", data={"status": "no"})
+    assert resp.status_code == 302
+    with app.app_context():
+        assert RetroCleanupService.get_progress(member_id)["pending"] == pending
+
+
+def test_upcoming_rsvp_prompt_skips_answered_events(app, cleanup_member):
+    with app.app_context():
+        member = db.session.get(Member, cleanup_member)
+        answered = _event(member, -2, restaurant="Beantwortet")
+        _respond(member, answered, True)
+        db.session.commit()
+
+        prompt = RetroCleanupService.get_upcoming_rsvp_prompt_event(cleanup_member)
+        assert prompt.restaurant == "Zukunft"
+
+        db.session.add(Participation(member_id=member.id, event_id=prompt.id, teilnahme=False))
+        db.session.commit()
+        # Zeile ohne responded_at gilt weiterhin als offen
+        assert RetroCleanupService.get_upcoming_rsvp_prompt_event(cleanup_member).id == prompt.id